@@ -1,39 +1,54 @@
 """ ReoLink REST API """
 
-from . import (
-    ai,
-    alarm,
-    encoding,
-    connection,
-    led,
-    ptz,
-    network,
-    system,
-    record,
-    security,
-    video,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Final
 
 from .__version__ import __version__
+from .batching import BatchLimits
+
+if TYPE_CHECKING:
+    from .builder import build_client, client_type
+    from .client import Client
+
+# imported on first access so importing the package stays cheap
+_LAZY_ATTRIBUTES: Final = {
+    "Client": ".client",
+    "build_client": ".builder",
+    "client_type": ".builder",
+}
+_SUBMODULES: Final = frozenset(
+    (
+        "ai",
+        "alarm",
+        "builder",
+        "client",
+        "connection",
+        "encoding",
+        "fleet",
+        "led",
+        "network",
+        "ptz",
+        "record",
+        "security",
+        "system",
+        "video",
+    )
+)
+
+
+def __getattr__(name: str):
+    if (module := _LAZY_ATTRIBUTES.get(name, None)) is not None:
+        value = getattr(import_module(module, __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
-class Client(
-    connection.Connection,
-    security.Security,
-    system.System,
-    network.Network,
-    video.Video,
-    encoding.Encoding,
-    record.Record,
-    alarm.Alarm,
-    ai.AI,
-    led.LED,
-    ptz.PTZ,
-):
-    """Rest API Client"""
-
-    def __init__(self, session_factory: connection.SessionFactory = None) -> None:
-        super().__init__(session_factory=session_factory)
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_SUBMODULES})
 
 
 # __all__ = ["Client", "__version__"]
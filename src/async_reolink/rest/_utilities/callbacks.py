@@ -0,0 +1,67 @@
+"""Callback List"""
+
+import inspect
+from typing import Callable, Coroutine, Iterable, MutableSequence, overload
+
+Callback = Callable[..., Coroutine[any, any, None] | None]
+
+
+class CallbackList(MutableSequence[Callback]):
+    """list of callbacks classified as sync or async when added"""
+
+    __slots__ = ("_callbacks", "_coroutine")
+
+    def __init__(self, callbacks: Iterable[Callback] = ()) -> None:
+        self._callbacks: list[Callback] = []
+        # classification is kept next to each entry so call order is preserved
+        self._coroutine: list[bool] = []
+        self.extend(callbacks)
+
+    @overload
+    def __getitem__(self, __i: int) -> Callback:
+        ...
+
+    @overload
+    def __getitem__(self, __s: slice) -> list[Callback]:
+        ...
+
+    def __getitem__(self, __i):
+        return self._callbacks[__i]
+
+    def __setitem__(self, __i: int, __v: Callback):
+        if isinstance(__i, slice):
+            __v = list(__v)
+            self._coroutine[__i] = map(inspect.iscoroutinefunction, __v)
+        else:
+            self._coroutine[__i] = inspect.iscoroutinefunction(__v)
+        self._callbacks[__i] = __v
+
+    def __delitem__(self, __i: int):
+        del self._callbacks[__i]
+        del self._coroutine[__i]
+
+    def __len__(self):
+        return len(self._callbacks)
+
+    def __iter__(self):
+        return iter(self._callbacks)
+
+    def insert(self, index: int, value: Callback):
+        self._callbacks.insert(index, value)
+        self._coroutine.insert(index, inspect.iscoroutinefunction(value))
+
+    def clear(self):
+        self._callbacks.clear()
+        self._coroutine.clear()
+
+    async def invoke(self, *args):
+        """call every callback, awaiting the async ones"""
+
+        for callback, coroutine in zip(self._callbacks, self._coroutine):
+            if coroutine:
+                await callback(*args)
+            else:
+                callback(*args)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {repr(self._callbacks)}>"
@@ -0,0 +1,75 @@
+"""Per Channel Gather"""
+
+from typing import Callable, Iterable, TypeVar
+
+from async_reolink.api import network
+from async_reolink.api.commands import CommandRequest, CommandResponse
+from async_reolink.api.connection import Connection
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+
+_R = TypeVar("_R", bound=CommandResponse)
+_T = TypeVar("_T")
+
+
+async def online_channels(client: any) -> list[int]:
+    """ids of online channels, single channel devices report channel 0"""
+
+    if not isinstance(client, network.Network):
+        return [0]
+    try:
+        statuses = await client.get_channel_status()
+    except ReolinkResponseError as error:
+        # only devices without channel statuses fall back to channel 0
+        if error.code != ErrorCodes.NOT_SUPPORTED:
+            raise
+        return [0]
+    return [_c for _c in statuses if statuses[_c].online]
+
+
+async def gather_channels(
+    client: any,
+    channels: Iterable[int] | None,
+    create_request: Callable[[int], CommandRequest],
+    response_type: type[_R],
+    getter: Callable[[_R], _T],
+) -> dict[int, _T]:
+    """send one per channel request for every channel in a single batch
+
+    channels default to the online channels of the device, channels that
+    answer with an error are left out. responses are matched by the channel
+    they name, by position only when every request was answered
+    """
+
+    if not isinstance(client, Connection):
+        return {}
+    if channels is None:
+        # the rest network mixin may know the online channels already
+        if (get_online := getattr(client, "get_online_channels", None)) is not None:
+            channels = await get_online()
+        else:
+            channels = await online_channels(client)
+    channels = list(channels)
+    results: dict[int, _T] = {}
+    if not channels:
+        return results
+
+    requests = list(map(create_request, channels))
+    responses = [_r async for _r in client.batch(requests)]
+    # a short reply (device stopped at an error) may leave any sub batch
+    # incomplete, its positions do not line up with the channels
+    in_order = len(responses) == len(requests)
+    liveness = getattr(client, "channel_liveness", None)
+    for index, response in enumerate(responses):
+        channel = getattr(response, "channel_id", None)
+        if channel is None:
+            if not in_order or response.command != requests[index].command:
+                continue
+            channel = channels[index]
+        elif channel not in channels or channel in results:
+            continue
+        success = isinstance(response, response_type)
+        if success:
+            results[channel] = getter(response)
+        if liveness is not None:
+            liveness.report(channel, success)
+    return results
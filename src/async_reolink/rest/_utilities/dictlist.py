@@ -68,3 +68,57 @@ class DictList(Mapping[_KT, _VT]):
         if (value := self._factory()) is None:
             return 0
         return len(value)
+
+
+class DictIndex(Mapping[_KT, _VT]):
+    """list of dictionaries indexed by key
+
+    the index is built once and items are created once per key, unlike
+    DictList it does not follow later changes of the list
+    """
+
+    __slots__ = ("_index", "_items", "_type")
+
+    def __init__(
+        self,
+        key: str,
+        value: list | None,
+        __type: Callable[[Callable[[], dict]], _VT],
+    ) -> None:
+        self._index: dict[_KT, dict] = {
+            __k: _d
+            for _d in value or ()
+            if isinstance(_d, dict) and (__k := _d.get(key, None)) is not None
+        }
+        self._items: dict[_KT, _VT] = {}
+        self._type = __type
+
+    def filter(self, predicate: Callable[[dict], bool]) -> "DictIndex[_KT, _VT]":
+        """index of the dictionaries matching predicate, sharing items"""
+
+        index = DictIndex.__new__(DictIndex)
+        index._index = {__k: _d for __k, _d in self._index.items() if predicate(_d)}
+        index._items = self._items
+        index._type = self._type
+        return index
+
+    def __getitem__(self, __k: _KT) -> _VT:
+        if (value := self._index.get(__k, None)) is None:
+            # like DictList a missing key gives an empty item
+            return self._type(lambda: None)
+        if (item := self._items.get(__k, None)) is None:
+
+            def _factory():
+                return value
+
+            item = self._items[__k] = self._type(_factory)
+        return item
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __contains__(self, __o: _KT):
+        return __o in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
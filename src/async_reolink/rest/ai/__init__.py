@@ -1,21 +1,22 @@
 """AI Mixin"""
 
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from async_reolink.api import ai
 from async_reolink.api.ai.typings import AITypes
 
-from ..commands import ai as commands
+from .._utilities.channels import gather_channels
+from ..commands import ai as commands, request_template
 
 
 class AI(ai.AI):
     """Rest AI Mixin"""
 
     def _create_get_ai_state_request(self, channel: int):
-        return commands.GetAiStateRequest(channel)
+        return request_template(commands.GetAiStateRequest, channel)
 
     def _create_get_ai_config_request(self, channel: int):
-        return commands.GetAiStateRequest(channel)
+        return commands.GetAiConfigRequest(channel)
 
     def _create_set_ai_config(
         self,
@@ -24,3 +25,14 @@ class AI(ai.AI):
         track: AITypes | set[AITypes] | Mapping[AITypes, bool] | None,
     ):
         return commands.SetAiConfigRequest(channel, detect, track)
+
+    async def get_ai_states(self, channels: Iterable[int] | None = None):
+        """Get AI State Info of several channels in one request"""
+
+        return await gather_channels(
+            self,
+            channels,
+            self._create_get_ai_state_request,
+            commands.GetAiStateResponse,
+            lambda response: response.state,
+        )
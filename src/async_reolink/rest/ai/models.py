@@ -105,6 +105,8 @@ class AITypesMap(Mapping[typings.AITypes, bool]):
 class MutableAITypesMap(AITypesMap, MutableMapping[typings.AITypes, bool]):
     """Mutable AI Types Map"""
 
+    __slots__ = ()
+
     def __setitem__(self, __k: typings.AITypes, __v: bool) -> None:
         if (_map := self._factory(True)) is None:
             raise KeyError()
@@ -208,6 +210,8 @@ class Config(typings.Config):
 class MutableConfig(Config):
     """Mutable AI Configuration"""
 
+    __slots__ = ()
+
     def __init__(self, factory: FactoryValue[dict]) -> None:
         super().__init__(factory)
         self._factory = factory
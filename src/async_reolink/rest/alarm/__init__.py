@@ -1,12 +1,26 @@
 """REST Alarm Mixin"""
 
+from typing import Iterable
+
 from async_reolink.api.alarm import Alarm as BaseAlarm
 
-from ..commands import alarm
+from .._utilities.channels import gather_channels
+from ..commands import alarm, request_template
 
 
 class Alarm(BaseAlarm):
     """REST Alarm Mixin"""
 
     def _create_get_md_state(self, channel: int):
-        return alarm.GetMotionStateRequest(channel)
+        return request_template(alarm.GetMotionStateRequest, channel)
+
+    async def get_md_states(self, channels: Iterable[int] | None = None):
+        """Get Motion Detection State of several channels in one request"""
+
+        return await gather_channels(
+            self,
+            channels,
+            self._create_get_md_state,
+            alarm.GetMotionStateResponse,
+            lambda response: response.state,
+        )
@@ -0,0 +1,155 @@
+"""Batch Limits"""
+
+from __future__ import annotations
+
+import json
+from os import PathLike
+from time import monotonic
+from typing import Final, Iterator, Mapping
+
+DEFAULT_BATCH_LIMIT: Final = 30
+MIN_BATCH_LIMIT: Final = 1
+DEFAULT_PIPELINE_DEPTH: Final = 2
+DEFAULT_FAILURE_THRESHOLD: Final = 2
+DEFAULT_PROBE_INTERVAL: Final = 3600.0
+
+BatchKey = tuple[str, str]
+"""(model, firmware)"""
+
+
+class BatchLimits(Mapping[BatchKey, int]):
+    """Learned maximum batch sizes per (model, firmware)
+
+    can be shared between connections and persisted as json. a limit is
+    lowered after failure_threshold failed batches in a row and probed back
+    up once probe_interval seconds passed without it being lowered
+    """
+
+    __slots__ = (
+        "_limits",
+        "_failures",
+        "_changed",
+        "default",
+        "failure_threshold",
+        "probe_interval",
+    )
+
+    def __init__(
+        self,
+        limits: Mapping[BatchKey, int] | None = None,
+        default: int = DEFAULT_BATCH_LIMIT,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+    ) -> None:
+        self._limits: dict[BatchKey, int] = dict(limits or {})
+        # (failures in a row, smallest failed size)
+        self._failures: dict[BatchKey, tuple[int, int]] = {}
+        # when a limit was last lowered or raised, loaded limits count from now
+        self._changed = dict.fromkeys(self._limits, monotonic())
+        self.default = default
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+
+    def __getitem__(self, __key: BatchKey):
+        return self._limits[__key]
+
+    def __iter__(self) -> Iterator[BatchKey]:
+        return iter(self._limits)
+
+    def __len__(self):
+        return len(self._limits)
+
+    def limit(self, key: BatchKey | None):
+        """maximum batch size for key"""
+
+        if key is None:
+            return self.default
+        return self._limits.get(key, self.default)
+
+    def record_failure(self, key: BatchKey, size: int):
+        """record that a batch of size was too large, returns the limit
+
+        the limit is lowered to half the smallest failed size once
+        failure_threshold batches failed in a row
+        """
+
+        count, smallest = self._failures.get(key, (0, size))
+        count, smallest = count + 1, min(smallest, size)
+        if count < self.failure_threshold:
+            self._failures[key] = (count, smallest)
+            return self.limit(key)
+        self._failures.pop(key, None)
+        limit = max(smallest // 2, MIN_BATCH_LIMIT)
+        if limit < self.limit(key):
+            self._limits[key] = limit
+            self._changed[key] = monotonic()
+        return self.limit(key)
+
+    def record_success(self, key: BatchKey, size: int):
+        """record that a batch of size succeeded, returns the limit
+
+        a full batch at a lowered limit doubles the limit again (up to the
+        default) once probe_interval passed since it was last changed
+        """
+
+        failure = self._failures.get(key, None)
+        if failure is not None and size >= failure[1]:
+            del self._failures[key]
+        if (limit := self._limits.get(key, None)) is None or size < limit:
+            return self.limit(key)
+        if monotonic() - self._changed.get(key, 0) < self.probe_interval:
+            return limit
+        if (limit := limit * 2) >= self.default:
+            del self._limits[key]
+            self._changed.pop(key, None)
+        else:
+            self._limits[key] = limit
+            self._changed[key] = monotonic()
+        return self.limit(key)
+
+    def detached(self):
+        """empty limits with the same settings, for a device that is not
+        identified yet"""
+
+        return self.__class__(
+            default=self.default,
+            failure_threshold=self.failure_threshold,
+            probe_interval=self.probe_interval,
+        )
+
+    def to_json(self):
+        """json serializable value"""
+
+        return [
+            {"model": _k[0], "firmware": _k[1], "limit": _v}
+            for _k, _v in self._limits.items()
+        ]
+
+    @classmethod
+    def from_json(cls, value: list[dict], default: int = DEFAULT_BATCH_LIMIT):
+        """create from json value"""
+
+        return cls(
+            {(_v["model"], _v["firmware"]): int(_v["limit"]) for _v in value},
+            default,
+        )
+
+    def save(self, path: str | PathLike):
+        """save limits to json file"""
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_json(), file, indent=2)
+
+    @classmethod
+    def load(cls, path: str | PathLike, default: int = DEFAULT_BATCH_LIMIT):
+        """load limits from json file, empty if missing"""
+
+        try:
+            with open(path, encoding="utf-8") as file:
+                return cls.from_json(json.load(file), default)
+        except FileNotFoundError:
+            return cls(default=default)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {repr(self._limits)}>"
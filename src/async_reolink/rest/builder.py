@@ -0,0 +1,75 @@
+"""REST Client Builder"""
+
+from importlib import import_module
+from types import MappingProxyType
+from typing import Final
+
+from .connection import Connection
+
+# feature: (module, mixin, required features), in Client base order
+_FEATURES: Final = MappingProxyType(
+    {
+        "security": ("security", "Security", ()),
+        "system": ("system", "System", ()),
+        "network": ("network", "Network", ()),
+        "video": ("video", "Video", ("network",)),
+        "encoding": ("encoding", "Encoding", ()),
+        "record": ("record", "Record", ()),
+        "alarm": ("alarm", "Alarm", ()),
+        "ai": ("ai", "AI", ()),
+        "led": ("led", "LED", ()),
+        "ptz": ("ptz", "PTZ", ()),
+    }
+)
+
+FEATURES: Final = tuple(_FEATURES)
+
+_client_types: dict[tuple[str, ...], type[Connection]] = {}
+
+
+def _resolve(features: tuple[str, ...]):
+    # security is always included, it provides login
+    pending = ["security", *features]
+    resolved: set[str] = set()
+    while pending:
+        if (name := pending.pop()) in resolved:
+            continue
+        if name not in _FEATURES:
+            raise ValueError(f"unknown client feature {name!r}")
+        resolved.add(name)
+        pending.extend(_FEATURES[name][2])
+    return tuple(_n for _n in _FEATURES if _n in resolved)
+
+
+def client_type(*features: str) -> type[Connection]:
+    """client class with only the mixins of features
+
+    classes are created once per feature set, so instances of the same
+    feature set share a class
+    """
+
+    key = _resolve(features)
+    if (cls := _client_types.get(key, None)) is None:
+        mixins = tuple(
+            getattr(
+                import_module(f".{_FEATURES[_n][0]}", __package__), _FEATURES[_n][1]
+            )
+            for _n in key
+        )
+        name = "".join(_m.__name__ for _m in mixins[1:]) + "Client"
+        cls = _client_types[key] = type(
+            name,
+            (Connection, *mixins),
+            {
+                "__doc__": f"Rest API Client with {', '.join(key)}",
+                "__module__": __name__,
+            },
+        )
+    return cls
+
+
+def build_client(*features: str, **kwargs) -> Connection:
+    """create a client with only the mixins of features, keyword arguments
+    are passed to Connection"""
+
+    return client_type(*features)(**kwargs)
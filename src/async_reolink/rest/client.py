@@ -0,0 +1,40 @@
+"""REST Client"""
+
+from . import (
+    ai,
+    alarm,
+    encoding,
+    connection,
+    led,
+    ptz,
+    network,
+    system,
+    record,
+    security,
+    video,
+)
+
+from .batching import BatchLimits
+
+
+class Client(
+    connection.Connection,
+    security.Security,
+    system.System,
+    network.Network,
+    video.Video,
+    encoding.Encoding,
+    record.Record,
+    alarm.Alarm,
+    ai.AI,
+    led.LED,
+    ptz.PTZ,
+):
+    """Rest API Client"""
+
+    def __init__(
+        self,
+        session_factory: connection.SessionFactory = None,
+        batch_limits: BatchLimits = None,
+    ) -> None:
+        super().__init__(session_factory=session_factory, batch_limits=batch_limits)
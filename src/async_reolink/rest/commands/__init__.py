@@ -1,8 +1,11 @@
 """REST Commands"""
 
 from abc import ABC
+from copy import deepcopy
 from enum import IntEnum
+from importlib import import_module
 from json import dumps
+from types import MappingProxyType
 from typing import (
     Callable,
     Final,
@@ -84,6 +87,132 @@ class CommandRequestWithChannel(CommandRequest, commands.ChannelValue):
         self._parameter[_CHANNEL_KEY] = value
 
 
+_template_types: dict[type, type] = {}
+
+
+class RequestTemplate(CommandRequestWithChannel):
+    """Immutable Precompiled Request
+
+    a snapshot of a request with its json encoded once, it is sent (and
+    routed) like the request it was made from and can be shared. templates
+    are instances of the request type they were made from, so type based
+    dispatch (capabilities, routes) treats them like their source
+    """
+
+    __slots__ = ("_json", "_type")
+
+    def __new__(cls, request: CommandRequest):
+        if cls is RequestTemplate:
+            request_type = type(request)
+            if (cls := _template_types.get(request_type, None)) is None:
+                cls = _template_types[request_type] = type(
+                    f"{request_type.__name__}Template",
+                    (RequestTemplate, request_type),
+                    {"__slots__": (), "__module__": request_type.__module__},
+                )
+        return super().__new__(cls)
+
+    # the source initializer would write to the read only template
+    def __init__(  # pylint: disable=super-init-not-called
+        self, request: CommandRequest
+    ) -> None:
+        # pylint: disable=protected-access
+        value = deepcopy(request._get_request())
+        object.__setattr__(self, "_request", value)
+        object.__setattr__(self, "_json", dumps(value))
+        object.__setattr__(self, "_type", type(request))
+
+    # the json is encoded once and the template is shared, setters inherited
+    # from the source type must not change it
+    def __setattr__(self, name: str, value: any):
+        raise AttributeError(f"{self.__class__.__name__} is read only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{self.__class__.__name__} is read only")
+
+    @property
+    def request_type(self) -> type[CommandRequest]:
+        """type of the request the template was made from"""
+        return self._type
+
+    @property
+    def json(self) -> str:
+        """encoded request"""
+        return self._json
+
+    def _get_parameter(self, create=False) -> dict:
+        return self._request.get("param", None)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self._json}>"
+
+
+_templates: dict[tuple, RequestTemplate] = {}
+
+
+def request_template(
+    request_type: type[CommandRequestWithChannel],
+    channel_id: int = 0,
+    response_type: CommandResponseTypes = CommandResponseTypes.VALUE_ONLY,
+) -> RequestTemplate:
+    """shared template of a request that only takes a channel, created once
+    per (request type, channel, response type)"""
+
+    key = (request_type, channel_id, response_type)
+    if (template := _templates.get(key, None)) is None:
+        template = _templates[key] = RequestTemplate(
+            request_type(channel_id, response_type)
+        )
+    return template
+
+
+# command modules register the response types of their commands, only the
+# module of a command is imported when a response to it is first decoded
+_COMMAND_MODULES: Final = MappingProxyType(
+    {
+        "GetAiState": "ai",
+        "GetAiCfg": "ai",
+        "SetAiCfg": "ai",
+        "GetMdState": "alarm",
+        "GetEnc": "encoding",
+        "GetIrLights": "led",
+        "SetIrLights": "led",
+        "GetPowerLed": "led",
+        "SetPowerLed": "led",
+        "GetWhiteLed": "led",
+        "SetWhiteLed": "led",
+        "GetLocalLink": "network",
+        "GetChannelstatus": "network",
+        "GetNetPort": "network",
+        "GetRtspUrl": "network",
+        "GetP2p": "network",
+        "GetWifi": "network",
+        "GetWifiSignal": "network",
+        "GetPtzPreset": "ptz",
+        "SetPtzPreset": "ptz",
+        "GetPtzPatrol": "ptz",
+        "SetPtzPatrol": "ptz",
+        "GetPtzTattern": "ptz",
+        "SetPtzTattern": "ptz",
+        "GetAutoFocus": "ptz",
+        "AutoFocus": "ptz",
+        "GetZoomFocus": "ptz",
+        "StartZoomFocus": "ptz",
+        "PtzCtrl": "ptz",
+        "Snap": "record",
+        "Search": "record",
+        "Login": "security",
+        "Logout": "security",
+        "GetUser": "security",
+        "GetAbility": "system",
+        "GetDevInfo": "system",
+        "GetTime": "system",
+        "Reboot": "system",
+        "GetHddInfo": "system",
+    }
+)
+_pending_commands = dict(_COMMAND_MODULES)
+
 _VALUE_KEY: Final = "value"
 _CODE_KEY: Final = "code"
 _ERROR_KEY: Final = "error"
@@ -105,10 +234,21 @@ class CommandResponse(commands.CommandResponse, ABC):
         ):
             cls._response_handlers[cls] = call
 
+    @staticmethod
+    def _load_handlers(command: str):
+        """import the command module of command so its response types are
+        registered"""
+
+        if (name := _pending_commands.get(command, None)) is not None:
+            import_module(f".{name}", __name__)
+            del _pending_commands[command]
+
     @classmethod
     def create_from(cls, value: dict):
         """wrap response in CommandResponse Implementation"""
 
+        if isinstance(command := value.get(_COMMAND_KEY, None), str):
+            cls._load_handlers(command)
         for (_type, test) in cls._response_handlers.items():
             if test(value):
                 return _type(value)
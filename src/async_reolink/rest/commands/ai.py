@@ -2,6 +2,8 @@
 
 from typing import Final, TypeGuard
 
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.ai  # pylint: disable=unused-import
 from async_reolink.api.commands import ai
 
 # from async_reolink.api.ai import typings
@@ -66,6 +68,8 @@ class GetAiStateResponse(
 class GetAiConfigRequest(CommandRequestWithChannel, ai.GetAiConfigRequest):
     """Get AI Configuration"""
 
+    __slots__ = ()
+
     COMMAND: Final = "GetAiCfg"
 
     def __init__(
@@ -86,6 +90,8 @@ class GetAiConfigResponse(
 ):
     """Get AI Configuration Response"""
 
+    __slots__ = ()
+
     @classmethod
     def is_response(cls, value: any, /):  # pylint: disable=signature-differs
         return super().is_response(value, GetAiConfigRequest.COMMAND)
@@ -104,6 +110,8 @@ class GetAiConfigResponse(
 class SetAiConfigRequest(CommandRequestWithChannel, ai.SetAiConfigRequest):
     """Set AI Configuration"""
 
+    __slots__ = ()
+
     COMMAND: Final = "SetAiCfg"
 
     def __init__(
@@ -9,6 +9,8 @@ from . import CommandRequestWithChannel, CommandResponse, CommandResponseTypes
 class GetMotionStateRequest(CommandRequestWithChannel, alarm.GetMotionStateRequest):
     """REST Get Motion State Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "GetMdState"
 
     def __init__(
@@ -1,6 +1,9 @@
 """Encoding REST Commands"""
 
 from typing import Final, TypeGuard
+
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.encoding  # pylint: disable=unused-import
 from async_reolink.api.commands import encoding
 
 from ..encoding.models import EncodingInfo
@@ -18,6 +21,8 @@ from ..commands import (
 class GetEncodingRequest(CommandRequestWithChannel, encoding.GetEncodingRequest):
     """Get Encoding REST Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "GetEnc"
 
     def __init__(
@@ -36,6 +41,8 @@ class GetEncodingResponse(
 ):
     """Get Encoding REST Response"""
 
+    __slots__ = ()
+
     @classmethod
     def is_response(cls, value: any, /):  # pylint: disable=signature-differs
         return super().is_response(value, GetEncodingRequest.COMMAND)
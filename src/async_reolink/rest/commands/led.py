@@ -2,6 +2,8 @@
 
 from typing import Final, TypeGuard
 
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.led  # pylint: disable=unused-import
 from async_reolink.api.commands import led
 from async_reolink.api.led import typings
 
@@ -128,7 +130,7 @@ class GetPowerLedRequest(CommandRequest, led.GetPowerLedRequest):
         channel_id: int = 0,
         response_type: CommandResponseTypes = CommandResponseTypes.VALUE_ONLY,
     ):
-        super().__init__(self.COMMAND, response_type)
+        super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
         self.channel_id = channel_id
@@ -170,7 +172,7 @@ class SetPowerLedRequest(CommandRequest, led.SetPowerLedRequest):
         channel_id: int = 0,
         response_type: CommandResponseTypes = CommandResponseTypes.VALUE_ONLY,
     ):
-        super().__init__(self.COMMAND, response_type)
+        super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
         self.channel_id = channel_id
@@ -201,7 +203,7 @@ class GetWhiteLedRequest(CommandRequestWithChannel, led.GetWhiteLedRequest):
         channel_id: int = 0,
         response_type: CommandResponseTypes = CommandResponseTypes.VALUE_ONLY,
     ):
-        super().__init__(self.COMMAND, response_type)
+        super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
         self.channel_id = channel_id
@@ -245,7 +247,7 @@ class SetWhiteLedRequest(CommandRequest, led.SetWhiteLedRequest):
         channel_id: int = 0,
         response_type: CommandResponseTypes = CommandResponseTypes.VALUE_ONLY,
     ):
-        super().__init__(self.COMMAND, response_type)
+        super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
         self.channel_id = channel_id
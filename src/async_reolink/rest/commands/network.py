@@ -12,6 +12,7 @@ from ..network import models
 from ..commands import (
     _CHANNEL_KEY,
     CommandRequest,
+    CommandRequestWithChannel,
     CommandResponseTypes,
     CommandResponse,
 )
@@ -131,7 +132,7 @@ class GetNetworkPortsResponse(
         return models.NetworkPorts(self._get_ports())
 
 
-class GetRTSPUrlsRequest(CommandRequest, network.GetRTSPUrlsRequest):
+class GetRTSPUrlsRequest(CommandRequestWithChannel, network.GetRTSPUrlsRequest):
     """REST Get RTSP Urls Request"""
 
     __slots__ = ()
@@ -149,6 +150,9 @@ class GetRTSPUrlsRequest(CommandRequest, network.GetRTSPUrlsRequest):
         self.channel_id = channel_id
 
 
+_STREAM_KEYS: Final = {_k: _v + "Stream" for _k, _v in STREAMTYPES_STR_MAP.items()}
+
+
 class _RTSPUrls(Mapping[StreamTypes, str]):
     __slots__ = ("_value",)
 
@@ -161,26 +165,24 @@ class _RTSPUrls(Mapping[StreamTypes, str]):
     def __getitem__(self, __k: StreamTypes) -> str:
         if (value := self._factory()) is None:
             return None
-        return value.get(STREAMTYPES_STR_MAP[__k] + "Stream", None)
+        return value.get(_STREAM_KEYS[__k], None)
 
     def __contains__(self, __o: StreamTypes) -> bool:
         if (value := self._factory()) is None:
             return False
-        return STREAMTYPES_STR_MAP[__o] + "Stream" in value
+        return _STREAM_KEYS[__o] in value
 
     def __iter__(self):
         if (value := self._factory()) is None:
             return
-        for _k, _v in STREAMTYPES_STR_MAP.items():
-            if _v + "Stream" in value:
+        for _k, _v in _STREAM_KEYS.items():
+            if _v in value:
                 yield _k
 
     def __len__(self) -> int:
         if (value := self._factory()) is None:
             return 0
-        return len(
-            (True for _v in STREAMTYPES_STR_MAP.values() if _v + "Stream" in value)
-        )
+        return sum(1 for _v in _STREAM_KEYS.values() if _v in value)
 
 
 class GetRTSPUrlsResponse(
@@ -8,10 +8,13 @@ from typing import (
     MutableSequence,
     cast,
 )
+
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.ptz  # pylint: disable=unused-import
 from async_reolink.api.commands import ptz
 from async_reolink.api.ptz import typings
 
-from .._utilities.dictlist import DictList
+from .._utilities.dictlist import DictIndex, DictList
 
 from ..models import MinMaxRange, StringRange
 
@@ -23,6 +26,7 @@ from ..ptz.typings import (
 )
 
 from ..ptz.models import (
+    _ENABLE_KEY,
     MutablePreset,
     Preset,
     _ID_KEY,
@@ -93,15 +97,24 @@ class _PresetRange:
         return StringRange(self._keyed_factory("name"))
 
 
+def _is_enabled(value: dict):
+    return bool(value.get(_ENABLE_KEY, 0))
+
+
 class GetPresetResponse(CommandResponse, ptz.GetPresetResponse, test="is_response"):
     """Get Presets Response"""
 
-    __slots__ = ()
+    __slots__ = ("_presets", "_enabled_presets")
 
     @classmethod
     def is_response(cls, value: any, /):  # pylint: disable=signature-differs
         return super().is_response(value, GetPresetRequest.COMMAND)
 
+    def __init__(self, response: dict) -> None:
+        super().__init__(response)
+        self._presets: DictIndex[int, Preset] = None
+        self._enabled_presets: DictIndex[int, Preset] = None
+
     def _get_sub_value(self, factory: Callable[[], dict]) -> list:
         return (
             value.get(_PRESET_KEY, None) if (value := factory()) is not None else None
@@ -109,17 +122,28 @@ class GetPresetResponse(CommandResponse, ptz.GetPresetResponse, test="is_respons
 
     @property
     def channel_id(self) -> int:
-        if (_list := self._get_sub_value(self._get_value)) is None:
-            return None
-        if (value := next(iter(_list), None)) is None:
+        if not (_list := self._get_sub_value(self._get_value)):
             return None
+        value = _list[0]
         if TYPE_CHECKING:
             value = cast(dict, value)
         return value.get(_CHANNEL_KEY, None)
 
     @property
     def presets(self):
-        return DictList(_ID_KEY, self._get_sub_value(self._get_value), Preset)
+        if self._presets is None:
+            self._presets = DictIndex(
+                _ID_KEY, self._get_sub_value(self._get_value), Preset
+            )
+        return self._presets
+
+    @property
+    def enabled_presets(self):
+        """configured presets"""
+
+        if self._enabled_presets is None:
+            self._enabled_presets = self.presets.filter(_is_enabled)
+        return self._enabled_presets
 
     @property
     def initial_presets(self):
@@ -148,9 +172,9 @@ class SetPresetRequest(CommandRequest, ptz.SetPresetRequest):
         super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
-        self.channel_id = channel_id
         if preset is not None:
             self.preset = preset
+        self.channel_id = channel_id
 
     def _get_sub_value(self, create=False) -> dict:
         _key: Final = _PRESET_KEY
@@ -267,12 +291,17 @@ class _PatrolRange:
 class GetPatrolResponse(CommandResponse, ptz.GetPatrolResponse, test="is_response"):
     """Get Patrol Response"""
 
-    __slots__ = ()
+    __slots__ = ("_patrols", "_enabled_patrols")
 
     @classmethod
     def is_response(cls, value: any, /):  # pylint: disable=signature-differs
         return super().is_response(value, GetPatrolRequest.COMMAND)
 
+    def __init__(self, response: dict) -> None:
+        super().__init__(response)
+        self._patrols: DictIndex[int, Patrol] = None
+        self._enabled_patrols: DictIndex[int, Patrol] = None
+
     def _get_sub_value(self, factory: Callable[[], dict]) -> list:
         return (
             value.get(_PATROL_KEY, None) if (value := factory()) is not None else None
@@ -282,7 +311,19 @@ class GetPatrolResponse(CommandResponse, ptz.GetPatrolResponse, test="is_respons
 
     @property
     def patrols(self):
-        return DictList(_ID_KEY, self._get_sub_value(self._get_value), Patrol)
+        if self._patrols is None:
+            self._patrols = DictIndex(
+                _ID_KEY, self._get_sub_value(self._get_value), Patrol
+            )
+        return self._patrols
+
+    @property
+    def enabled_patrols(self):
+        """configured patrols"""
+
+        if self._enabled_patrols is None:
+            self._enabled_patrols = self.patrols.filter(_is_enabled)
+        return self._enabled_patrols
 
     @property
     def initial_presets(self):
@@ -311,9 +352,9 @@ class SetPatrolRequest(CommandRequest, ptz.SetPatrolRequest):
         super().__init__()
         self.command = type(self).COMMAND
         self.response_type = response_type
-        self.channel_id = channel_id
         if patrol is not None:
             self.patrol = patrol
+        self.channel_id = channel_id
 
     def _get_sub_value(self, create=False) -> dict:
         _key: Final = _PATROL_KEY
@@ -405,7 +446,7 @@ class _TracksRange:
         return _TrackRange(self._keyed_factory("track"))
 
 
-class GetTatternResponse(CommandResponse, ptz.GetTatternResponse):
+class GetTatternResponse(CommandResponse, ptz.GetTatternResponse, test="is_response"):
     """Get Tattern Response"""
 
     __slots__ = ()
@@ -436,11 +477,11 @@ class GetTatternResponse(CommandResponse, ptz.GetTatternResponse):
 
     @property
     def tracks(self):
-        return DictList(_ID_KEY, self._get_tracks, Track)
+        return DictList(_ID_KEY, self._get_tracks(), Track)
 
     @property
     def initial_tracks(self):
-        return DictList(_ID_KEY, self._get_tracks, Track)
+        return DictList(_ID_KEY, self._get_tracks(), Track)
 
     @property
     def presets_range(self):
@@ -457,8 +498,8 @@ class _MutableTracks(MutableSequence[MutableTrack]):
         self._factory = factory
 
     def __getitem__(self, __k: int):
-        def _factory():
-            if (value := self._factory()) is None:
+        def _factory(create=False):
+            if (value := self._factory(create)) is None:
                 return None
             return value[__k]
 
@@ -494,6 +535,10 @@ class _MutableTracks(MutableSequence[MutableTrack]):
             return 0
         return len(value)
 
+    def __iter__(self):
+        # items are lazy and never raise IndexError, so bound by length
+        return (self[_i] for _i in range(len(self)))
+
 
 class SetTatternRequest(CommandRequest, ptz.SetTatternRequest):
     """Set PTZ Tattern"""
@@ -842,7 +887,7 @@ class SetControlRequest(CommandRequestWithChannel, ptz.SetControlRequest):
     def preset_id(self, value):
         if value is None:
             if (_value := self._get_parameter()) is not None:
-                del _value["id"]
+                _value.pop("id", None)
             return
         self._parameter["id"] = value
 
@@ -856,6 +901,6 @@ class SetControlRequest(CommandRequestWithChannel, ptz.SetControlRequest):
     def speed(self, value):
         if value is None:
             if (_value := self._get_parameter()) is not None:
-                del _value["speed"]
+                _value.pop("speed", None)
             return
         self._parameter["speed"] = value
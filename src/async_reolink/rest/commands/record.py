@@ -1,13 +1,19 @@
 """REST Record Commands"""
 
 from typing import Callable, Final, Sequence, TypeGuard, TypeVar
+
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.record  # pylint: disable=unused-import
 from async_reolink.api.commands import record
 from async_reolink.api.record import typings
 
 from ..record.models import MutableSearch, SearchStatus, File
+from ..record.seed import Seed
+from ..routing import API_PATH, Route, UrlTemplate, register_route
 
 from . import (
     _CHANNEL_KEY,
+    _COMMAND_KEY,
     CommandRequest,
     CommandRequestWithChannel,
     CommandResponse,
@@ -20,6 +26,8 @@ from . import (
 class GetSnapshotRequest(CommandRequestWithChannel, record.GetSnapshotRequest):
     """REST Get Snaposhot Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "Snap"
 
     def __init__(
@@ -37,9 +45,34 @@ class GetSnapshotRequest(CommandRequestWithChannel, record.GetSnapshotRequest):
         return self._parameter
 
 
+_DEFAULT_SEED: Final = Seed()
+
+
+def _snapshot_params(client: object, request: GetSnapshotRequest):
+    # the record mixin provides the seed of a client
+    seed = getattr(client, "snapshot_seed", _DEFAULT_SEED)
+    return {_CHANNEL_KEY: request.channel_id, "rs": str(seed)}
+
+
+register_route(
+    GetSnapshotRequest,
+    Route(
+        UrlTemplate(
+            API_PATH,
+            {_COMMAND_KEY: GetSnapshotRequest.COMMAND},
+            (_CHANNEL_KEY, "rs", "token"),
+        ),
+        True,
+        _snapshot_params,
+    ),
+)
+
+
 class SearchRecordingsRequest(CommandRequest, record.SearchRecordingsRequest):
     """REST Search Recordings Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "Search"
 
     def __init__(
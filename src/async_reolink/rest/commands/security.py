@@ -1,6 +1,9 @@
 """Secuirty REST Commands"""
 
 from typing import TYPE_CHECKING, Callable, Final, Sequence, cast
+
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.security  # pylint: disable=unused-import
 from async_reolink.api.commands import security
 
 from . import CommandRequest, CommandResponseTypes, CommandResponse
@@ -9,6 +12,7 @@ from ..security.models import LoginToken, UserInfo
 from ..security.typings import _STR_LEVELTYPE_MAP
 
 from ..models import StringRange
+from ..routing import API_PATH, Route, UrlTemplate, register_route
 
 # pylint:disable=missing-function-docstring
 
@@ -69,6 +73,11 @@ class LoginRequest(CommandRequest, security.LoginRequest):
         self._login["password"] = value
 
 
+register_route(
+    LoginRequest, Route(UrlTemplate(API_PATH, {"cmd": LoginRequest.COMMAND}))
+)
+
+
 class LoginResponse(CommandResponse, security.LoginResponse, test="is_response"):
     """REST Login Response"""
 
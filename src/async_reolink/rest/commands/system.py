@@ -1,6 +1,9 @@
 """System REST Commands"""
 
 from typing import Final
+
+# the api mixin package imports its commands without running into a cycle
+import async_reolink.api.system  # pylint: disable=unused-import
 from async_reolink.api.commands import system
 
 from .._utilities.dictlist import DictList
@@ -86,6 +89,8 @@ class GetAbilitiesResponse(
 class GetDeviceInfoRequest(CommandRequest, system.GetDeviceInfoRequest):
     """REST Get Device Info Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "GetDevInfo"
 
     def __init__(
@@ -124,6 +129,8 @@ class GetDeviceInfoResponse(
 class GetTimeRequest(CommandRequest, system.GetTimeRequest):
     """REST Get Time Request"""
 
+    __slots__ = ()
+
     COMMAND: Final = "GetTime"
 
     def __init__(
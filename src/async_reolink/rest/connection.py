@@ -1,15 +1,19 @@
 """REST Connection"""
+
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from enum import IntEnum
-import inspect
-from json import JSONDecoder, loads as DEFAULT_JSON_DECODER
+from json import JSONDecoder, dumps, loads as DEFAULT_JSON_DECODER
 import logging
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
-    Callable,
+    Final,
+    Iterable,
+    Mapping,
     Protocol,
-    Sequence,
     cast,
     overload,
 )
@@ -26,9 +30,25 @@ from async_reolink.api import errors
 
 from async_reolink.api.const import DEFAULT_TIMEOUT
 
-from .commands import CommandResponse, CommandRequest
+from ._utilities.callbacks import Callback, CallbackList
+from .batching import (
+    DEFAULT_BATCH_LIMIT,
+    DEFAULT_PIPELINE_DEPTH,
+    BatchKey,
+    BatchLimits,
+)
+from .commands import (
+    _CODE_KEY,
+    _COMMAND_KEY,
+    _VALUE_KEY,
+    CommandErrorResponse,
+    CommandResponse,
+    CommandRequest,
+    RequestTemplate,
+)
+from . import routing
 
-from .errors import CONNECTION_ERRORS, RESPONSE_ERRORS
+from .errors import BATCH_ERRORS, CONNECTION_ERRORS, RESPONSE_ERRORS
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_DATA = logging.getLogger(__name__ + ".data")
@@ -37,8 +57,7 @@ _LOGGER_DATA = logging.getLogger(__name__ + ".data")
 class SessionFactory(Protocol):
     """Session Factory"""
 
-    def __call__(self, base_url: str, timeout: int) -> aiohttp.ClientSession:
-        ...
+    def __call__(self, base_url: str, timeout: int) -> aiohttp.ClientSession: ...
 
 
 def _default_create_session(base_url: str, timeout: int):
@@ -49,6 +68,27 @@ def _default_create_session(base_url: str, timeout: int):
     )
 
 
+def _is_batch_error(error: Exception):
+    # only answers that mean the batch was too large, a slow or unreachable
+    # device must not get its batches split
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    if isinstance(error, errors.ReolinkResponseError):
+        return error.code == errors.ErrorCodes.PROTOCOL_ERROR
+    return isinstance(error, aiohttp.ClientPayloadError)
+
+
+_DETACHED_KEY: BatchKey = ("", "")
+
+# commands that only read, a batch of them can be sent again in parts
+_RESENDABLE: Final = ("Get", "Search")
+
+
+def _can_resend(requests: tuple[CommandRequest, ...]):
+    # a change (Set*, PtzCtrl, ...) may already have been applied
+    return all(_r.command.startswith(_RESENDABLE) for _r in requests)
+
+
 class Encryption(IntEnum):
     """Connection Encryption"""
 
@@ -56,19 +96,92 @@ class Encryption(IntEnum):
     HTTPS = 1
 
 
+class PreparedBatch:
+    """Pre-encoded Batch
+
+    for a batch sent over and over (i.e. a fixed poll set), the body is
+    encoded once and responses are created directly as the type the same
+    command answered with before
+    """
+
+    __slots__ = ("requests", "route", "body", "headers", "_commands", "_types")
+
+    def __init__(self, requests: Iterable[CommandRequest]) -> None:
+        self.requests = tuple(requests)
+        if not self.requests:
+            raise ValueError("batch is empty")
+        if len(self.requests) == 1:
+            self.route = routing.request_route(self.requests[0])
+        else:
+            self.route = routing.DEFAULT_ROUTE
+        if self.route.use_get:
+            raise ValueError(f"{self.requests[0].command} can not be prepared")
+        # pylint: disable=protected-access
+        self.body = (
+            "["
+            + ",".join(
+                (
+                    _r.json
+                    if isinstance(_r, RequestTemplate)
+                    else dumps(_r._get_request())
+                )
+                for _r in self.requests
+            )
+            + "]"
+        ).encode()
+        self.headers = {"Accept": "*/*", "Content-Type": "application/json"}
+        self._commands = tuple(_r.command for _r in self.requests)
+        self._types: list[type[CommandResponse] | None] = [None] * len(self.requests)
+
+    def __len__(self):
+        return len(self.requests)
+
+    def _expected(self, index: int, value: any):
+        # learned type of a successful answer to the request at index
+        if (
+            index < len(self._types)
+            and (response_type := self._types[index]) is not None
+            and isinstance(value, dict)
+            and value.get(_COMMAND_KEY, None) == self._commands[index]
+            and value.get(_CODE_KEY, None) == 0
+            and _VALUE_KEY in value
+        ):
+            return response_type
+        return None
+
+    def _learn(self, index: int, response: CommandResponse):
+        if (
+            index < len(self._types)
+            and response.command == self._commands[index]
+            and not isinstance(response, CommandErrorResponse)
+            and type(response) is not CommandResponse
+        ):
+            self._types[index] = type(response)
+
+
 class Connection(BaseConnection):
     """REST Connection"""
 
+    # rarely changed state defaults on the class, so idle clients stay small
+
+    # values (i.e. token) available to every route url, replaced not mutated
+    _route_values: Mapping[str, str] = MappingProxyType({})
+    pipeline_depth = DEFAULT_PIPELINE_DEPTH
+    __connect_callbacks: CallbackList | None = None
+    __disconnect_callbacks: CallbackList | None = None
+    __batch_limits: BatchLimits | None = None
+    __batch_key: BatchKey | None = None
+    # limits learned while the device model is not known yet
+    __detached_limits: BatchLimits | None = None
+
     def __init__(
         self,
         *args,
         session_factory: SessionFactory = None,
         loads: JSONDecoder = DEFAULT_JSON_DECODER,
+        batch_limits: BatchLimits = None,
         **kwargs,
     ):
-        self._force_get_callbacks: list[
-            Callable[[str, dict[str, str], Sequence[CommandRequest]], any]
-        ] = []
         # self._response_callback: list[Callable[[CommandResponse], None]]
         super().__init__(*args, **kwargs)
         self.__session: aiohttp.ClientSession | None = None
@@ -79,6 +192,32 @@ class Connection(BaseConnection):
         self.__hostname = ""
         self.__connection_id = 0
         self.__loads = loads
+        if batch_limits is not None:
+            self.__batch_limits = batch_limits
+
+    # the base connection assigns plain lists, wrap them so callbacks are
+    # classified once when added instead of on every dispatch
+
+    @property
+    def _connect_callbacks(self):
+        # callback lists are created on first use
+        if self.__connect_callbacks is None:
+            self.__connect_callbacks = CallbackList()
+        return self.__connect_callbacks
+
+    @_connect_callbacks.setter
+    def _connect_callbacks(self, value: Iterable[Callback]):
+        self.__connect_callbacks = CallbackList(value) if value else None
+
+    @property
+    def _disconnect_callbacks(self):
+        if self.__disconnect_callbacks is None:
+            self.__disconnect_callbacks = CallbackList()
+        return self.__disconnect_callbacks
+
+    @_disconnect_callbacks.setter
+    def _disconnect_callbacks(self, value: Iterable[Callback]):
+        self.__disconnect_callbacks = CallbackList(value) if value else None
 
     def _create_session(self, timeout: int):
         return self.__session_factory(self.__base_url, timeout)
@@ -108,6 +247,52 @@ class Connection(BaseConnection):
         """hostname"""
         return self.__hostname
 
+    @property
+    def timeout(self):
+        """request timeout"""
+
+        if self.__session is None or self.__session.timeout.total is None:
+            return DEFAULT_TIMEOUT
+        return self.__session.timeout.total
+
+    @property
+    def batch_limits(self):
+        """learned batch limits, can be shared between connections"""
+
+        if self.__batch_limits is None:
+            self.__batch_limits = BatchLimits()
+        return self.__batch_limits
+
+    @batch_limits.setter
+    def batch_limits(self, value: BatchLimits):
+        self.__batch_limits = value
+
+    @property
+    def batch_key(self):
+        """(model, firmware) of device used to look up batch limit"""
+        return self.__batch_key
+
+    @batch_key.setter
+    def batch_key(self, value: BatchKey | None):
+        self.__batch_key = value
+
+    @property
+    def batch_limit(self):
+        """maximum commands sent in one request"""
+
+        if self.__batch_key is None and self.__detached_limits is not None:
+            return self.__detached_limits.limit(_DETACHED_KEY)
+        if self.__batch_limits is None:
+            return DEFAULT_BATCH_LIMIT
+        return self.__batch_limits.limit(self.__batch_key)
+
+    def __limits(self):
+        if self.__batch_key is not None:
+            return self.batch_limits, self.__batch_key
+        if self.__detached_limits is None:
+            self.__detached_limits = self.batch_limits.detached()
+        return self.__detached_limits, _DETACHED_KEY
+
     @overload
     async def connect(
         self,
@@ -151,65 +336,148 @@ class Connection(BaseConnection):
         self.__hostname = hostname
         self.__session = self._create_session(timeout)
 
-        for callback in self._connect_callbacks:
-            if inspect.iscoroutinefunction(callback):
-                await callback()
-            else:
-                callback()
+        if self.__connect_callbacks is not None:
+            await self.__connect_callbacks.invoke()
 
     async def disconnect(self):
         """disconnect from device"""
 
         if self.__session is None:
             return
-        for callback in self._disconnect_callbacks:
-            if inspect.iscoroutinefunction(callback):
-                await callback()
-            else:
-                callback()
+        if self.__disconnect_callbacks is not None:
+            await self.__disconnect_callbacks.invoke()
         if not self.__session.closed:
             await self.__session.close()
         self.__connection_id = 0
         self.__base_url = ""
         self.__hostname = ""
         self.__session = None
+        self.__batch_key = None
+        self.__detached_limits = None
 
     def __process_response(self, value: any):
         if not CommandResponse.is_response(value):
-            raise errors.ReolinkResponseError("Invalid response from device")
+            raise errors.ReolinkResponseError(
+                "Invalid response from device", code=errors.ErrorCodes.PROTOCOL_ERROR
+            )
         response = CommandResponse.create_from(value)
         # for handler in self._response_callback:
         #    handler(response)
         return response
 
+    async def __send_batch(
+        self, args: tuple[CommandRequest, ...], prepared: PreparedBatch = None
+    ):
+        try:
+            responses = [_r async for _r in self.__send(*args, prepared=prepared)]
+        except BATCH_ERRORS as error:
+            if len(args) < 2 or not _is_batch_error(error):
+                raise
+            limits, key = self.__limits()
+            limits.record_failure(key, len(args))
+            if not _can_resend(args):
+                raise
+            _LOGGER.debug("batch of %d failed (%s), splitting", len(args), error)
+        else:
+            if len(args) < 2 or not self.is_connected:
+                return responses
+            limits, key = self.__limits()
+            if len(responses) >= len(args):
+                limits.record_success(key, len(args))
+                return responses
+            # the device stopped at a failed command (e.g. login required),
+            # the batch was not too large
+            if responses and isinstance(responses[-1], CommandErrorResponse):
+                return responses
+            limits.record_failure(key, len(args))
+            if not _can_resend(args):
+                _LOGGER.debug("batch of %d was truncated", len(args))
+                return responses
+            _LOGGER.debug("batch of %d was truncated, splitting", len(args))
+
+        half = len(args) // 2
+        first, second = await asyncio.gather(
+            self.__send_batch(args[:half]), self.__send_batch(args[half:])
+        )
+        return first + second
+
     async def __execute(self, *args: CommandRequest):
+        if len(args) < 2:
+            async for response in self.__send(*args):
+                yield response
+            return
+        if not self.is_connected:
+            return
+
+        limit = self.batch_limit
+        if len(args) <= limit:
+            for response in await self.__send_batch(args):
+                yield response
+            return
+
+        # keep up to pipeline_depth sub batches in flight, yielding in order
+        window: deque[asyncio.Future[list]] = deque()
+        try:
+            for i in range(0, len(args), limit):
+                window.append(
+                    asyncio.ensure_future(self.__send_batch(args[i : i + limit]))
+                )
+                if len(window) < self.pipeline_depth:
+                    continue
+                for response in await window.popleft():
+                    yield response
+            while window:
+                for response in await window.popleft():
+                    yield response
+        finally:
+            for task in window:
+                task.cancel()
+
+    def __encode_batch(self, args: tuple[CommandRequest, ...]) -> str:
+        serialize = self.__session.json_serialize
+        if not any(isinstance(_r, RequestTemplate) for _r in args):
+            return serialize([_r._get_request() for _r in args])
+        # templates are encoded already, join the fragments
+        return (
+            "["
+            + ",".join(
+                _r.json
+                if isinstance(_r, RequestTemplate)
+                else serialize(_r._get_request())
+                for _r in args
+            )
+            + "]"
+        )
+
+    def __process_prepared(self, batch: PreparedBatch, index: int, value: any):
+        # pylint: disable=protected-access
+        if (response_type := batch._expected(index, value)) is not None:
+            return response_type(value)
+        response = self.__process_response(value)
+        batch._learn(index, response)
+        return response
+
+    async def __send(self, *args: CommandRequest, prepared: PreparedBatch = None):
         if not self.is_connected:
             return
 
         if len(args) == 0:
             return
-        use_get = False
-        query = {}
-        url = "/cgi-bin/api.cgi"
-        for callback in self._force_get_callbacks:
-            if inspect.iscoroutinefunction(callback):
-                cb_result = await callback(url, query, args)
-            else:
-                cb_result = callback(url, query, args)
-
-            if cb_result:
-                if isinstance(cb_result, tuple) and len(cb_result) == 2:
-                    if not use_get:
-                        use_get = bool(cb_result[0])
-                    url = str(cb_result[1])
-                elif isinstance(cb_result, str):
-                    url = cb_result
-                elif not use_get:
-                    use_get = True
+        if prepared is not None:
+            route = prepared.route
+        elif len(args) == 1:
+            route = routing.request_route(args[0])
+        else:
+            route = routing.DEFAULT_ROUTE
+        use_get = route.use_get
+        url = route.build_url(self, args[0], self._route_values)
 
         count = None
 
-        headers = {"Accept": "*/*", "Content-Type": "application/json"}
+        if prepared is not None:
+            headers = prepared.headers
+        else:
+            headers = {"Accept": "*/*", "Content-Type": "application/json"}
 
         cleanup = True
         response = None
@@ -227,17 +495,17 @@ class Connection(BaseConnection):
         try:
             encrypted = False
             if use_get:
-                _LOGGER_DATA.debug("GET: %s<-%s", url, query)
+                _LOGGER_DATA.debug("GET: %s", url)
                 context = self.__session.get(
                     url,
-                    params=query,
                     headers=headers,
                     allow_redirects=False,
                 )
             else:
-                data = self.__session.json_serialize(
-                    list(map(lambda r: r._get_request(), args))
-                )
+                if prepared is not None:
+                    data = prepared.body
+                else:
+                    data = self.__encode_batch(args)
 
                 _LOGGER_DATA.debug(
                     "%s%s<-%s", self.__hostname, "(E)" if encrypted else "", data
@@ -283,7 +551,7 @@ class Connection(BaseConnection):
                             self.__session.timeout.total,
                             encryption=Encryption.HTTPS,
                         )
-                    async for command_response in self.__execute(*args):
+                    async for command_response in self.__send(*args, prepared=prepared):
                         if TYPE_CHECKING:
                             command_response = cast(
                                 bytes | BaseCommandResponse, command_response
@@ -369,10 +637,65 @@ class Connection(BaseConnection):
             "%s%s->%s", self.__hostname, "(D)" if encrypted else "", command_responses
         )
 
+        if prepared is not None:
+            for index, command_response in enumerate(command_responses):
+                yield self.__process_prepared(prepared, index, command_response)
+            return
+
         for command_response in command_responses:
             yield self.__process_response(command_response)
 
+    async def _open_stream(self, url: str, timeout: float | None = DEFAULT_TIMEOUT):
+        """Internal API, chunks of a long running (live stream) response
+
+        timeout applies to each read instead of the whole response
+        """
+
+        if not self.is_connected:
+            return
+        if url.startswith(self.__base_url):
+            url = url[len(self.__base_url) :]
+        _LOGGER_DATA.debug("STREAM: %s", url)
+        async with self.__session.get(
+            url,
+            headers={"Accept": "*/*"},
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=timeout),
+        ) as response:
+            if response.status >= 300:
+                _LOGGER.error("got (%d) response code for stream", response.status)
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    [response],
+                    status=response.status,
+                    headers=response.headers,
+                )
+            async for chunk in response.content.iter_any():
+                yield chunk
+
     def _execute(self, *args: BaseCommandRequest):
         """Internal API"""
 
         return self.__execute(*args)
+
+    def prepare_batch(self, commands: Iterable[CommandRequest]):
+        """encode commands once for execute_prepared, batches should be within
+        the batch limit of the device"""
+
+        return PreparedBatch(commands)
+
+    async def execute_prepared(self, batch: PreparedBatch):
+        """execute a prepared batch, yields responses in request order
+
+        batches over the batch limit are sent like any other batch, failed
+        or truncated batches are split like any other batch
+        """
+
+        if not self.is_connected:
+            return
+        if len(batch) <= self.batch_limit:
+            for response in await self.__send_batch(batch.requests, batch):
+                yield response
+            return
+        async for response in self.__execute(*batch.requests):
+            yield response
@@ -1,7 +1,10 @@
 """AI Mixin"""
 
+from typing import Iterable
+
 from async_reolink.api import encoding
 
+from .._utilities.channels import gather_channels
 from ..commands import encoding as commands
 
 
@@ -10,3 +13,14 @@ class Encoding(encoding.Encoding):
 
     def _create_get_encoding_request(self, channel: int):
         return commands.GetEncodingRequest(channel)
+
+    async def get_encodings(self, channels: Iterable[int] | None = None):
+        """Get Encoding Info of several channels in one request"""
+
+        return await gather_channels(
+            self,
+            channels,
+            self._create_get_encoding_request,
+            commands.GetEncodingResponse,
+            lambda response: response.info,
+        )
@@ -3,9 +3,13 @@
 from typing import Final
 
 from asyncio import TimeoutError as AsyncIOTimeoutError
-from aiohttp import ClientConnectionError, ClientResponseError
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientResponseError,
+)
 
-from async_reolink.api.errors import ErrorCodes
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
 
 CONNECTION_ERRORS: Final = (
     TimeoutError,
@@ -18,6 +22,14 @@ RESPONSE_ERRORS: Final = (
     ClientResponseError
 )
 
+# errors a device may answer an oversized batch with (5xx, truncated or
+# protocol error responses), timeouts and disconnects are not among them
+BATCH_ERRORS: Final = (
+    ClientPayloadError,
+    ClientResponseError,
+    ReolinkResponseError,
+)
+
 AUTH_ERRORCODES: Final = (
     ErrorCodes.AUTH_REQUIRED,
     ErrorCodes.LOGIN_FAILED,
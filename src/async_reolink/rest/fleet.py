@@ -0,0 +1,191 @@
+"""Fleet Execution"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+import inspect
+from ipaddress import ip_address, ip_network
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Final,
+    Generic,
+    Iterable,
+    TypeVar,
+    Union,
+)
+
+from async_reolink.api.commands import CommandRequest, CommandResponse
+from async_reolink.api.connection import Connection
+
+DEFAULT_LIMIT: Final = 64
+DEFAULT_SUBNET_LIMIT: Final = 16
+
+_C = TypeVar("_C", bound=Connection)
+
+CommandPlan = Union[
+    Iterable[CommandRequest],
+    Callable[[_C], Iterable[CommandRequest] | Awaitable[Iterable[CommandRequest]]],
+]
+
+
+def subnet_of(hostname: str, prefix: int = 24, ipv6_prefix: int = 64):
+    """subnet key for hostname, non ip hostnames are their own subnet"""
+
+    try:
+        address = ip_address(hostname.strip("[]"))
+    except ValueError:
+        return hostname
+    if address.version == 6:
+        prefix = ipv6_prefix
+    return str(ip_network(f"{address}/{prefix}", strict=False))
+
+
+class FleetRun(Generic[_C]):
+    """Running fleet batch
+
+    iterate to receive (device, response) pairs in completion order,
+    failures holds the error of every device whose batch failed
+    """
+
+    __slots__ = ("_executor", "_clients", "_commands", "failures", "_started")
+
+    def __init__(
+        self,
+        executor: "FleetExecutor",
+        clients: Iterable[_C],
+        commands: CommandPlan[_C],
+    ) -> None:
+        self._executor = executor
+        self._clients = clients
+        self._commands = commands
+        self.failures: dict[_C, BaseException] = {}
+        self._started = False
+
+    async def _run(
+        self, client: _C, queue: asyncio.Queue[tuple[_C, CommandResponse | bytes]]
+    ):
+        commands = self._commands
+        try:
+            async with AsyncExitStack() as stack:
+                # take the subnet slot first so waiting does not hold a global slot
+                await stack.enter_async_context(
+                    self._executor.subnet_semaphore(client.hostname)
+                )
+                await stack.enter_async_context(self._executor.semaphore)
+                if callable(commands):
+                    commands = commands(client)
+                    if inspect.isawaitable(commands):
+                        commands = await commands
+                commands = list(commands)
+                if not commands:
+                    return
+                async for response in client.batch(commands):
+                    await queue.put((client, response))
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            self.failures[client] = error
+
+    def __aiter__(self) -> AsyncIterator[tuple[_C, CommandResponse | bytes]]:
+        if self._started:
+            raise RuntimeError("Fleet run can only be iterated once")
+        self._started = True
+        return self._iterate()
+
+    async def _iterate(self):
+        queue: asyncio.Queue[tuple[_C, CommandResponse | bytes]] = asyncio.Queue(
+            self._executor.buffer
+        )
+        tasks = {
+            asyncio.ensure_future(self._run(_client, queue))
+            for _client in self._clients
+        }
+        pending = set(tasks)
+        try:
+            while pending or not queue.empty():
+                if queue.empty():
+                    getter = asyncio.ensure_future(queue.get())
+                    done, pending = await asyncio.wait(
+                        pending | {getter}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    pending.discard(getter)
+                    if getter not in done:
+                        getter.cancel()
+                        continue
+                    yield getter.result()
+                else:
+                    yield queue.get_nowait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class FleetExecutor:
+    """Run command batches across many clients
+
+    concurrency is capped globally and per subnet, a failing device does not
+    cancel the others
+    """
+
+    __slots__ = (
+        "_limit",
+        "_subnet_limit",
+        "_subnet_prefix",
+        "_ipv6_prefix",
+        "_semaphore",
+        "_subnets",
+        "buffer",
+    )
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        subnet_limit: int = DEFAULT_SUBNET_LIMIT,
+        *,
+        subnet_prefix: int = 24,
+        ipv6_prefix: int = 64,
+        buffer: int = 0,
+    ) -> None:
+        self._limit = limit
+        self._subnet_limit = subnet_limit
+        self._subnet_prefix = subnet_prefix
+        self._ipv6_prefix = ipv6_prefix
+        self._semaphore = asyncio.Semaphore(limit)
+        self._subnets: dict[str, asyncio.Semaphore] = {}
+        self.buffer = buffer
+
+    @property
+    def limit(self):
+        """global concurrency limit"""
+        return self._limit
+
+    @property
+    def subnet_limit(self):
+        """per subnet concurrency limit"""
+        return self._subnet_limit
+
+    @property
+    def semaphore(self):
+        """global concurrency semaphore"""
+        return self._semaphore
+
+    def subnet_semaphore(self, hostname: str):
+        """concurrency semaphore for the subnet of hostname"""
+
+        key = subnet_of(hostname, self._subnet_prefix, self._ipv6_prefix)
+        if (semaphore := self._subnets.get(key, None)) is None:
+            semaphore = asyncio.Semaphore(self._subnet_limit)
+            self._subnets[key] = semaphore
+        return semaphore
+
+    def execute(self, clients: Iterable[_C], commands: CommandPlan[_C]):
+        """execute commands (or a per client plan) on every client"""
+
+        if not callable(commands):
+            # every client sends the same commands, a generator is used up once
+            commands = list(commands)
+        return FleetRun(self, clients, commands)
@@ -6,7 +6,7 @@ from async_reolink.api.led.typings import LightStates, LightingSchedule, WhiteLe
 from async_reolink.api.ai.typings import AITypes
 from async_reolink.api.typings import PercentValue
 
-from ..commands import led as commands
+from ..commands import led as commands, request_template
 
 
 class LED(led.LED):
@@ -25,7 +25,7 @@ class LED(led.LED):
         return commands.SetPowerLedRequest(state, channel)
 
     def _create_get_white_led_request(self, channel: int):
-        return commands.GetWhiteLedRequest(channel)
+        return request_template(commands.GetWhiteLedRequest, channel)
 
     def _create_set_white_led_request(
         self,
@@ -80,6 +80,8 @@ class LightingSchedule(typings.LightingSchedule):
 class MutableLightingSchedule(LightingSchedule):
     """Mutable Lighting schedule"""
 
+    __slots__ = ()
+
     def __init__(self, factory: FactoryValue[dict]) -> None:
         super().__init__(factory)
         self._factory = factory
@@ -193,6 +195,8 @@ class WhiteLedInfo(typings.WhiteLedInfo):
 class MutableWhiteLedInfo(WhiteLedInfo):
     """White Led Info"""
 
+    __slots__ = ()
+
     def __init__(self, factory: FactoryValue[dict]) -> None:
         super().__init__(factory)
         self._factory = factory
@@ -1,19 +1,84 @@
 """REST Network Mixin"""
 
+from typing import Iterable
+
 from async_reolink.api import network
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
 from async_reolink.api.typings import StreamTypes
 
+from .._utilities.channels import gather_channels
+
 from ..commands import network as commands
 
-from .. import security
+from .. import connection, security
+
+from .liveness import ChannelLiveness
+from .streams import DEFAULT_RTMP_PORT, DEFAULT_RTSP_PORT, StreamUrlResolver
+from .typings import StreamProtocols
 
 
 class Network(network.Network):
     """REST Network Mixin"""
 
+    # created on first use, cleared on disconnect from then on
+    __liveness: ChannelLiveness | None = None
+    __streams: StreamUrlResolver | None = None
+    __watching = False
+
+    def __watch(self):
+        if not self.__watching and isinstance(self, connection.Connection):
+            self._disconnect_callbacks.append(self.__clear)
+            self.__watching = True
+
+    def __clear(self):
+        # the trackers can be replaced, clear the current ones
+        if self.__liveness is not None:
+            self.__liveness.clear()
+        if self.__streams is not None:
+            self.__streams.clear()
+
+    @property
+    def channel_liveness(self):
+        """online channel tracker"""
+
+        if self.__liveness is None:
+            self.__watch()
+            self.__liveness = ChannelLiveness()
+        return self.__liveness
+
+    @channel_liveness.setter
+    def channel_liveness(self, value: ChannelLiveness):
+        self.__watch()
+        self.__liveness = value
+
+    def __stream_urls(self):
+        if self.__streams is None:
+            self.__watch()
+            self.__streams = StreamUrlResolver()
+        return self.__streams
+
     def _create_get_channel_status_request(self):
         return commands.GetChannelStatusRequest()
 
+    async def get_online_channels(self) -> list[int]:
+        """Get ids of online channels, single channel devices report channel 0
+
+        offline channels due for a re-probe are included
+        """
+
+        liveness = self.channel_liveness
+        if liveness.stale:
+            try:
+                statuses = await self.get_channel_status()
+            except ReolinkResponseError as error:
+                # only devices without channel statuses fall back to channel 0
+                if error.code != ErrorCodes.NOT_SUPPORTED:
+                    raise
+                liveness.single()
+            else:
+                liveness.update(statuses)
+        return liveness.channels()
+
     def _create_get_local_link_request(self):
         return commands.GetLocalLinkRequest()
 
@@ -26,13 +91,70 @@ class Network(network.Network):
     def _create_get_rtsp_urls_request(self, channel_id: int = 0):
         return commands.GetRTSPUrlsRequest(channel_id)
 
-    async def get_rtmp_url(self, channel: int = 0, stream: StreamTypes = ...):
-        url = await super().get_rtmp_url(channel, stream)
-        if isinstance(self, security.Security):
-            token = self._auth_token
-            if token is not None:
-                url += f"&token={token}"
-        return url
+    async def get_rtsp_urls(self, channels: Iterable[int] | None = None):
+        """Get RTSP Urls of several channels in one request"""
+
+        urls = await gather_channels(
+            self,
+            channels,
+            self._create_get_rtsp_urls_request,
+            commands.GetRTSPUrlsResponse,
+            lambda response: response.urls,
+        )
+        streams = self.__stream_urls()
+        for channel, value in urls.items():
+            streams.set_rtsp_urls(channel, value)
+        return urls
+
+    async def get_ports(self):
+        ports = await super().get_ports()
+        self.__stream_urls().set_ports(ports.rtsp.value, ports.rtmp.value)
+        return ports
+
+    async def get_stream_url(
+        self,
+        channel: int = 0,
+        stream: StreamTypes = StreamTypes.MAIN,
+        protocol: StreamProtocols = StreamProtocols.RTSP,
+    ):
+        """Get stream url, ports and rtsp paths are only queried once per
+        connection"""
+
+        if not isinstance(self, connection.Connection):
+            raise ReolinkResponseError("Get stream url failed")
+        streams = self.__stream_urls()
+        if not streams.has_ports:
+            try:
+                await self.get_ports()
+            except ReolinkResponseError:
+                streams.set_ports(DEFAULT_RTSP_PORT, DEFAULT_RTMP_PORT)
+        if protocol == StreamProtocols.RTSP and not streams.has_rtsp_paths(channel):
+            # the path depends on the encoding (h264/h265) of the stream
+            try:
+                urls = await self.get_rtsp_urls([channel])
+            except ReolinkResponseError:
+                urls = {}
+            streams.set_rtsp_urls(channel, urls.get(channel, None))
+        return streams.resolve(
+            protocol,
+            self.hostname,
+            self.base_url,
+            self._auth_token if isinstance(self, security.Security) else None,
+            channel,
+            stream,
+        )
+
+    async def get_rtmp_url(
+        self, channel: int = 0, stream: StreamTypes = StreamTypes.MAIN
+    ):
+        return await self.get_stream_url(channel, stream, StreamProtocols.RTMP)
+
+    async def get_flv_url(
+        self, channel: int = 0, stream: StreamTypes = StreamTypes.MAIN
+    ):
+        """Get HTTP-FLV Url"""
+
+        return await self.get_stream_url(channel, stream, StreamProtocols.FLV)
 
     def _create_get_wifi_info_request(self):
         return commands.GetWifiInfoRequest()
@@ -0,0 +1,108 @@
+"""Channel Liveness"""
+
+from time import monotonic
+from typing import Callable, Final, Mapping
+
+from async_reolink.api.network.typings import ChannelStatus
+
+DEFAULT_REFRESH_INTERVAL: Final = 60.0
+DEFAULT_MIN_BACKOFF: Final = 5.0
+DEFAULT_MAX_BACKOFF: Final = 300.0
+
+
+class ChannelLiveness:
+    """Tracks online channels of a device
+
+    offline channels are left out of per channel requests and re-probed on
+    an exponential backoff schedule
+    """
+
+    __slots__ = (
+        "refresh_interval",
+        "min_backoff",
+        "max_backoff",
+        "_clock",
+        "_channels",
+        "_offline",
+        "_updated",
+    )
+
+    def __init__(
+        self,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        min_backoff: float = DEFAULT_MIN_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._channels: list[int] = []
+        # channel -> (next probe, backoff)
+        self._offline: dict[int, tuple[float, float]] = {}
+        self._updated: float | None = None
+
+    @property
+    def stale(self):
+        """channel statuses need a refresh"""
+
+        return (
+            self._updated is None
+            or self._clock() - self._updated >= self.refresh_interval
+        )
+
+    def update(self, statuses: Mapping[int, ChannelStatus]):
+        """update from channel statuses"""
+
+        now = self._clock()
+        self._updated = now
+        self._channels = list(statuses)
+        for channel in self._channels:
+            if statuses[channel].online:
+                self._offline.pop(channel, None)
+            elif channel not in self._offline:
+                self._offline[channel] = (now + self.min_backoff, self.min_backoff)
+        for channel in set(self._offline).difference(self._channels):
+            del self._offline[channel]
+
+    def single(self):
+        """device has no channel statuses, only channel 0"""
+
+        self._updated = self._clock()
+        self._channels = [0]
+        self._offline.clear()
+
+    def is_online(self, channel: int):
+        """channel is known to be online"""
+
+        return channel not in self._offline
+
+    def channels(self):
+        """online channels and offline channels due for a probe"""
+
+        now = self._clock()
+        offline = self._offline
+        return [
+            _c for _c in self._channels if _c not in offline or offline[_c][0] <= now
+        ]
+
+    def report(self, channel: int, success: bool):
+        """record result of a request to channel
+
+        only failed probes of offline channels extend the backoff, an error
+        from an online channel can just be an unsupported command
+        """
+
+        if success:
+            self._offline.pop(channel, None)
+        elif (entry := self._offline.get(channel, None)) is not None:
+            backoff = min(entry[1] * 2, self.max_backoff)
+            self._offline[channel] = (self._clock() + backoff, backoff)
+
+    def clear(self):
+        """forget all channel state"""
+
+        self._channels = []
+        self._offline.clear()
+        self._updated = None
@@ -0,0 +1,126 @@
+"""Stream Url Resolver"""
+
+from typing import Final, Mapping
+from urllib.parse import quote, urlsplit
+
+from async_reolink.api.typings import StreamTypes
+
+from .typings import StreamProtocols
+
+DEFAULT_RTSP_PORT: Final = 554
+DEFAULT_RTMP_PORT: Final = 1935
+
+_STREAM_NAMES: Final = {_s: _s.name.lower() for _s in StreamTypes}
+
+
+def _port(port: int, default: int):
+    return f":{port}" if port not in (0, default) else ""
+
+
+class StreamUrlResolver:
+    """Computes and caches stream urls per (protocol, channel, stream)
+
+    urls are dropped whenever the connection, token or ports change. rtsp
+    paths are taken from the device (GetRtspUrl) when it reports them, the
+    h264Preview path is only used for devices that do not
+    """
+
+    __slots__ = ("_urls", "_key", "_rtsp_paths", "rtsp_port", "rtmp_port")
+
+    def __init__(self) -> None:
+        self._urls: dict[tuple[StreamProtocols, int, StreamTypes], str] = {}
+        self._key: tuple[str, str, str] | None = None
+        self._rtsp_paths: dict[int, dict[StreamTypes, str]] = {}
+        self.rtsp_port: int | None = None
+        self.rtmp_port: int | None = None
+
+    @property
+    def has_ports(self):
+        """device ports are known"""
+        return self.rtsp_port is not None and self.rtmp_port is not None
+
+    def set_ports(self, rtsp: int, rtmp: int):
+        """update device ports"""
+
+        if (rtsp, rtmp) != (self.rtsp_port, self.rtmp_port):
+            self.rtsp_port = rtsp
+            self.rtmp_port = rtmp
+            self._urls.clear()
+
+    def has_rtsp_paths(self, channel: int):
+        """rtsp paths of channel were set"""
+        return channel in self._rtsp_paths
+
+    def set_rtsp_urls(self, channel: int, urls: Mapping[StreamTypes, str] | None):
+        """update rtsp urls reported by the device for channel, None or empty
+        when the device does not report them"""
+
+        paths = {}
+        for stream, url in (urls or {}).items():
+            if url:
+                # the device may report an address not reachable from here
+                parts = urlsplit(url)
+                paths[stream] = parts.path + (f"?{parts.query}" if parts.query else "")
+        if paths != self._rtsp_paths.get(channel, None):
+            self._rtsp_paths[channel] = paths
+            self._urls.clear()
+
+    def clear(self):
+        """drop cached urls, paths and ports"""
+
+        self._urls.clear()
+        self._key = None
+        self._rtsp_paths.clear()
+        self.rtsp_port = None
+        self.rtmp_port = None
+
+    def _build(
+        self,
+        protocol: StreamProtocols,
+        hostname: str,
+        base_url: str,
+        token: str,
+        channel: int,
+        stream: StreamTypes,
+    ):
+        name = _STREAM_NAMES[stream]
+        rtmp_port = self.rtmp_port or DEFAULT_RTMP_PORT
+        _token = f"&token={quote(token, safe='')}" if token else ""
+        if protocol == StreamProtocols.RTSP:
+            port = _port(self.rtsp_port or DEFAULT_RTSP_PORT, DEFAULT_RTSP_PORT)
+            if (path := self._rtsp_paths.get(channel, {}).get(stream, None)) is None:
+                path = f"/h264Preview_{(channel + 1):02}_{name}"
+            return f"rtsp://{hostname}{port}{path}"
+        if protocol == StreamProtocols.RTMP:
+            port = _port(rtmp_port, DEFAULT_RTMP_PORT)
+            return (
+                f"rtmp://{hostname}{port}/bcs/channel{channel}_{name}.bcs"
+                f"?channel={channel}&stream={name}{_token}"
+            )
+        return (
+            f"{base_url}/flv?port={rtmp_port}&app=bcs"
+            f"&stream=channel{channel}_{name}.bcs{_token}"
+        )
+
+    def resolve(
+        self,
+        protocol: StreamProtocols,
+        hostname: str,
+        base_url: str,
+        token: str | None,
+        channel: int = 0,
+        stream: StreamTypes = StreamTypes.MAIN,
+    ):
+        """url for stream"""
+
+        token = token or ""
+        if (key := (hostname, base_url, token)) != self._key:
+            self._urls.clear()
+            self._key = key
+        try:
+            return self._urls[(protocol, channel, stream)]
+        except KeyError:
+            pass
+        url = self._build(protocol, hostname, base_url, token, channel, stream)
+        self._urls[(protocol, channel, stream)] = url
+        return url
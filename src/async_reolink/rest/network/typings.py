@@ -1,5 +1,6 @@
 """REST Network Typings"""
 
+from enum import Enum, auto
 from types import MappingProxyType
 from typing import Final
 
@@ -12,3 +13,12 @@ STR_LINKTYPES_MAP: Final = MappingProxyType(
 LINKTYPES_STR_MAP: Final = MappingProxyType(
     {_v: _k for _k, _v in STR_LINKTYPES_MAP.items()}
 )
+
+
+class StreamProtocols(Enum):
+    """Stream Protocols"""
+
+    RTSP = auto()
+    RTMP = auto()
+    FLV = auto()
+    """HTTP-FLV"""
@@ -0,0 +1,189 @@
+"""Capability aware Batch Planner"""
+
+from __future__ import annotations
+
+from json import dumps
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from async_reolink.api.commands import CommandRequest
+from async_reolink.api.system.capabilities import Capabilities, ChannelCapabilities
+
+from .batching import DEFAULT_BATCH_LIMIT
+from .commands import ai, alarm, encoding, led, network, ptz, record, system
+
+if TYPE_CHECKING:
+    from .connection import Connection
+
+Requirement = Callable[[Capabilities, ChannelCapabilities | None], bool]
+
+_requirements: dict[type, Requirement | None] = {}
+_resolved: dict[type, Requirement | None] = {}
+
+
+def register_requirement(request_type: type, requirement: Requirement | None):
+    """register the capability check for a request type (and subclasses)"""
+
+    _requirements[request_type] = requirement
+    _resolved.clear()
+
+
+def resolve_requirement(request_type: type):
+    """capability check for request type, None when always supported"""
+
+    try:
+        return _resolved[request_type]
+    except KeyError:
+        pass
+    requirement = None
+    for _type in request_type.__mro__:
+        if _type in _requirements:
+            requirement = _requirements[_type]
+            break
+    _resolved[request_type] = requirement
+    return requirement
+
+
+def _channel(check: Callable[[ChannelCapabilities], any]) -> Requirement:
+    def _requirement(_: Capabilities, channel: ChannelCapabilities | None):
+        return channel is not None and bool(check(channel))
+
+    return _requirement
+
+
+def _device(check: Callable[[Capabilities], any]) -> Requirement:
+    def _requirement(capabilities: Capabilities, _: ChannelCapabilities | None):
+        return bool(check(capabilities))
+
+    return _requirement
+
+
+for _types, _requirement in (
+    (
+        (ai.GetAiStateRequest, ai.GetAiConfigRequest, ai.SetAiConfigRequest),
+        _channel(lambda _c: _c.supports.ai),
+    ),
+    (
+        (alarm.GetMotionStateRequest,),
+        _channel(lambda _c: _c.alarm.motion or _c.supports.motion_detection),
+    ),
+    ((encoding.GetEncodingRequest,), _channel(lambda _c: _c.enc)),
+    (
+        (led.GetIrLightsRequest, led.SetIrLightsRequest),
+        _channel(lambda _c: _c.led_control),
+    ),
+    (
+        (led.GetPowerLedRequest, led.SetPowerLedRequest),
+        _channel(lambda _c: _c.power_led),
+    ),
+    (
+        (led.GetWhiteLedRequest, led.SetWhiteLedRequest),
+        _channel(lambda _c: _c.floodlight),
+    ),
+    ((network.GetLocalLinkRequest,), _device(lambda _c: _c.local_link)),
+    ((network.GetP2PRequest,), _device(lambda _c: _c.p2p)),
+    (
+        (network.GetWifiInfoRequest, network.GetWifiSignalRequest),
+        _device(lambda _c: _c.wifi),
+    ),
+    ((network.GetRTSPUrlsRequest,), _device(lambda _c: _c.rtsp)),
+    (
+        (ptz.GetPresetRequest, ptz.SetPresetRequest),
+        _channel(lambda _c: _c.ptz.preset),
+    ),
+    (
+        (ptz.GetPatrolRequest, ptz.SetPatrolRequest),
+        _channel(lambda _c: _c.ptz.patrol),
+    ),
+    (
+        (ptz.GetTatternRequest, ptz.SetTatternRequest),
+        _channel(lambda _c: _c.ptz.tattern),
+    ),
+    (
+        (ptz.GetAutoFocusRequest, ptz.SetAutoFocusRequest),
+        _channel(lambda _c: _c.disable_autofocus),
+    ),
+    (
+        (ptz.GetZoomFocusRequest, ptz.SetZoomFocusRequest),
+        _channel(lambda _c: _c.ptz.control),
+    ),
+    ((ptz.SetControlRequest,), _channel(lambda _c: _c.ptz.type)),
+    ((record.GetSnapshotRequest,), _channel(lambda _c: _c.snap)),
+    ((record.SearchRecordingsRequest,), _channel(lambda _c: _c.record.replay)),
+    ((system.GetDeviceInfoRequest,), _device(lambda _c: _c.device.info)),
+    ((system.GetHddInfoRequest,), _device(lambda _c: _c.sd_card or _c.disk)),
+    ((system.RebootRequest,), _device(lambda _c: _c.reboot)),
+):
+    for _type in _types:
+        register_requirement(_type, _requirement)
+del _types, _requirement
+
+
+def _request_key(request: CommandRequest):
+    if (get_request := getattr(request, "_get_request", None)) is not None:
+        return dumps(get_request(), sort_keys=True)
+    return None
+
+
+class BatchPlanner:
+    """Plans minimal batches from desired requests and device capabilities
+
+    batches are sized by the (learned) batch limit of the connection
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def batch_size(connection: Connection | None = None):
+        """maximum batch size for connection"""
+
+        if connection is None:
+            return DEFAULT_BATCH_LIMIT
+        return connection.batch_limit
+
+    @staticmethod
+    def is_supported(request: CommandRequest, capabilities: Capabilities):
+        """check if device capabilities support request"""
+
+        if (requirement := resolve_requirement(type(request))) is None:
+            return True
+        channel = None
+        if (channel_id := getattr(request, "channel_id", None)) is not None:
+            channels = capabilities.channels
+            if 0 <= channel_id < len(channels):
+                channel = channels[channel_id]
+        return requirement(capabilities, channel)
+
+    def filter(self, requests: Iterable[CommandRequest], capabilities: Capabilities):
+        """supported and unique requests, in request order"""
+
+        seen: set[str] = set()
+        for request in requests:
+            if capabilities is not None and not self.is_supported(
+                request, capabilities
+            ):
+                continue
+            if (key := _request_key(request)) is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield request
+
+    def plan(
+        self,
+        requests: Iterable[CommandRequest],
+        capabilities: Capabilities | None = None,
+        connection: Connection | None = None,
+    ):
+        """minimal batches for requests supported by capabilities"""
+
+        size = max(self.batch_size(connection), 1)
+        batches: list[list[CommandRequest]] = []
+        batch: list[CommandRequest] = []
+        for request in self.filter(requests, capabilities):
+            if len(batch) >= size:
+                batches.append(batch)
+                batch = []
+            batch.append(request)
+        if batch:
+            batches.append(batch)
+        return batches
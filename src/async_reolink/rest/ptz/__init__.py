@@ -1,5 +1,7 @@
 """REST PTZ Mixin"""
 
+from typing import Iterable
+
 from async_reolink.api import ptz
 from async_reolink.api.ptz.typings import (
     Patrol,
@@ -11,12 +13,45 @@ from async_reolink.api.ptz.typings import (
 
 from async_reolink.rest.ptz.models import MutablePatrol
 
+from .._utilities.channels import gather_channels
 from ..commands import ptz as commands
+from .control import DEFAULT_KEEPALIVE, PTZControlSession
+from .sync import PTZSpec, PTZSync
+from .tracker import MoveEstimator, PTZTracker
 
 
 class PTZ(ptz.PTZ):
     """REST PTZ Mixin"""
 
+    # created on first use, most clients never track positions
+    __move_estimator: MoveEstimator | None = None
+    __trackers: dict[int, PTZTracker] | None = None
+
+    @property
+    def ptz_move_estimator(self):
+        """learned preset move durations, can be shared between devices"""
+
+        if self.__move_estimator is None:
+            self.__move_estimator = MoveEstimator()
+        return self.__move_estimator
+
+    @ptz_move_estimator.setter
+    def ptz_move_estimator(self, value: MoveEstimator):
+        self.__move_estimator = value
+        for tracker in (self.__trackers or {}).values():
+            tracker.estimator = value
+
+    def ptz_tracker(self, channel: int = 0):
+        """position tracker of channel"""
+
+        if self.__trackers is None:
+            self.__trackers = {}
+        if (tracker := self.__trackers.get(channel)) is None:
+            tracker = self.__trackers[channel] = PTZTracker(
+                self, channel, self.ptz_move_estimator
+            )
+        return tracker
+
     def _create_get_ptz_autofocus_request(self, channel: int):
         return commands.GetAutoFocusRequest(channel)
 
@@ -44,6 +79,17 @@ class PTZ(ptz.PTZ):
     def _create_get_ptz_zoom_focus_request(self, channel: int):
         return commands.GetZoomFocusRequest(channel)
 
+    async def get_ptz_zoom_focuses(self, channels: Iterable[int] | None = None):
+        """Get PTZ Zoom and Focus of several channels in one request"""
+
+        return await gather_channels(
+            self,
+            channels,
+            self._create_get_ptz_zoom_focus_request,
+            commands.GetZoomFocusResponse,
+            lambda response: response.state,
+        )
+
     def _create_set_ptz_zoomfocus_request(
         self, channel: int, operation: ZoomOperation, position: int
     ):
@@ -56,4 +102,16 @@ class PTZ(ptz.PTZ):
         speed: int | None,
         preset_id: int | None,
     ):
-        return commands.SetControlRequest(operation, speed, preset_id, channel)
+        return commands.SetControlRequest(operation, preset_id, speed, channel)
+
+    def ptz_control_session(
+        self, channel: int = 0, keepalive: float | None = DEFAULT_KEEPALIVE
+    ):
+        """Joystick style PTZ control, coalescing moves and sending stops at once"""
+
+        return PTZControlSession(self, channel, keepalive)
+
+    async def sync_ptz(self, spec: PTZSpec, channel: int = 0):
+        """Write the presets, patrols and tracks of spec that differ"""
+
+        return await PTZSync(spec, channel).apply(self)
@@ -0,0 +1,155 @@
+"""PTZ Control Session"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Final
+
+from async_reolink.api.errors import ReolinkError
+from async_reolink.api.ptz.typings import Operation
+
+from ..errors import CONNECTION_ERRORS
+
+if TYPE_CHECKING:
+    from . import PTZ
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_KEEPALIVE: Final = 10
+
+Move = tuple[Operation, int | None]
+
+
+class PTZControlSession:
+    """Joystick style control of one channel
+
+    moves are coalesced, while a request is in flight only the latest
+    (operation, speed) is kept and a repeat of the current move is not resent.
+    stop is sent at once, dropping any queued move, and sent again after a
+    move that was still in flight. while idle the connection is kept warm by
+    reading the zoom/focus position every keepalive seconds
+    """
+
+    __slots__ = (
+        "channel",
+        "keepalive",
+        "sent",
+        "coalesced",
+        "last_error",
+        "_client",
+        "_pending",
+        "_current",
+        "_stops",
+        "_wake",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        client: "PTZ",
+        channel: int = 0,
+        keepalive: float | None = DEFAULT_KEEPALIVE,
+    ) -> None:
+        self.channel = channel
+        self.keepalive = keepalive
+        self.sent = 0
+        """control requests sent"""
+        self.coalesced = 0
+        """moves superseded before they were sent"""
+        self.last_error: Exception | None = None
+        self._client = client
+        self._pending: Move | None = None
+        self._current: Move | None = None
+        self._stops = 0
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def moving(self):
+        """last sent move, None when stopped"""
+        return self._current
+
+    async def _send(self, operation: Operation, speed: int | None):
+        self.sent += 1
+        await self._client.ptz_control(operation, speed, None, self.channel)
+
+    async def _ping(self):
+        try:
+            await self._client.get_ptz_zoom_focus(self.channel)
+        except (ReolinkError, *CONNECTION_ERRORS) as error:
+            _LOGGER.debug("ptz keepalive failed: %s", error)
+
+    async def _run(self):
+        while True:
+            if (move := self._pending) is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.keepalive)
+                except asyncio.TimeoutError:
+                    await self._ping()
+                continue
+            self._pending = None
+            if move == self._current:
+                continue
+            stops = self._stops
+            try:
+                await self._send(*move)
+            except (ReolinkError, *CONNECTION_ERRORS) as error:
+                _LOGGER.warning("ptz move failed: %s", error)
+                self.last_error = error
+                continue
+            if stops != self._stops:
+                # a stop overtook this move
+                try:
+                    await self._send(Operation.STOP, None)
+                except (ReolinkError, *CONNECTION_ERRORS) as error:
+                    self.last_error = error
+                continue
+            self._current = move
+
+    def start(self):
+        """start sending moves"""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def move(self, operation: Operation, speed: int | None = None):
+        """queue a move, replacing any move not yet sent"""
+
+        if operation == Operation.STOP:
+            raise ValueError("use stop()")
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = (operation, speed)
+        self._wake.set()
+        self.start()
+
+    async def stop(self):
+        """stop now, ahead of any queued move"""
+
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = None
+        self._current = None
+        self._stops += 1
+        await self._send(Operation.STOP, None)
+
+    async def close(self):
+        """stop sending, stopping the camera if it is moving"""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._current is not None:
+            await self.stop()
+        self._pending = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
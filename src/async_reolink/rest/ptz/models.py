@@ -114,18 +114,23 @@ class MutablePreset(Preset):
 
     @Preset.channel_id.setter
     def channel_id(self, value):
-        if (value := self._factory(True)) is not None:
-            value[_CHANNEL_KEY] = value
+        if (_value := self._factory(True)) is not None:
+            _value[_CHANNEL_KEY] = value
 
     @Preset.id.setter
     def id(self, value):
-        if (value := self._factory(True)) is not None:
-            value[_ID_KEY] = value
+        if (_value := self._factory(True)) is not None:
+            _value[_ID_KEY] = value
+
+    @Preset.enabled.setter
+    def enabled(self, value):
+        if (_value := self._factory(True)) is not None:
+            _value[_ENABLE_KEY] = 1 if value else 0
 
     @Preset.name.setter
     def name(self, value):
-        if (value := self._factory(True)) is not None:
-            value[_NAME_KEY] = value
+        if (_value := self._factory(True)) is not None:
+            _value[_NAME_KEY] = value
 
 
 _DWELL_TIME_KEY: Final = "dwellTime"
@@ -200,15 +205,15 @@ class MutablePatrolPreset(PatrolPreset):
 
     @PatrolPreset.dwell_time.setter
     def dwell_time(self, value):
-        if (value := self._factory(True)) is not None:
-            value[_DWELL_TIME_KEY] = value
+        if (_value := self._factory(True)) is not None:
+            _value[_DWELL_TIME_KEY] = value
 
-    preset_id = Preset.id
+    preset_id = MutablePreset.id
 
     @PatrolPreset.speed.setter
     def speed(self, value):
-        if (value := self._factory(True)) is not None:
-            value[_SPEED_KEY] = value
+        if (_value := self._factory(True)) is not None:
+            _value[_SPEED_KEY] = value
 
 
 class _PatrolPresets(Sequence[PatrolPreset]):
@@ -230,6 +235,10 @@ class _PatrolPresets(Sequence[PatrolPreset]):
             return 0
         return len(value)
 
+    def __iter__(self):
+        # items are lazy and never raise IndexError, so bound by length
+        return (self[_i] for _i in range(len(self)))
+
 
 class _MutablePatrolPresets(MutableSequence[MutablePatrolPreset]):
     __slots__ = ("_factory",)
@@ -238,8 +247,8 @@ class _MutablePatrolPresets(MutableSequence[MutablePatrolPreset]):
         self._factory = factory
 
     def __getitem__(self, __k: int):
-        def _factory():
-            if (value := self._factory()) is None:
+        def _factory(create=False):
+            if (value := self._factory(create)) is None:
                 return None
             return value[__k]
 
@@ -275,6 +284,10 @@ class _MutablePatrolPresets(MutableSequence[MutablePatrolPreset]):
             return 0
         return len(value)
 
+    def __iter__(self):
+        # items are lazy and never raise IndexError, so bound by length
+        return (self[_i] for _i in range(len(self)))
+
 
 _PRESET_KEY: Final = "preset"
 _RUNNING_KEY: Final = "running"
@@ -358,7 +371,7 @@ class MutablePatrol(Patrol):
             return None
         if _key in value or not create:
             return value.get(_key, None)
-        return value.setdefault(_key, {})
+        return value.setdefault(_key, [])
 
     @property
     def presets(self):
@@ -371,6 +384,11 @@ class MutablePatrol(Patrol):
         for preset in value:
             _presets.append(preset)
 
+    @Patrol.running.setter
+    def running(self, value):
+        if (_value := self._factory(True)) is not None:
+            _value[_RUNNING_KEY] = 1 if value else 0
+
 
 class Track(typings.Track):
     """REST Track (Tattern)"""
@@ -0,0 +1,177 @@
+"""PTZ Preset/Patrol Synchronization"""
+
+from typing import TYPE_CHECKING, Iterable
+
+from async_reolink.api.commands import CommandErrorResponse, CommandRequest
+from async_reolink.api.ptz.typings import Patrol, Preset, Track
+
+from ..commands import ptz as commands
+from ..fleet import FleetExecutor
+from .models import MutablePatrol, MutablePreset, MutableTrack
+
+if TYPE_CHECKING:
+    from . import PTZ
+
+
+def _preset_key(preset: Preset):
+    # disabled entries are deleted on the device, only their state matters
+    if not preset.enabled:
+        return (False,)
+    return (True, preset.name)
+
+
+def _patrol_key(patrol: Patrol):
+    if not patrol.enabled:
+        return (False,)
+    return (
+        True,
+        patrol.name,
+        tuple((_p.preset_id, _p.dwell_time, _p.speed) for _p in patrol.presets),
+    )
+
+
+_track_key = _preset_key
+
+
+class PTZSpec:
+    """Desired presets, patrols and tracks of a channel
+
+    entries are keyed by id, entries of the device not in the spec are left
+    as they are
+    """
+
+    __slots__ = ("presets", "patrols", "tracks")
+
+    def __init__(
+        self,
+        presets: Iterable[Preset] = (),
+        patrols: Iterable[Patrol] = (),
+        tracks: Iterable[Track] = (),
+    ) -> None:
+        self.presets = {_p.id: MutablePreset(_p) for _p in presets}
+        self.patrols = {_p.id: MutablePatrol(_p) for _p in patrols}
+        self.tracks = {_t.id: MutableTrack(_t) for _t in tracks}
+
+
+class PTZSyncPlan:
+    """Entries of a spec that differ from the device"""
+
+    __slots__ = ("channel", "presets", "patrols", "tracks")
+
+    def __init__(
+        self,
+        channel: int,
+        presets: list[MutablePreset],
+        patrols: list[MutablePatrol],
+        tracks: list[MutableTrack],
+    ) -> None:
+        self.channel = channel
+        self.presets = presets
+        self.patrols = patrols
+        self.tracks = tracks
+
+    def __len__(self):
+        return len(self.presets) + len(self.patrols) + len(self.tracks)
+
+    def requests(self, client: "PTZ") -> list[CommandRequest]:
+        """set requests of the changed entries, presets ahead of the patrols
+        using them, all tracks in one request"""
+
+        # pylint: disable=protected-access
+        requests = [
+            client._create_set_ptz_preset_request(self.channel, _p)
+            for _p in self.presets
+        ]
+        requests.extend(
+            client._create_set_ptz_patrol_request(self.channel, _p)
+            for _p in self.patrols
+        )
+        if self.tracks:
+            requests.append(
+                client._create_set_ptz_tatterns_request(self.channel, *self.tracks)
+            )
+        return requests
+
+
+def _changed(desired: dict[int, object], current: Iterable, key) -> list:
+    current = {_c.id: key(_c) for _c in current}
+    return [
+        _d
+        for _id, _d in desired.items()
+        if _id not in current or current[_id] != key(_d)
+    ]
+
+
+class PTZSync:
+    """Bring presets, patrols and tracks of a channel to a spec
+
+    the current entries are read in one request and only the entries that
+    differ are written, in one request. writing an enabled preset stores the
+    current camera position, so presets should be moved to before they are
+    added to a spec and a spec should not re-enable presets on a device that
+    has moved
+    """
+
+    __slots__ = ("spec", "channel")
+
+    def __init__(self, spec: PTZSpec, channel: int = 0) -> None:
+        self.spec = spec
+        self.channel = channel
+
+    def _get_requests(self, client: "PTZ"):
+        # pylint: disable=protected-access
+        requests: list[CommandRequest] = []
+        if self.spec.presets:
+            requests.append(client._create_get_ptz_presets_request(self.channel))
+        if self.spec.patrols:
+            requests.append(client._create_get_ptz_patrols_request(self.channel))
+        if self.spec.tracks:
+            requests.append(client._create_get_ptz_tatterns_request(self.channel))
+        return requests
+
+    async def plan(self, client: "PTZ"):
+        """read the device and return the entries to write"""
+
+        presets: list[MutablePreset] = []
+        patrols: list[MutablePatrol] = []
+        tracks: list[MutableTrack] = []
+        if requests := self._get_requests(client):
+            async for response in client.batch(requests):
+                if isinstance(response, commands.GetPresetResponse):
+                    presets = _changed(
+                        self.spec.presets, response.presets.values(), _preset_key
+                    )
+                elif isinstance(response, commands.GetPatrolResponse):
+                    patrols = _changed(
+                        self.spec.patrols, response.patrols.values(), _patrol_key
+                    )
+                elif isinstance(response, commands.GetTatternResponse):
+                    tracks = _changed(
+                        self.spec.tracks, response.tracks.values(), _track_key
+                    )
+                elif isinstance(response, CommandErrorResponse):
+                    response.throw("Get PTZ Settings failed")
+        return PTZSyncPlan(self.channel, presets, patrols, tracks)
+
+    async def apply(self, client: "PTZ", plan: PTZSyncPlan | None = None):
+        """write the changed entries, planning first if no plan is given"""
+
+        if plan is None:
+            plan = await self.plan(client)
+        if not plan:
+            return plan
+        async for response in client.batch(plan.requests(client)):
+            if isinstance(response, CommandErrorResponse):
+                response.throw("Set PTZ Settings failed")
+        return plan
+
+    async def _plan_requests(self, client: "PTZ"):
+        return (await self.plan(client)).requests(client)
+
+    def fleet(self, clients: Iterable["PTZ"], executor: FleetExecutor | None = None):
+        """synchronize every client, each read and write holding one
+        concurrency slot of the executor"""
+
+        if executor is None:
+            executor = FleetExecutor()
+        return executor.execute(clients, self._plan_requests)
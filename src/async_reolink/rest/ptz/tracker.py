@@ -0,0 +1,305 @@
+"""PTZ State Tracker"""
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Final, Iterable, Mapping
+
+from async_reolink.api.ptz.typings import Operation
+
+if TYPE_CHECKING:
+    from . import PTZ
+
+DEFAULT_MOVE_TIME: Final = 5.0
+DEFAULT_SMOOTHING: Final = 0.3
+DEFAULT_POLL_INTERVAL: Final = 0.5
+DEFAULT_POLL_START: Final = 0.5
+DEFAULT_SETTLE_TIMEOUT: Final = 10.0
+
+Route = tuple[int, int]
+
+
+class MoveEstimator:
+    """Learned preset move durations (seconds)
+
+    an exponentially weighted average per (model, speed) and per preset route
+    of a model, can be shared between devices of the same model
+    """
+
+    __slots__ = ("smoothing", "default", "_durations")
+
+    def __init__(
+        self, smoothing: float = DEFAULT_SMOOTHING, default: float = DEFAULT_MOVE_TIME
+    ) -> None:
+        self.smoothing = smoothing
+        self.default = default
+        self._durations: dict[tuple, float] = {}
+
+    @staticmethod
+    def _route(route: Route | None):
+        # routes are symmetric
+        return None if route is None else (min(route), max(route))
+
+    def estimate(self, model: str, speed: int | None, route: Route | None = None):
+        """expected duration of a move"""
+
+        if route is not None and (
+            duration := self._durations.get((model, speed, self._route(route)))
+        ):
+            return duration
+        return self._durations.get((model, speed, None), self.default)
+
+    def observe(
+        self,
+        model: str,
+        speed: int | None,
+        duration: float,
+        route: Route | None = None,
+    ):
+        """record the duration of a completed move"""
+
+        keys = [(model, speed, None)]
+        if route is not None:
+            keys.append((model, speed, self._route(route)))
+        for key in keys:
+            if (previous := self._durations.get(key)) is None:
+                self._durations[key] = duration
+            else:
+                self._durations[key] = previous + self.smoothing * (duration - previous)
+
+    def clear(self):
+        """forget all durations"""
+
+        self._durations.clear()
+
+
+class PTZTracker:
+    """Last known zoom/focus and preset of a channel
+
+    preset moves are given an estimated arrival and zoom/focus is read right
+    after a move starts. waiting polls zoom/focus from poll_start of the
+    estimate until a reading repeats and learns the time the final reading
+    was first seen, even when that was before polling started, so estimates
+    that are too large shrink as well. zoom/focus does not change on pan/tilt
+    only moves, call arrived() when their arrival is known otherwise
+    """
+
+    __slots__ = (
+        "channel",
+        "estimator",
+        "poll_interval",
+        "poll_start",
+        "settle_timeout",
+        "zoom",
+        "focus",
+        "preset_id",
+        "_client",
+        "_clock",
+        "_target",
+        "_speed",
+        "_route",
+        "_started",
+        "_eta",
+        "_seen",
+    )
+
+    def __init__(
+        self,
+        client: "PTZ",
+        channel: int = 0,
+        estimator: MoveEstimator | None = None,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_start: float = DEFAULT_POLL_START,
+        settle_timeout: float = DEFAULT_SETTLE_TIMEOUT,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.channel = channel
+        self.estimator = estimator if estimator is not None else MoveEstimator()
+        self.poll_interval = poll_interval
+        self.poll_start = poll_start
+        self.settle_timeout = settle_timeout
+        self.zoom: int | None = None
+        self.focus: int | None = None
+        self.preset_id: int | None = None
+        """preset the camera is at, None when unknown or moving"""
+        self._client = client
+        self._clock = clock
+        self._target: int | None = None
+        self._speed: int | None = None
+        self._route: Route | None = None
+        self._started = 0.0
+        self._eta = 0.0
+        self._seen = 0.0
+
+    @property
+    def model(self) -> str:
+        """device model, moves are learned per model"""
+
+        if (key := getattr(self._client, "batch_key", None)) is None:
+            return ""
+        return key[0]
+
+    @property
+    def moving(self):
+        """a preset move is in progress"""
+        return self._target is not None
+
+    @property
+    def target(self):
+        """preset being moved to"""
+        return self._target
+
+    @property
+    def remaining(self):
+        """estimated seconds until the current move completes"""
+
+        if self._target is None:
+            return 0.0
+        return max(self._eta - self._clock(), 0.0)
+
+    def estimate(self, preset_id: int, speed: int | None = None):
+        """estimated duration of a move from the current preset"""
+
+        start = self._target if self._target is not None else self.preset_id
+        if start == preset_id:
+            return self.remaining
+        route = None if start is None else (start, preset_id)
+        return self.remaining + self.estimator.estimate(self.model, speed, route)
+
+    async def refresh(self):
+        """read zoom/focus"""
+
+        state = await self._client.get_ptz_zoom_focus(self.channel)
+        self.zoom = state.zoom
+        self.focus = state.focus
+        return state
+
+    async def to_preset(self, preset_id: int, speed: int | None = None):
+        """start moving to preset, returns the estimated duration"""
+
+        start = self._target if self._target is not None else self.preset_id
+        await self._client.ptz_control(
+            Operation.TO_PRESET, speed, preset_id, self.channel
+        )
+        self._route = None if start is None else (start, preset_id)
+        self._target = preset_id
+        self._speed = speed
+        duration = self.estimator.estimate(self.model, speed, self._route)
+        self._started = self._clock()
+        self._eta = self._started + duration
+        self.preset_id = None
+        await self.refresh()
+        self._seen = self._clock()
+        return duration
+
+    def arrived(self):
+        """mark the current move complete and learn its duration"""
+
+        if self._target is None:
+            return
+        self.estimator.observe(
+            self.model, self._speed, self._clock() - self._started, self._route
+        )
+        self._complete()
+
+    def moved(self):
+        """the camera was moved by other means, the preset is unknown"""
+
+        self._target = None
+        self.preset_id = None
+
+    def _complete(self):
+        self.preset_id = self._target
+        self._target = None
+
+    async def _settle(self):
+        # time the final zoom/focus reading was first seen, None if they did
+        # not settle by the deadline
+        deadline = max(self._eta, self._clock()) + self.settle_timeout
+        while True:
+            before = (self.zoom, self.focus)
+            state = await self.refresh()
+            now = self._clock()
+            if (state.zoom, state.focus) == before:
+                return self._seen
+            self._seen = now
+            if now >= deadline:
+                return None
+            await asyncio.sleep(self.poll_interval)
+
+    async def wait(self, settle: bool = True):
+        """wait for the current move to complete, returns its duration"""
+
+        if self._target is None:
+            return 0.0
+        arrival = None
+        if settle:
+            # polling ahead of the estimate sees moves that are faster
+            start = self._started + (self._eta - self._started) * self.poll_start
+            await asyncio.sleep(max(start - self._clock(), 0.0))
+            arrival = await self._settle()
+        else:
+            await asyncio.sleep(self.remaining)
+        if arrival is None:
+            duration = self._clock() - self._started
+        else:
+            duration = arrival - self._started
+            self.estimator.observe(self.model, self._speed, duration, self._route)
+        self._complete()
+        return duration
+
+
+def tour_duration(
+    tracker: PTZTracker,
+    presets: Iterable[int],
+    dwell: float,
+    speed: int | None = None,
+):
+    """estimated duration of a tour"""
+
+    total = 0.0
+    start = tracker.target if tracker.moving else tracker.preset_id
+    for preset_id in presets:
+        if start != preset_id:
+            route = None if start is None else (start, preset_id)
+            total += tracker.estimator.estimate(tracker.model, speed, route)
+        total += dwell
+        start = preset_id
+    return total + tracker.remaining
+
+
+async def run_tour(
+    tracker: PTZTracker,
+    presets: Iterable[int],
+    dwell: float,
+    speed: int | None = None,
+    *,
+    settle: bool = True,
+):
+    """visit presets in order, staying dwell seconds after each arrival"""
+
+    for preset_id in presets:
+        if tracker.moving:
+            await tracker.wait(settle)
+        if tracker.preset_id != preset_id:
+            await tracker.to_preset(preset_id, speed)
+            await tracker.wait(settle)
+        await asyncio.sleep(dwell)
+
+
+async def run_tours(
+    tours: Mapping[PTZTracker, Iterable[int]],
+    dwell: float,
+    speed: int | None = None,
+    *,
+    settle: bool = True,
+):
+    """run tours of several cameras concurrently, each camera only waits for
+    its own moves"""
+
+    await asyncio.gather(
+        *(
+            run_tour(_tracker, _presets, dwell, speed, settle=settle)
+            for _tracker, _presets in tours.items()
+        )
+    )
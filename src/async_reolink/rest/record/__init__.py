@@ -1,44 +1,66 @@
 """REST Record"""
 
 from datetime import datetime
-from typing import Sequence
 from async_reolink.api.typings import StreamTypes
-from async_reolink.api.commands import (
-    CommandRequest,
-)
+from async_reolink.api.connection import Connection as BaseConnection
 from async_reolink.api.record import Record as BaseRecord, typings
 
 from async_reolink.rest.record.models import MutableSearch
 
-from ..commands import _COMMAND_KEY, record
-from .seed import Seed
-
-
-from .. import connection
+from ..commands import record
+from .cache import SnapshotCache
+from .seed import CounterSeed, Seed
 
 
 class Record(BaseRecord):
     """REST Record Mixin"""
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        if isinstance(self, connection.Connection):
-            self._force_get_callbacks.append(self.__force_get_login)
+    # created on first use, most clients keep the defaults
+    __snapshot_cache: SnapshotCache | None = None
+    __snapshot_seed: Seed | CounterSeed | None = None
 
-    def __force_get_login(
-        self, _: str, query: dict[str, str], commands: Sequence[CommandRequest]
-    ):
-        command = commands[0]
-        if len(commands) > 1 or not isinstance(command, record.GetSnapshotRequest):
-            return
-        query[_COMMAND_KEY] = command.command
-        query.update(command.raw_parameter)
-        query["rs"] = str(Seed())
-        return True
+    @property
+    def snapshot_cache(self):
+        """snapshot cache, None to always request a new snapshot"""
+        return self.__snapshot_cache
+
+    @snapshot_cache.setter
+    def snapshot_cache(self, value: SnapshotCache | None):
+        self.__snapshot_cache = value
+
+    @property
+    def snapshot_seed(self):
+        """snapshot cache-busting seed generator"""
+
+        if self.__snapshot_seed is None:
+            self.__snapshot_seed = Seed()
+        return self.__snapshot_seed
+
+    @snapshot_seed.setter
+    def snapshot_seed(self, value: Seed | CounterSeed):
+        self.__snapshot_seed = value
 
     def _create_get_snapshot_request(self, channel: int):
         return record.GetSnapshotRequest(channel)
 
+    async def get_snap(self, channel: int = 0, *, max_age: float | None = None):
+        """get snapshot, possibly from the snapshot cache"""
+
+        if (
+            (cache := self.__snapshot_cache) is None
+            or not isinstance(self, BaseConnection)
+            # without a connection there is nothing to cache
+            or not self.is_connected
+        ):
+            return await super().get_snap(channel)
+
+        _get_snap = super().get_snap
+
+        def _fetch():
+            return _get_snap(channel)
+
+        return await cache.fetch((self.connection_id, channel), _fetch, max_age)
+
     def _create_search_request(self, channel: int, search: typings.Search):
         return record.SearchRecordingsRequest(channel, search)
 
@@ -0,0 +1,127 @@
+"""Snapshot Cache"""
+
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+from typing import Awaitable, Callable, Final, Hashable
+
+DEFAULT_MAX_AGE: Final = 1.0
+DEFAULT_MAX_SIZE: Final = 16 * 1024 * 1024
+
+
+class SnapshotCache:
+    """Snapshot cache with request collapsing
+
+    keys are caller defined (i.e. (device, channel)) so a cache can be shared
+    between clients, total size is bounded by least recently used eviction
+    """
+
+    __slots__ = ("_max_age", "_max_size", "_size", "_entries", "_pending")
+
+    def __init__(
+        self, max_age: float = DEFAULT_MAX_AGE, max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        self._max_age = max_age
+        self._max_size = max_size
+        self._size = 0
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Task[bytes]] = {}
+
+    @property
+    def max_age(self):
+        """maximum age (in seconds) of a cached snapshot"""
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value: float):
+        self._max_age = value
+
+    @property
+    def max_size(self):
+        """maximum total size (in bytes) of cached snapshots"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._max_size = value
+        self._evict()
+
+    @property
+    def size(self):
+        """total size (in bytes) of cached snapshots"""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return self.get(key) is not None
+
+    def _evict(self):
+        while self._size > self._max_size and self._entries:
+            _, (_, data) = self._entries.popitem(last=False)
+            self._size -= len(data)
+
+    def _store(self, key: Hashable, data: bytes):
+        self.invalidate(key)
+        if len(data) > self._max_size:
+            return
+        self._entries[key] = (monotonic(), data)
+        self._size += len(data)
+        self._evict()
+
+    def get(self, key: Hashable, max_age: float | None = None) -> bytes | None:
+        """get a cached snapshot if it is not older than max_age"""
+
+        if (entry := self._entries.get(key, None)) is None:
+            return None
+        if max_age is None:
+            max_age = self._max_age
+        if monotonic() - entry[0] > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def invalidate(self, key: Hashable):
+        """remove a cached snapshot"""
+
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= len(entry[1])
+
+    def clear(self):
+        """remove all cached snapshots"""
+
+        self._entries.clear()
+        self._size = 0
+
+    async def fetch(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[bytes]],
+        max_age: float | None = None,
+    ):
+        """get a cached snapshot or fetch a new one with factory
+
+        callers waiting on the same key share a single call to factory, a
+        cancelled caller does not cancel the fetch for the others. empty
+        results (no snapshot) are returned but not cached
+        """
+
+        if (data := self.get(key, max_age)) is not None:
+            return data
+
+        if (task := self._pending.get(key, None)) is None:
+            task = asyncio.ensure_future(factory())
+            self._pending[key] = task
+
+            def _done(task: asyncio.Task[bytes]):
+                if self._pending.get(key, None) is task:
+                    del self._pending[key]
+                if task.cancelled() or task.exception() is not None:
+                    return
+                if data := task.result():
+                    self._store(key, data)
+
+            task.add_done_callback(_done)
+
+        return await asyncio.shield(task)
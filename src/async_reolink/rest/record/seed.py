@@ -1,16 +1,15 @@
 """Seeding Helper"""
 
-import random
-import string
-
-
-_rnd = random.SystemRandom()
-_RND_SET = string.printable
+from itertools import count
+from secrets import randbelow, token_urlsafe
+from time import time_ns
 
 
 class Seed:
     """Simple Random String Generator"""
 
+    __slots__ = ("_min", "_max")
+
     def __init__(self, _min: int = 16, _max: int = 16) -> None:
         self._min = _min
         self._max = _max
@@ -21,5 +20,31 @@ class Seed:
         return str(self)
 
     def __str__(self) -> str:
-        rng = _rnd.randint(self._min, self._max)
-        return "".join(_rnd.choice(_RND_SET) for _ in range(rng))
+        rng = self._min
+        if self._max > rng:
+            rng += randbelow(self._max - rng + 1)
+        # a single urandom read, base64 (url safe) yields 4 chars per 3 bytes
+        return token_urlsafe((rng * 3 + 3) // 4)[:rng]
+
+
+class CounterSeed:
+    """Monotonic Counter Seed
+
+    cheaper than Seed but predictable, only meant for trusted networks
+    """
+
+    __slots__ = ("_counter",)
+
+    def __init__(self, start: int = None) -> None:
+        if start is None:
+            # start from the clock so restarts do not repeat previous values
+            start = time_ns() // 1000
+        self._counter = count(start)
+
+    @property
+    def value(self):
+        """Get Next Seed Value"""
+        return str(self)
+
+    def __str__(self) -> str:
+        return format(next(self._counter), "x")
@@ -0,0 +1,101 @@
+"""REST Request Routing"""
+
+from __future__ import annotations
+
+from typing import Callable, Final, Mapping
+from urllib.parse import quote, urlencode
+
+from .commands import CommandRequest
+
+API_PATH: Final = "/cgi-bin/api.cgi"
+
+
+class UrlTemplate:
+    """Precompiled Url Template
+
+    static query values are encoded once, fields are filled in at build time
+    and omitted when empty
+    """
+
+    __slots__ = ("_prefix", "_separator", "_fields")
+
+    def __init__(
+        self,
+        path: str,
+        static: Mapping[str, str] | None = None,
+        fields: tuple[str, ...] = (),
+    ) -> None:
+        self._prefix = path + ("?" + urlencode(static) if static else "")
+        self._separator = "&" if static else "?"
+        self._fields = tuple((_f, _f + "=") for _f in fields)
+
+    def build(self, values: Mapping[str, any]) -> str:
+        """build url from field values"""
+
+        url = self._prefix
+        separator = self._separator
+        for field, prefix in self._fields:
+            if (value := values.get(field, None)) is None or value == "":
+                continue
+            url += separator + prefix + quote(str(value), safe="")
+            separator = "&"
+        return url
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self._prefix} {[_f for _f, _ in self._fields]}>"
+
+
+class Route:
+    """Request Route"""
+
+    __slots__ = ("url", "use_get", "params")
+
+    def __init__(
+        self,
+        url: UrlTemplate,
+        use_get: bool = False,
+        params: Callable[[object, CommandRequest], Mapping[str, any]] | None = None,
+    ) -> None:
+        self.url = url
+        self.use_get = use_get
+        self.params = params
+
+    def build_url(
+        self, connection: object, request: CommandRequest, values: Mapping[str, any]
+    ):
+        """build url for request using connection values"""
+
+        if self.params is not None:
+            values = {**values, **self.params(connection, request)}
+        return self.url.build(values)
+
+
+DEFAULT_ROUTE: Final = Route(UrlTemplate(API_PATH, fields=("token",)))
+
+_routes: dict[type, Route] = {}
+_resolved: dict[type, Route] = {}
+
+
+def register_route(request_type: type, route: Route):
+    """register the route used when request_type is sent on its own"""
+
+    _routes[request_type] = route
+    _resolved.clear()
+
+
+def resolve_route(request_type: type) -> Route:
+    """get the route for a request type, resolved once per type"""
+
+    if (route := _resolved.get(request_type, None)) is not None:
+        return route
+    route = next(
+        (_routes[_t] for _t in request_type.__mro__ if _t in _routes), DEFAULT_ROUTE
+    )
+    _resolved[request_type] = route
+    return route
+
+
+def request_route(request: CommandRequest) -> Route:
+    """get the route for a request, templates route like their source"""
+
+    return resolve_route(type(request))
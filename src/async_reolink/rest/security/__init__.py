@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 from time import time
-from typing import Sequence
+from typing import Final
 
+from async_reolink.api.const import DEFAULT_PASSWORD, DEFAULT_USERNAME
 from async_reolink.api.security import Security as BaseSecurity
 from .. import connection
 
-from ..commands import CommandRequest
-from ..commands.security import (
-    LoginRequest,
-    LoginResponse,
-    LogoutRequest,
-    GetUserRequest,
-)
+from ..commands import security as commands
+
+_TOKEN_KEY: Final = "token"
 
 
 class Security(BaseSecurity):
@@ -22,24 +19,19 @@ class Security(BaseSecurity):
     def __init__(self, *args, **kwargs) -> None:
         self.__token = ""
         super().__init__(*args, **kwargs)
-        if isinstance(self, connection.Connection):
-            self._force_get_callbacks.append(self.__force_get_login)
         self.__token_expires: float = 0
         self.__last_pwd_hash = 0
-
-    def __force_get_login(
-        self, url: str, _: dict[str, str], commands: Sequence[CommandRequest]
-    ):
-        if len(commands) > 1 or not isinstance(commands[0], LoginRequest):
-            if self.__token:
-                return (False, url + f"?token={self.__token}")
-            return
-        return url + f"?cmd={commands[0].command}"
+        self.__credentials: tuple[str, str] | None = None
 
     @property
     def _auth_token(self):
         return self.__token
 
+    @property
+    def _credentials(self):
+        """Internal API, (username, password) of the current login"""
+        return self.__credentials
+
     @property
     def is_authenticated(self) -> bool:
         # we use a 1s offest to give time for simple checks to do an operation
@@ -53,6 +45,13 @@ class Security(BaseSecurity):
     def authentication_id(self):
         return self.__last_pwd_hash
 
+    async def login(
+        self, username: str = DEFAULT_USERNAME, password: str = DEFAULT_PASSWORD
+    ) -> bool:
+        if result := await super().login(username, password):
+            self.__credentials = (username, password)
+        return result
+
     async def _prelogin(self, username: str):
         # keep hash of username so we can logout on new info provided
         pwd_hash = hash(username)
@@ -65,23 +64,30 @@ class Security(BaseSecurity):
                 return False
         return True
 
-    async def _process_login(self, response: LoginResponse) -> bool:
+    async def _process_login(self, response: commands.LoginResponse) -> bool:
         token = response.token
 
         self.__token = token.name
         self.__token_expires = time() + token.lease_time
+        if isinstance(self, connection.Connection):
+            self._route_values = {**self._route_values, _TOKEN_KEY: self.__token}
 
         return True
 
     def _create_login_request(self, username: str, password: str):
-        return LoginRequest(username, password)
+        return commands.LoginRequest(username, password)
 
     def _create_logout_request(self):
-        return LogoutRequest()
+        return commands.LogoutRequest()
 
     def _clear_login(self):
         self.__token = ""
         self.__token_expires = 0
+        self.__credentials = None
+        if isinstance(self, connection.Connection):
+            self._route_values = {
+                _k: _v for _k, _v in self._route_values.items() if _k != _TOKEN_KEY
+            }
 
     def _create_get_user_request(self):
-        return GetUserRequest()
+        return commands.GetUserRequest()
@@ -2,6 +2,7 @@
 
 from async_reolink.api import system
 
+from .. import connection
 from ..commands import system as commands
 from .capabilities import Capabilities
 
@@ -29,6 +30,13 @@ class System(system.System):
 
         return commands.DeviceInfo(_factory)
 
+    async def get_device_info(self):
+        info = await super().get_device_info()
+        if isinstance(self, connection.Connection) and info.model:
+            # batch limits are learned per model and firmware
+            self.batch_key = (info.model, info.version.firmware)
+        return info
+
     def _create_get_time_request(self):
         return commands.GetTimeRequest()
 
@@ -1,10 +1,8 @@
 """System capabilities"""
 
 from enum import Flag
-from functools import reduce
-from itertools import chain, combinations
-from types import MappingProxyType
-from typing import Callable, Final, Mapping, TypeVar, overload
+from functools import lru_cache
+from typing import Callable, Final, Generic, Mapping, TypeVar, overload
 from async_reolink.api.system import capabilities
 
 _T = TypeVar("_T")
@@ -16,45 +14,47 @@ _defaults: dict[type, any] = {None: 0}
 
 _F = TypeVar("_F", bound=Flag)
 
+_FLAG_CACHE_SIZE: Final = 32
 
-def _flag_map(__flag_map: dict[int, _F]):
-    def bor(a: _T, b: _T) -> _T:
-        return a | b
 
-    lookup = {_v: _k for _k, _v in __flag_map.items()}
-    values = list(__flag_map.values())
-    for t in chain.from_iterable(
-        combinations(values, i) for i in range(len(values) + 1)
-    ):
-        if len(t) == 0:
-            continue
-        vt = map(lambda f: lookup[f], t)
-        f = reduce(bor, t)
-        v = reduce(bor, vt)
-        __flag_map[v] = f
+def _flag_decoder(__bits: dict[int, _F]) -> Callable[[int], _F | None]:
+    """int -> flag of the set bits, unknown bits are ignored, None if no
+    known bit is set"""
 
-    return __flag_map
+    bits = tuple(__bits.items())
 
+    @lru_cache(maxsize=_FLAG_CACHE_SIZE)
+    def _decode(value: int):
+        flag = None
+        for bit, _flag in bits:
+            if value & bit:
+                flag = _flag if flag is None else flag | _flag
+        return flag
 
-def _map_factory(__map: dict[int, _T], __default: _T = None) -> Callable[[int], _T]:
-    if __default is None and 0 in __map:
-        __default = __map[0]
+    return _decode
 
-    def _factory(value: int):
-        return __map.get(value, __default)
 
-    _defaults[_factory] = __default
-    return _factory
+class _IntMap(Generic[_T]):
+    """int -> value, unknown values map to default (or the value of 0)"""
 
+    __slots__ = ("_map", "_default")
 
-_INT_PERMISSION_MAP: Final = MappingProxyType(
-    _flag_map(
-        {
-            1: capabilities.Permissions.OPTION,
-            2: capabilities.Permissions.WRITE,
-            4: capabilities.Permissions.READ,
-        }
-    )
+    def __init__(self, __map: dict[int, _T], __default: _T = None) -> None:
+        if __default is None and 0 in __map:
+            __default = __map[0]
+        self._map = __map
+        self._default = __default
+
+    def __call__(self, value: int) -> _T:
+        return self._map.get(value, self._default)
+
+
+_INT_PERMISSIONS: Final = _flag_decoder(
+    {
+        1: capabilities.Permissions.OPTION,
+        2: capabilities.Permissions.WRITE,
+        4: capabilities.Permissions.READ,
+    }
 )
 _NO_PERMISSIONS: capabilities.Permissions = None
 
@@ -101,7 +101,7 @@ class Capability(capabilities.Capability[_T]):
     def permissions(self):
         if (value := self._factory()) is None:
             return _NO_PERMISSIONS
-        return _INT_PERMISSION_MAP.get(value.get("permit", 0), _NO_PERMISSIONS)
+        return _INT_PERMISSIONS(value.get("permit", 0))
 
     def __bool__(self):
         if self.permissions is None:
@@ -126,21 +126,19 @@ class Capability(capabilities.Capability[_T]):
         return f"<{self.__class__.__name__}: {repr(self._factory())}>"
 
 
-_INT_CLOUDSTORAGE: Final = _map_factory(
-    _flag_map(
-        {
-            1 << 0: capabilities.CloudStorage.UPLOAD,
-            1 << 1: capabilities.CloudStorage.CONFIG,
-            1 << 3: capabilities.CloudStorage.DEPLOY,
-        }
-    )
+_INT_CLOUDSTORAGE: Final = _flag_decoder(
+    {
+        1 << 0: capabilities.CloudStorage.UPLOAD,
+        1 << 1: capabilities.CloudStorage.CONFIG,
+        1 << 3: capabilities.CloudStorage.DEPLOY,
+    }
 )
 
-_INT_DAYNIGHT: Final = _map_factory(
+_INT_DAYNIGHT: Final = _IntMap(
     {1: capabilities.DayNight.DAY_NIGHT, 2: capabilities.DayNight.THRESHOLD}
 )
 
-_INT_DDNS: Final = _map_factory(
+_INT_DDNS: Final = _IntMap(
     {
         1: capabilities.DDns.SWAN,
         2: capabilities.DDns.THREE322,
@@ -154,7 +152,7 @@ _INT_DDNS: Final = _map_factory(
     }
 )
 
-_INT_EMAIL: Final = _map_factory(
+_INT_EMAIL: Final = _IntMap(
     {
         1: capabilities.Email.JPEG,
         2: capabilities.Email.VIDEO_JPEG,
@@ -162,15 +160,15 @@ _INT_EMAIL: Final = _map_factory(
     }
 )
 
-_INT_ENCODINGTYPE: Final = _map_factory(
+_INT_ENCODINGTYPE: Final = _IntMap(
     {0: capabilities.EncodingType.H264, 1: capabilities.EncodingType.H265}
 )
 
-_INT_FLOODLIGHT: Final = _map_factory(
+_INT_FLOODLIGHT: Final = _IntMap(
     {1: capabilities.FloodLight.WHITE, 2: capabilities.FloodLight.AUTO}
 )
 
-_INT_FTP: Final = _map_factory(
+_INT_FTP: Final = _IntMap(
     {
         1: capabilities.Ftp.STREAM,
         2: capabilities.Ftp.JPEG_STREAM,
@@ -181,23 +179,21 @@ _INT_FTP: Final = _map_factory(
     }
 )
 
-_INT_LIVE: Final = _map_factory(
+_INT_LIVE: Final = _IntMap(
     {1: capabilities.Live.MAIN_EXTERN_SUB, 2: capabilities.Live.MAIN_SUB}
 )
 
-_INT_OSD: Final = _map_factory(
-    {1: capabilities.Osd.SUPPORTED, 2: capabilities.Osd.DISTINCT}
-)
+_INT_OSD: Final = _IntMap({1: capabilities.Osd.SUPPORTED, 2: capabilities.Osd.DISTINCT})
 
-_INT_PTZCONTROL: Final = _map_factory(
+_INT_PTZCONTROL: Final = _IntMap(
     {1: capabilities.PTZControl.ZOOM, 2: capabilities.PTZControl.ZOOM_FOCUS}
 )
 
-_INT_PTZDIRECTION: Final = _map_factory(
+_INT_PTZDIRECTION: Final = _IntMap(
     {0: capabilities.PTZDirection.EIGHT_AUTO, 1: capabilities.PTZDirection.FOUR_NO_AUTO}
 )
 
-_INT_PTZTYPE: Final = _map_factory(
+_INT_PTZTYPE: Final = _IntMap(
     {
         1: capabilities.PTZType.AF,
         2: capabilities.PTZType.PTZ,
@@ -207,26 +203,26 @@ _INT_PTZTYPE: Final = _map_factory(
     }
 )
 
-_INT_RECORDSCHEDULE: Final = _map_factory(
+_INT_RECORDSCHEDULE: Final = _IntMap(
     {1: capabilities.RecordSchedule.MOTION, 2: capabilities.RecordSchedule.MOTION_LIVE}
 )
 
-_INT_SCHEDULEVERSION: Final = _map_factory(
+_INT_SCHEDULEVERSION: Final = _IntMap(
     {0: capabilities.ScheduleVersion.BASIC, 1: capabilities.ScheduleVersion.V20}
 )
 
-_INT_TIME: Final = _map_factory(
+_INT_TIME: Final = _IntMap(
     {
         1: capabilities.Time.SUNDAY,
         2: capabilities.Time.ANYDAY,
     }
 )
 
-_INT_UPGRADE: Final = _map_factory(
+_INT_UPGRADE: Final = _IntMap(
     {1: capabilities.Upgrade.MANUAL, 2: capabilities.Upgrade.ONLINE}
 )
 
-_INT_VIDEOCLIP: Final = _map_factory(
+_INT_VIDEOCLIP: Final = _IntMap(
     {1: capabilities.VideoClip.FIXED, 2: capabilities.VideoClip.MOD}
 )
 
@@ -1,7 +1,74 @@
 """REST Video Mixin"""
 
+from async_reolink.api.const import DEFAULT_TIMEOUT
+from async_reolink.api.errors import ReolinkResponseError
+from async_reolink.api.typings import StreamTypes
 from async_reolink.api.video import Video as BaseVideo
 
+from .. import connection, network, security
+from ..network.typings import StreamProtocols
+from .flv import FlvDemuxer
+from .rtp import DEFAULT_JITTER_SIZE
+from .rtsp import RtspClient
+
 
 class Video(BaseVideo):
     """REST Video Mixin"""
+
+    async def open_flv_stream(
+        self,
+        channel: int = 0,
+        stream: StreamTypes = StreamTypes.MAIN,
+        *,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        keyframes_only: bool = False,
+        rate: float | None = None,
+    ):
+        """Open HTTP-FLV live stream, yields video and audio frames
+
+        keyframes_only yields only parameter sets and keyframes, at most
+        rate keyframes per second when set
+        """
+
+        if not isinstance(self, connection.Connection) or not isinstance(
+            self, network.Network
+        ):
+            raise ReolinkResponseError("Open flv stream failed")
+
+        url = await self.get_flv_url(channel, stream)
+        demuxer = FlvDemuxer(keyframes_only, 1000 / rate if rate else 0)
+        async for chunk in self._open_stream(url, timeout):
+            for frame in demuxer.feed(chunk):
+                yield frame
+
+    async def open_rtsp_stream(
+        self,
+        channel: int = 0,
+        stream: StreamTypes = StreamTypes.MAIN,
+        *,
+        timeout: float | None = None,
+        jitter: int = DEFAULT_JITTER_SIZE,
+    ):
+        """Open RTSP live stream, yields video access units
+
+        uses the login credentials and, unless given, the connection timeout
+        """
+
+        if not isinstance(self, connection.Connection) or not isinstance(
+            self, network.Network
+        ):
+            raise ReolinkResponseError("Open rtsp stream failed")
+
+        url = await self.get_stream_url(channel, stream, StreamProtocols.RTSP)
+        username = password = None
+        if isinstance(self, security.Security) and self._credentials is not None:
+            username, password = self._credentials
+        async with RtspClient(
+            url,
+            username,
+            password,
+            timeout=self.timeout if timeout is None else timeout,
+            jitter=jitter,
+        ) as client:
+            async for frame in client.frames():
+                yield frame
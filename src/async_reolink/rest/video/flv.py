@@ -0,0 +1,266 @@
+"""HTTP-FLV Demuxer"""
+
+from typing import Final, Iterator
+
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+
+from .typings import AudioCodecs, AudioFrame, VideoCodecs, VideoFrame
+
+_SIGNATURE: Final = b"FLV"
+_HEADER_SIZE: Final = 9
+_TAG_HEADER_SIZE: Final = 11
+_PREVIOUS_TAG_SIZE: Final = 4
+# tag header, video flags and packet type
+_PEEK_SIZE: Final = _TAG_HEADER_SIZE + 2
+
+_TAG_AUDIO: Final = 8
+_TAG_VIDEO: Final = 9
+
+_KEYFRAME: Final = 1
+_PACKET_CONFIG: Final = 0
+_PACKET_DATA: Final = 1
+
+_VIDEO_CODECS: Final = {_c.value: _c for _c in VideoCodecs}
+_AUDIO_CODECS: Final = {_c.value: _c for _c in AudioCodecs}
+
+_EMPTY: Final = memoryview(b"")
+
+Frame = VideoFrame | AudioFrame
+
+
+def split_nal_units(data: memoryview, length_size: int = 4):
+    """split length prefixed nal units"""
+
+    units: list[memoryview] = []
+    offset = 0
+    size = len(data)
+    while offset + length_size <= size:
+        length = int.from_bytes(data[offset : offset + length_size], "big")
+        offset += length_size
+        units.append(data[offset : offset + length])
+        offset += length
+    return units
+
+
+def _parameter_sets(data: memoryview, count: int, offset: int, units: list):
+    for _ in range(count):
+        length = int.from_bytes(data[offset : offset + 2], "big")
+        offset += 2
+        units.append(data[offset : offset + length])
+        offset += length
+    return offset
+
+
+def parse_avc_config(data: memoryview):
+    """nal unit length size and SPS/PPS of an AVCDecoderConfigurationRecord"""
+
+    if len(data) < 7:
+        return 4, []
+    units: list[memoryview] = []
+    offset = _parameter_sets(data, data[5] & 0x1F, 6, units)
+    if offset < len(data):
+        _parameter_sets(data, data[offset], offset + 1, units)
+    return (data[4] & 0x03) + 1, units
+
+
+def parse_hevc_config(data: memoryview):
+    """nal unit length size and VPS/SPS/PPS of an HEVCDecoderConfigurationRecord"""
+
+    if len(data) < 23:
+        return 4, []
+    units: list[memoryview] = []
+    offset = 23
+    for _ in range(data[22]):
+        count = int.from_bytes(data[offset + 1 : offset + 3], "big")
+        offset = _parameter_sets(data, count, offset + 3, units)
+    return (data[21] & 0x03) + 1, units
+
+
+class FlvDemuxer:
+    """Incremental FLV demuxer
+
+    feed received chunks (bytes) in order, frames reference the chunks
+    directly, only tags split across chunks are copied
+
+    with keyframes_only set, audio and non key video tags are skipped from
+    their header without being parsed or copied, and keyframes closer than
+    interval (ms) to the last emitted keyframe are dropped
+    """
+
+    __slots__ = (
+        "keyframes_only",
+        "interval",
+        "_pending",
+        "_pending_size",
+        "_need",
+        "_skip",
+        "_accepted",
+        "_last_keyframe",
+        "_header",
+        "_length_size",
+    )
+
+    def __init__(self, keyframes_only: bool = False, interval: float = 0) -> None:
+        self.keyframes_only = keyframes_only
+        self.interval = interval
+        self._pending: list[memoryview] = []
+        self._pending_size = 0
+        self._need = 0
+        self._skip = 0
+        self._accepted = False
+        self._last_keyframe: int | None = None
+        self._header = False
+        self._length_size = 4
+
+    def _unit_size(self, data: memoryview):
+        # size of the header/tag at the start of data, or the bytes needed to know it
+        if not self._header:
+            if len(data) < _HEADER_SIZE:
+                return _HEADER_SIZE
+            return int.from_bytes(data[5:9], "big") + _PREVIOUS_TAG_SIZE
+        if len(data) < _TAG_HEADER_SIZE:
+            return _TAG_HEADER_SIZE
+        return _TAG_HEADER_SIZE + int.from_bytes(data[1:4], "big") + _PREVIOUS_TAG_SIZE
+
+    def _skip_tag(self, data: memoryview, size: int):
+        # None when more of the tag is needed to decide
+        if len(data) < min(size, _TAG_HEADER_SIZE):
+            return None
+        tag_type = data[0]
+        if tag_type != _TAG_VIDEO:
+            return self.keyframes_only or tag_type != _TAG_AUDIO
+        if not self.keyframes_only:
+            return False
+        if len(data) < min(size, _PEEK_SIZE):
+            return None
+        if len(data) < _PEEK_SIZE:
+            return False
+        if data[_TAG_HEADER_SIZE] >> 4 != _KEYFRAME:
+            return True
+        if data[_TAG_HEADER_SIZE + 1] != _PACKET_DATA or not self.interval:
+            return False
+        timestamp = int.from_bytes(data[4:7], "big") | data[7] << 24
+        if (
+            self._last_keyframe is not None
+            and 0 <= timestamp - self._last_keyframe < self.interval
+        ):
+            return True
+        self._last_keyframe = timestamp
+        return False
+
+    def _step(self, data: memoryview) -> tuple[int, Frame | None]:
+        # bytes consumed from data and the parsed frame,
+        # or the negative size data has to reach to progress
+        size = self._unit_size(data)
+        if self._header and not self._accepted:
+            if (skip := self._skip_tag(data, size)) is None:
+                return -min(size, _PEEK_SIZE), None
+            if skip:
+                if size <= len(data):
+                    return size, None
+                self._skip = size - len(data)
+                return len(data), None
+            self._accepted = True
+        if size > len(data):
+            return -size, None
+        self._accepted = False
+        return size, self._parse_unit(data[:size])
+
+    def _parse_header(self, data: memoryview):
+        if data[:3] != _SIGNATURE:
+            raise ReolinkResponseError(
+                code=ErrorCodes.PROTOCOL_ERROR, details="invalid flv header"
+            )
+        self._header = True
+
+    def _parse_video(self, body: memoryview, timestamp: int):
+        if len(body) < 5 or (codec := _VIDEO_CODECS.get(body[0] & 0x0F)) is None:
+            return None
+        packet_type = body[1]
+        composition_time = int.from_bytes(body[2:5], "big", signed=True)
+        payload = body[5:]
+        if packet_type == _PACKET_CONFIG:
+            if codec == VideoCodecs.H264:
+                self._length_size, units = parse_avc_config(payload)
+            else:
+                self._length_size, units = parse_hevc_config(payload)
+            return VideoFrame(codec, timestamp, composition_time, True, True, units)
+        if packet_type != _PACKET_DATA:
+            return None
+        return VideoFrame(
+            codec,
+            timestamp,
+            composition_time,
+            body[0] >> 4 == _KEYFRAME,
+            False,
+            split_nal_units(payload, self._length_size),
+        )
+
+    @staticmethod
+    def _parse_audio(body: memoryview, timestamp: int):
+        if len(body) < 2 or (codec := _AUDIO_CODECS.get(body[0] >> 4)) is None:
+            return None
+        return AudioFrame(codec, timestamp, body[1] == _PACKET_CONFIG, body[2:])
+
+    def _parse_unit(self, data: memoryview) -> Frame | None:
+        if not self._header:
+            self._parse_header(data)
+            return None
+        tag_type = data[0]
+        if tag_type not in (_TAG_VIDEO, _TAG_AUDIO):
+            return None
+        timestamp = int.from_bytes(data[4:7], "big") | data[7] << 24
+        body = data[_TAG_HEADER_SIZE : len(data) - _PREVIOUS_TAG_SIZE]
+        if tag_type == _TAG_VIDEO:
+            return self._parse_video(body, timestamp)
+        return self._parse_audio(body, timestamp)
+
+    def feed(self, data: bytes) -> Iterator[Frame]:
+        """demux frames completed by data"""
+
+        view = memoryview(data)
+        while True:
+            if self._skip:
+                skip = min(self._skip, len(view))
+                self._skip -= skip
+                view = view[skip:]
+            if not view:
+                return
+            if self._pending:
+                missing = self._need - self._pending_size
+                if len(view) < missing:
+                    self._pending.append(view)
+                    self._pending_size += len(view)
+                    return
+                self._pending.append(view[:missing])
+                view = view[missing:]
+                unit = memoryview(b"".join(self._pending))
+                self._pending.clear()
+                self._pending_size = 0
+            else:
+                unit, view = view, _EMPTY
+
+            offset = 0
+            size = len(unit)
+            while offset < size:
+                consumed, frame = self._step(unit[offset:])
+                if consumed < 0:
+                    self._pending.append(unit[offset:])
+                    self._pending_size = size - offset
+                    self._need = -consumed
+                    break
+                offset += consumed
+                if frame is not None:
+                    yield frame
+
+    def reset(self):
+        """reset for a new stream"""
+
+        self._pending.clear()
+        self._pending_size = 0
+        self._need = 0
+        self._skip = 0
+        self._accepted = False
+        self._last_keyframe = None
+        self._header = False
+        self._length_size = 4
@@ -0,0 +1,217 @@
+"""Stream Fan-Out Hub"""
+
+import asyncio
+from collections import deque
+from contextlib import aclosing
+import logging
+from typing import AsyncIterator, Final
+
+from async_reolink.api.typings import StreamTypes
+
+from ..network.typings import StreamProtocols
+from .typings import AudioFrame, VideoFrame
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE: Final = 64
+
+Frame = VideoFrame | AudioFrame
+StreamKey = tuple[object, int, StreamTypes]
+
+
+class Subscription:
+    """Frames of one consumer
+
+    a bounded ring buffer, when full the oldest frame is dropped, frames are
+    shared between subscribers and must be treated as read only
+    """
+
+    __slots__ = (
+        "key",
+        "received",
+        "dropped",
+        "_hub",
+        "_frames",
+        "_event",
+        "_closed",
+        "_error",
+    )
+
+    def __init__(
+        self, hub: "StreamHub", key: StreamKey, maxlen: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
+        self.key = key
+        self.received = 0
+        """frames received from the upstream"""
+        self.dropped = 0
+        """frames dropped because the buffer was full"""
+        self._hub = hub
+        self._frames: deque[Frame] = deque(maxlen=maxlen)
+        self._event = asyncio.Event()
+        self._closed = False
+        self._error: BaseException | None = None
+
+    @property
+    def maxlen(self):
+        """buffer size"""
+        return self._frames.maxlen
+
+    @property
+    def lag(self):
+        """frames waiting to be consumed"""
+        return len(self._frames)
+
+    @property
+    def lag_time(self):
+        """time (ms) between the oldest waiting and the newest frame"""
+
+        if len(self._frames) < 2:
+            return 0
+        return self._frames[-1].timestamp - self._frames[0].timestamp
+
+    @property
+    def closed(self):
+        """no more frames will be received"""
+        return self._closed
+
+    def _push(self, frame: Frame):
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append(frame)
+        self.received += 1
+        self._event.set()
+
+    def _end(self, error: BaseException | None = None):
+        self._closed = True
+        self._error = error
+        self._event.set()
+
+    def close(self):
+        """unsubscribe, waiting frames are discarded"""
+
+        if not self._closed:
+            self._end()
+            self._hub._unsubscribe(self)  # pylint: disable=protected-access
+        self._frames.clear()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Frame:
+        while not self._frames:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._event.clear()
+            await self._event.wait()
+        return self._frames.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+
+class _Upstream:
+    __slots__ = ("subscribers", "task")
+
+    def __init__(self) -> None:
+        self.subscribers: list[Subscription] = []
+        self.task: asyncio.Task | None = None
+
+
+class StreamHub:
+    """Shares one device stream session per (device, channel, stream)
+    between any number of subscribers
+
+    the session is opened with the first subscriber and closed with the last
+    """
+
+    __slots__ = ("protocol", "_upstreams")
+
+    def __init__(self, protocol: StreamProtocols = StreamProtocols.FLV) -> None:
+        self.protocol = protocol
+        self._upstreams: dict[StreamKey, _Upstream] = {}
+
+    def __len__(self):
+        return len(self._upstreams)
+
+    def subscribers(self, device: object, channel: int = 0, stream=StreamTypes.MAIN):
+        """subscribers of a stream"""
+
+        if (upstream := self._upstreams.get((device, channel, stream))) is None:
+            return []
+        return list(upstream.subscribers)
+
+    def _open(self, device: object, channel: int, stream: StreamTypes):
+        if self.protocol == StreamProtocols.RTSP:
+            return device.open_rtsp_stream(channel, stream)
+        if self.protocol == StreamProtocols.FLV:
+            return device.open_flv_stream(channel, stream)
+        raise ValueError(f"{self.protocol.name} streams are not supported")
+
+    async def _pump(
+        self, key: StreamKey, upstream: _Upstream, frames: AsyncIterator[Frame]
+    ):
+        error = None
+        try:
+            # closing the upstream (rtsp teardown, http response) must not be
+            # left to garbage collection when the pump ends early
+            async with aclosing(frames):
+                async for frame in frames:
+                    for subscription in upstream.subscribers:
+                        subscription._push(frame)  # pylint: disable=protected-access
+        except Exception as _error:  # pylint: disable=broad-except
+            _LOGGER.warning("stream %s failed: %s", key[1:], _error)
+            error = _error
+        finally:
+            if self._upstreams.get(key) is upstream:
+                del self._upstreams[key]
+            for subscription in upstream.subscribers:
+                subscription._end(error)  # pylint: disable=protected-access
+            upstream.subscribers.clear()
+
+    def subscribe(
+        self,
+        device: object,
+        channel: int = 0,
+        stream: StreamTypes = StreamTypes.MAIN,
+        *,
+        maxlen: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """subscribe to a stream of device (a rest Client), opening it if needed"""
+
+        key = (device, channel, stream)
+        subscription = Subscription(self, key, maxlen)
+        if (upstream := self._upstreams.get(key)) is None:
+            upstream = self._upstreams[key] = _Upstream()
+            upstream.task = asyncio.create_task(
+                self._pump(key, upstream, self._open(device, channel, stream))
+            )
+        upstream.subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription):
+        if (upstream := self._upstreams.get(subscription.key)) is None:
+            return
+        if subscription in upstream.subscribers:
+            upstream.subscribers.remove(subscription)
+        if not upstream.subscribers:
+            del self._upstreams[subscription.key]
+            upstream.task.cancel()
+
+    async def close(self):
+        """close all streams and end their subscriptions"""
+
+        upstreams = list(self._upstreams.values())
+        self._upstreams.clear()
+        for upstream in upstreams:
+            upstream.task.cancel()
+        await asyncio.gather(*(_u.task for _u in upstreams), return_exceptions=True)
+        # tasks cancelled before they started never ran their cleanup
+        for upstream in upstreams:
+            for subscription in upstream.subscribers:
+                subscription._end()  # pylint: disable=protected-access
+            upstream.subscribers.clear()
@@ -0,0 +1,259 @@
+"""RTP Depacketizer"""
+
+from typing import Final, Iterator
+
+from .typings import VideoCodecs, VideoFrame
+
+_RTP_VERSION: Final = 2
+_RTP_HEADER_SIZE: Final = 12
+_SEQUENCE_MOD: Final = 0x10000
+_SEQUENCE_HALF: Final = 0x8000
+_TIMESTAMP_MOD: Final = 0x100000000
+_TIMESTAMP_HALF: Final = 0x80000000
+
+DEFAULT_JITTER_SIZE: Final = 32
+
+# RFC 6184
+_H264_STAP_A: Final = 24
+_H264_FU_A: Final = 28
+_H264_IDR: Final = 5
+# RFC 7798
+_H265_AP: Final = 48
+_H265_FU: Final = 49
+_H265_IRAP: Final = range(16, 22)
+
+
+class RtpPacket:
+    """RTP packet, payload is a view into the received data"""
+
+    __slots__ = ("sequence", "timestamp", "marker", "payload_type", "payload")
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: int,
+        marker: bool,
+        payload_type: int,
+        payload: memoryview,
+    ) -> None:
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.marker = marker
+        self.payload_type = payload_type
+        self.payload = payload
+
+    @classmethod
+    def parse(cls, data: bytes):
+        """parse packet, None if data is not a valid RTP packet"""
+
+        data = memoryview(data)
+        if len(data) < _RTP_HEADER_SIZE or data[0] >> 6 != _RTP_VERSION:
+            return None
+        offset = _RTP_HEADER_SIZE + 4 * (data[0] & 0x0F)
+        if data[0] & 0x10:
+            if len(data) < offset + 4:
+                return None
+            offset += 4 + 4 * int.from_bytes(data[offset + 2 : offset + 4], "big")
+        end = len(data)
+        if data[0] & 0x20:
+            end -= data[-1]
+        if offset > end:
+            return None
+        return cls(
+            int.from_bytes(data[2:4], "big"),
+            int.from_bytes(data[4:8], "big"),
+            bool(data[1] & 0x80),
+            data[1] & 0x7F,
+            data[offset:end],
+        )
+
+
+class JitterBuffer:
+    """Reorders packets by sequence number
+
+    at most size out of order packets are held, once full the oldest gap is
+    counted as lost and skipped
+    """
+
+    __slots__ = ("size", "lost", "_packets", "_next")
+
+    def __init__(self, size: int = DEFAULT_JITTER_SIZE) -> None:
+        self.size = size
+        self.lost = 0
+        self._packets: dict[int, RtpPacket] = {}
+        self._next: int | None = None
+
+    def push(self, packet: RtpPacket):
+        """add packet, returns the packets now in order"""
+
+        if self._next is None:
+            self._next = packet.sequence
+        if (packet.sequence - self._next) % _SEQUENCE_MOD >= _SEQUENCE_HALF:
+            # late or duplicate
+            return []
+        self._packets[packet.sequence] = packet
+        ready: list[RtpPacket] = []
+        while True:
+            while (packet := self._packets.pop(self._next, None)) is not None:
+                ready.append(packet)
+                self._next = (self._next + 1) % _SEQUENCE_MOD
+            if len(self._packets) <= self.size:
+                return ready
+            _next = self._next
+            nearest = min(self._packets, key=lambda seq: (seq - _next) % _SEQUENCE_MOD)
+            self.lost += (nearest - _next) % _SEQUENCE_MOD
+            self._next = nearest
+
+    def flush(self):
+        """remaining packets in order, for the end of the stream, gaps are
+        counted as lost"""
+
+        ready: list[RtpPacket] = []
+        while self._packets:
+            _next = self._next
+            nearest = min(self._packets, key=lambda seq: (seq - _next) % _SEQUENCE_MOD)
+            self.lost += (nearest - _next) % _SEQUENCE_MOD
+            ready.append(self._packets.pop(nearest))
+            self._next = (nearest + 1) % _SEQUENCE_MOD
+        return ready
+
+    def reset(self):
+        """reset for a new stream"""
+
+        self._packets.clear()
+        self._next = None
+
+
+class RtpDepacketizer:
+    """Assembles H.264 (RFC 6184) and H.265 (RFC 7798) access units
+
+    single nal units and aggregation packets reference the packet data,
+    fragmented units are reassembled, a gap in sequence numbers drops the
+    fragment in progress
+    """
+
+    __slots__ = (
+        "codec",
+        "clock_rate",
+        "_units",
+        "_keyframe",
+        "_fragment",
+        "_sequence",
+        "_timestamp",
+        "_elapsed",
+    )
+
+    def __init__(self, codec: VideoCodecs, clock_rate: int = 90000) -> None:
+        self.codec = codec
+        self.clock_rate = clock_rate
+        self._units: list[memoryview] = []
+        self._keyframe = False
+        self._fragment: bytearray | None = None
+        self._sequence: int | None = None
+        self._timestamp: int | None = None
+        self._elapsed = 0
+
+    def _add(self, unit: memoryview):
+        if self.codec == VideoCodecs.H264:
+            self._keyframe |= unit[0] & 0x1F == _H264_IDR
+        else:
+            self._keyframe |= (unit[0] >> 1) & 0x3F in _H265_IRAP
+        self._units.append(unit)
+
+    def _aggregate(self, payload: memoryview, offset: int):
+        size = len(payload)
+        while offset + 2 <= size:
+            length = int.from_bytes(payload[offset : offset + 2], "big")
+            offset += 2
+            if length:
+                self._add(payload[offset : offset + length])
+            offset += length
+
+    def _fragmented(self, payload: memoryview, header: bytes, fu_header: int):
+        data = payload[len(header) + 1 :]
+        if fu_header & 0x80:
+            self._fragment = bytearray(header)
+            self._fragment += data
+        elif self._fragment is not None:
+            self._fragment += data
+        if fu_header & 0x40 and self._fragment is not None:
+            self._add(memoryview(self._fragment))
+            self._fragment = None
+
+    def _payload(self, payload: memoryview):
+        if self.codec == VideoCodecs.H264:
+            if len(payload) < 1:
+                return
+            nal_type = payload[0] & 0x1F
+            if nal_type == _H264_STAP_A:
+                self._aggregate(payload, 1)
+            elif nal_type == _H264_FU_A:
+                if len(payload) > 1:
+                    header = bytes([(payload[0] & 0xE0) | (payload[1] & 0x1F)])
+                    self._fragmented(payload, header, payload[1])
+            elif 0 < nal_type < _H264_STAP_A:
+                self._add(payload)
+            return
+        if len(payload) < 2:
+            return
+        nal_type = (payload[0] >> 1) & 0x3F
+        if nal_type == _H265_AP:
+            self._aggregate(payload, 2)
+        elif nal_type == _H265_FU:
+            if len(payload) > 2:
+                header = bytes(
+                    [(payload[0] & 0x81) | ((payload[2] & 0x3F) << 1), payload[1]]
+                )
+                self._fragmented(payload, header, payload[2])
+        elif nal_type < _H265_AP:
+            self._add(payload)
+
+    def _flush(self):
+        if not self._units:
+            return None
+        frame = VideoFrame(
+            self.codec,
+            self._elapsed * 1000 // self.clock_rate,
+            0,
+            self._keyframe,
+            False,
+            self._units,
+        )
+        self._units = []
+        self._keyframe = False
+        return frame
+
+    def push(self, packet: RtpPacket) -> Iterator[VideoFrame]:
+        """add in order packet, yields completed access units"""
+
+        if self._timestamp is None:
+            self._timestamp = packet.timestamp
+        elif packet.timestamp != self._timestamp:
+            # access unit ended without a marker
+            if (frame := self._flush()) is not None:
+                yield frame
+            self._fragment = None
+            delta = (packet.timestamp - self._timestamp) % _TIMESTAMP_MOD
+            if delta >= _TIMESTAMP_HALF:
+                delta -= _TIMESTAMP_MOD
+            self._elapsed += delta
+            self._timestamp = packet.timestamp
+        if (
+            self._sequence is not None
+            and packet.sequence != (self._sequence + 1) % _SEQUENCE_MOD
+        ):
+            self._fragment = None
+        self._sequence = packet.sequence
+        self._payload(packet.payload)
+        if packet.marker and (frame := self._flush()) is not None:
+            yield frame
+
+    def reset(self):
+        """reset for a new stream"""
+
+        self._units = []
+        self._keyframe = False
+        self._fragment = None
+        self._sequence = None
+        self._timestamp = None
+        self._elapsed = 0
@@ -0,0 +1,426 @@
+"""RTSP Client"""
+
+import asyncio
+from base64 import b64decode, b64encode
+from hashlib import md5
+import logging
+import re
+from typing import Final
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+
+from async_reolink.api.const import DEFAULT_TIMEOUT
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+
+from ..network.streams import DEFAULT_RTSP_PORT
+from .rtp import DEFAULT_JITTER_SIZE, JitterBuffer, RtpDepacketizer, RtpPacket
+from .typings import VideoCodecs, VideoFrame
+
+_LOGGER = logging.getLogger(__name__)
+
+_RTSP_VERSION: Final = "RTSP/1.0"
+_USER_AGENT: Final = "async_reolink"
+_INTERLEAVED: Final = b"$"
+_CRLF: Final = b"\r\n"
+_TRANSPORT: Final = "RTP/AVP/TCP;unicast;interleaved={}-{}"
+DEFAULT_KEEPALIVE: Final = 30
+"""keep alive interval when the session has no timeout (half the default 60s)"""
+
+_VIDEO_CODECS: Final = {"H264": VideoCodecs.H264, "H265": VideoCodecs.H265}
+_CHALLENGE_PARAM: Final = re.compile(r'(\w+)=(?:"([^"]*)"|([^,\s]*))')
+_INTERLEAVED_PARAM: Final = re.compile(r"interleaved=(\d+)")
+_TIMEOUT_PARAM: Final = re.compile(r"timeout=(\d+)")
+
+
+class RtspResponse:
+    """RTSP response"""
+
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(
+        self, status: int, reason: str, headers: dict[str, str], body: bytes
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        """headers with lower case names"""
+        self.body = body
+
+    @property
+    def cseq(self):
+        """sequence number of the answered request"""
+        return int(self.headers.get("cseq", -1))
+
+
+class MediaDescription:
+    """video media of a session description"""
+
+    __slots__ = ("codec", "payload_type", "clock_rate", "control", "parameter_sets")
+
+    def __init__(
+        self,
+        codec: VideoCodecs,
+        payload_type: int,
+        clock_rate: int,
+        control: str,
+        parameter_sets: list[bytes],
+    ) -> None:
+        self.codec = codec
+        self.payload_type = payload_type
+        self.clock_rate = clock_rate
+        self.control = control
+        """setup url of the media"""
+        self.parameter_sets = parameter_sets
+        """out of band SPS/PPS (VPS for H.265)"""
+
+
+def _control_url(base: str, control: str | None):
+    if not control or control == "*":
+        return base
+    if "://" in control:
+        return control
+    return urljoin(base if base.endswith("/") else base + "/", control)
+
+
+def _parameter_sets(codec: VideoCodecs, fmtp: dict[str, str]):
+    if codec == VideoCodecs.H264:
+        names = fmtp.get("sprop-parameter-sets", "").split(",")
+    else:
+        names = [fmtp.get(_k, "") for _k in ("sprop-vps", "sprop-sps", "sprop-pps")]
+    return [b64decode(_n) for _n in names if _n]
+
+
+def parse_sdp(text: str, base_url: str):
+    """first supported video media of a session description, None if there is none"""
+
+    session_control = None
+    media: list[dict] = []
+    for line in text.splitlines():
+        kind, _, value = line.strip().partition("=")
+        if kind == "m":
+            media.append({"media": value.split(), "control": None, "rtpmap": {}})
+        elif kind != "a":
+            continue
+        elif value.startswith("control:"):
+            control = value[8:]
+            if media:
+                media[-1]["control"] = control
+            else:
+                session_control = control
+        elif value.startswith("rtpmap:") and media:
+            payload_type, _, encoding = value[7:].partition(" ")
+            media[-1]["rtpmap"][payload_type] = encoding
+        elif value.startswith("fmtp:") and media:
+            media[-1]["fmtp"] = value[5:].partition(" ")[2]
+
+    base_url = _control_url(base_url, session_control)
+    for _media in media:
+        fields = _media["media"]
+        if len(fields) < 4 or fields[0] != "video":
+            continue
+        payload_type = fields[3]
+        encoding = _media["rtpmap"].get(payload_type, "").split("/")
+        if (codec := _VIDEO_CODECS.get(encoding[0].upper())) is None:
+            continue
+        fmtp = dict(
+            _p.strip().partition("=")[::2]
+            for _p in _media.get("fmtp", "").split(";")
+            if _p.strip()
+        )
+        return MediaDescription(
+            codec,
+            int(payload_type),
+            int(encoding[1]) if len(encoding) > 1 else 90000,
+            _control_url(base_url, _media["control"]),
+            _parameter_sets(codec, fmtp),
+        )
+    return None
+
+
+def _md5(value: str):
+    return md5(value.encode(), usedforsecurity=False).hexdigest()
+
+
+class RtspClient:
+    """Minimal RTSP client
+
+    plays the first H.264/H.265 track of a stream over TCP interleaved RTP and
+    yields its access units, use as an async context manager
+    """
+
+    __slots__ = (
+        "url",
+        "timeout",
+        "keepalive",
+        "media",
+        "jitter",
+        "_username",
+        "_password",
+        "_challenge",
+        "_nonce_count",
+        "_cseq",
+        "_session",
+        "_session_timeout",
+        "_channel",
+        "_base_url",
+        "_reader",
+        "_writer",
+        "_last_request",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        jitter: int = DEFAULT_JITTER_SIZE,
+        keepalive: float | None = None,
+    ) -> None:
+        parts = urlsplit(url)
+        if username is None and parts.username is not None:
+            username = unquote(parts.username)
+            password = unquote(parts.password or "")
+        netloc = parts.hostname if ":" not in parts.hostname else f"[{parts.hostname}]"
+        if parts.port:
+            netloc += f":{parts.port}"
+        self.url = urlunsplit(parts._replace(netloc=netloc))
+        self.timeout = timeout
+        self.keepalive = keepalive
+        """seconds between keep alives, None for half the session timeout"""
+        self.media: MediaDescription | None = None
+        self.jitter = JitterBuffer(jitter)
+        self._username = username
+        self._password = password or ""
+        self._challenge: tuple[str, dict[str, str]] | None = None
+        self._nonce_count = 0
+        self._cseq = 0
+        self._session: str | None = None
+        self._session_timeout: int | None = None
+        self._channel = 0
+        self._base_url = self.url
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._last_request = 0.0
+
+    @property
+    def is_open(self):
+        """connection is open"""
+        return self._writer is not None
+
+    @property
+    def keepalive_interval(self):
+        """seconds between keep alives, 0 when disabled"""
+
+        if self.keepalive is not None:
+            return self.keepalive
+        if self._session_timeout:
+            return self._session_timeout / 2
+        return DEFAULT_KEEPALIVE
+
+    def _authorization(self, method: str, url: str):
+        if self._challenge is None or self._username is None:
+            return None
+        scheme, params = self._challenge
+        if scheme == "basic":
+            token = b64encode(f"{self._username}:{self._password}".encode()).decode()
+            return f"Basic {token}"
+        realm = params.get("realm", "")
+        nonce = params.get("nonce", "")
+        ha1 = _md5(f"{self._username}:{realm}:{self._password}")
+        ha2 = _md5(f"{method}:{url}")
+        header = (
+            f'Digest username="{self._username}", realm="{realm}", '
+            f'nonce="{nonce}", uri="{url}"'
+        )
+        if "auth" in params.get("qop", "").split(","):
+            self._nonce_count += 1
+            count = f"{self._nonce_count:08x}"
+            cnonce = _md5(f"{nonce}:{count}")[:16]
+            response = _md5(f"{ha1}:{nonce}:{count}:{cnonce}:auth:{ha2}")
+            header += f', qop=auth, nc={count}, cnonce="{cnonce}"'
+        else:
+            response = _md5(f"{ha1}:{nonce}:{ha2}")
+        if "opaque" in params:
+            header += f', opaque="{params["opaque"]}"'
+        return header + f', response="{response}", algorithm="MD5"'
+
+    def _send(self, method: str, url: str, headers: dict[str, str] | None = None):
+        self._cseq += 1
+        lines = [f"{method} {url} {_RTSP_VERSION}", f"CSeq: {self._cseq}"]
+        if (authorization := self._authorization(method, url)) is not None:
+            lines.append(f"Authorization: {authorization}")
+        if self._session is not None:
+            lines.append(f"Session: {self._session}")
+        lines.append(f"User-Agent: {_USER_AGENT}")
+        if headers:
+            lines.extend(f"{_k}: {_v}" for _k, _v in headers.items())
+        _LOGGER.debug("RTSP: %s %s", method, url)
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        self._last_request = asyncio.get_running_loop().time()
+        return self._cseq
+
+    async def _read(self):
+        # interleaved (channel, data) or a response
+        reader = self._reader
+        first = await reader.readexactly(1)
+        if first == _INTERLEAVED:
+            header = await reader.readexactly(3)
+            return header[0], await reader.readexactly(
+                int.from_bytes(header[1:3], "big")
+            )
+        status_line = (first + await reader.readuntil(_CRLF)).decode().strip()
+        version, _, status = status_line.partition(" ")
+        if not version.startswith("RTSP/"):
+            raise ReolinkResponseError(
+                code=ErrorCodes.PROTOCOL_ERROR, details=f"invalid rtsp: {status_line}"
+            )
+        code, _, reason = status.partition(" ")
+        headers: dict[str, str] = {}
+        while line := (await reader.readuntil(_CRLF)).decode().strip():
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = b""
+        if (length := int(headers.get("content-length", 0))) > 0:
+            body = await reader.readexactly(length)
+        return RtspResponse(int(code), reason, headers, body)
+
+    async def _request(
+        self, method: str, url: str, headers: dict[str, str] | None = None
+    ):
+        retried = False
+        while True:
+            cseq = self._send(method, url, headers)
+            while True:
+                message = await asyncio.wait_for(self._read(), self.timeout)
+                if isinstance(message, RtspResponse) and message.cseq in (cseq, -1):
+                    break
+            if message.status == 401 and not retried and self._username is not None:
+                scheme, _, params = message.headers.get(
+                    "www-authenticate", ""
+                ).partition(" ")
+                self._challenge = (
+                    scheme.lower(),
+                    {
+                        _m[0].lower(): _m[1] or _m[2]
+                        for _m in _CHALLENGE_PARAM.findall(params)
+                    },
+                )
+                self._nonce_count = 0
+                retried = True
+                continue
+            if message.status >= 300:
+                raise ReolinkResponseError(
+                    code=(
+                        ErrorCodes.AUTH_REQUIRED
+                        if message.status == 401
+                        else ErrorCodes.PROTOCOL_ERROR
+                    ),
+                    details=f"{method} failed: {message.status} {message.reason}",
+                )
+            return message
+
+    async def open(self):
+        """connect and start playing"""
+
+        if self.is_open:
+            return
+        parts = urlsplit(self.url)
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, parts.port or DEFAULT_RTSP_PORT),
+            self.timeout,
+        )
+        try:
+            await self._request("OPTIONS", self.url)
+            response = await self._request(
+                "DESCRIBE", self.url, {"Accept": "application/sdp"}
+            )
+            self._base_url = (
+                response.headers.get("content-base")
+                or response.headers.get("content-location")
+                or self.url
+            )
+            self.media = parse_sdp(response.body.decode(), self._base_url)
+            if self.media is None:
+                raise ReolinkResponseError(
+                    code=ErrorCodes.NOT_SUPPORTED, details="no supported video track"
+                )
+            response = await self._request(
+                "SETUP", self.media.control, {"Transport": _TRANSPORT.format(0, 1)}
+            )
+            if (session := response.headers.get("session")) is not None:
+                session, _, params = session.partition(";")
+                self._session = session.strip()
+                if match := _TIMEOUT_PARAM.search(params):
+                    self._session_timeout = int(match[1])
+            transport = response.headers.get("transport", "")
+            if match := _INTERLEAVED_PARAM.search(transport):
+                self._channel = int(match[1])
+            await self._request("PLAY", self._base_url, {"Range": "npt=0.000-"})
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self):
+        """stop playing and disconnect"""
+
+        if self._writer is None:
+            return
+        writer = self._writer
+        try:
+            if self._session is not None and not writer.is_closing():
+                self._send("TEARDOWN", self._base_url)
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        self._reader = None
+        self._writer = None
+        self._session = None
+        self._session_timeout = None
+        self.jitter.reset()
+
+    async def frames(self):
+        """yields access units until the stream ends"""
+
+        media = self.media
+        depacketizer = RtpDepacketizer(media.codec, media.clock_rate)
+        if media.parameter_sets:
+            yield VideoFrame(
+                media.codec,
+                0,
+                0,
+                True,
+                True,
+                [memoryview(_p) for _p in media.parameter_sets],
+            )
+        loop = asyncio.get_running_loop()
+        keepalive = self.keepalive_interval
+        ended = False
+        while not ended and self._reader is not None:
+            if keepalive and loop.time() - self._last_request >= keepalive:
+                self._send("GET_PARAMETER", self._base_url)
+            try:
+                message = await asyncio.wait_for(self._read(), self.timeout)
+            except asyncio.IncompleteReadError:
+                # packets held back for a gap will not be completed
+                packets = self.jitter.flush()
+                ended = True
+            else:
+                # responses (to keep alives) and rtcp are ignored
+                if isinstance(message, RtspResponse) or message[0] != self._channel:
+                    continue
+                if (packet := RtpPacket.parse(message[1])) is None:
+                    continue
+                packets = self.jitter.push(packet)
+            for packet in packets:
+                if packet.payload_type == media.payload_type:
+                    for frame in depacketizer.push(packet):
+                        yield frame
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,81 @@
+"""Video typings"""
+
+from enum import IntEnum
+
+
+class VideoCodecs(IntEnum):
+    """Video Codecs (FLV codec ids)"""
+
+    H264 = 7
+    H265 = 12
+
+
+class AudioCodecs(IntEnum):
+    """Audio Codecs (FLV sound formats)"""
+
+    AAC = 10
+
+
+class VideoFrame:
+    """Video access unit
+
+    nal units are views into the received data, copy them to keep them past
+    the next read from the stream
+    """
+
+    __slots__ = (
+        "codec",
+        "timestamp",
+        "composition_time",
+        "keyframe",
+        "config",
+        "nal_units",
+    )
+
+    def __init__(
+        self,
+        codec: VideoCodecs,
+        timestamp: int,
+        composition_time: int,
+        keyframe: bool,
+        config: bool,
+        nal_units: list[memoryview],
+    ) -> None:
+        self.codec = codec
+        self.timestamp = timestamp
+        """decode timestamp (ms)"""
+        self.composition_time = composition_time
+        """presentation offset from timestamp (ms)"""
+        self.keyframe = keyframe
+        self.config = config
+        """nal units are parameter sets (SPS/PPS, VPS for H.265)"""
+        self.nal_units = nal_units
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}: {self.codec.name} @{self.timestamp}"
+            f"{' key' if self.keyframe else ''}{' config' if self.config else ''}"
+            f" nal_units={len(self.nal_units)}>"
+        )
+
+
+class AudioFrame:
+    """Audio frame, data is a view into the received data"""
+
+    __slots__ = ("codec", "timestamp", "config", "data")
+
+    def __init__(
+        self, codec: AudioCodecs, timestamp: int, config: bool, data: memoryview
+    ) -> None:
+        self.codec = codec
+        self.timestamp = timestamp
+        """timestamp (ms)"""
+        self.config = config
+        """data is the AudioSpecificConfig"""
+        self.data = data
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}: {self.codec.name} @{self.timestamp}"
+            f"{' config' if self.config else ''} size={len(self.data)}>"
+        )
@@ -1,9 +1,14 @@
 """"Models"""
 
 from abc import ABC, abstractmethod
+import asyncio
+from hashlib import md5
 import logging
+import re
 from typing import AsyncIterable, TypedDict
 
+from aiohttp import web
+
 from async_reolink.api.connection import Connection
 from async_reolink.api.commands import CommandRequest, CommandResponse
 
@@ -27,7 +32,7 @@ class MockConnection(Connection, ABC):
 
     def __init__(self, *args, logger: logging.Logger = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._mocked: MockConnectionValues = {}.update(_MOCK_DEFAULTS)
+        self._mocked: MockConnectionValues = dict(_MOCK_DEFAULTS)
         self._logger = logger
 
     @property
@@ -69,3 +74,195 @@ class MockConnection_SingleExecute(MockConnection, ABC):
                 yield await self._mocked_execute(request)
 
         return _mock_iterable()
+
+
+JPEG = b"\xff\xd8\xff\xe0mock\xff\xd9"
+
+
+class MockCamera:
+    """Minimal fake camera"""
+
+    def __init__(self, max_batch: int = 0) -> None:
+        self.max_batch = max_batch
+        self.delay = 0.0
+        # reply only to the first commands of a batch, optionally ending with
+        # an error for the next command
+        self.truncate = 0
+        self.error: dict | None = None
+        self.tokens = ["abc123"]
+        self.rtmp_port = 1935
+        self.rtsp_port = 554
+        # paths reported by GetRtspUrl, None when not supported
+        self.rtsp_path: str | None = "/Preview_{:02}_{}"
+        self.flv: list[bytes] = []
+        self.requests: list[tuple[str, dict[str, str], list | None]] = []
+        self.app = web.Application()
+        self.app.router.add_route("*", "/cgi-bin/api.cgi", self.handle)
+        self.app.router.add_get("/flv", self.handle_flv)
+
+    async def handle_flv(self, request: web.Request):
+        self.requests.append((request.method, dict(request.query), None))
+        response = web.StreamResponse(headers={"Content-Type": "video/x-flv"})
+        await response.prepare(request)
+        for chunk in self.flv:
+            await response.write(chunk)
+        await response.write_eof()
+        return response
+
+    async def handle(self, request: web.Request):
+        body = await request.json() if request.method == "POST" else None
+        self.requests.append((request.method, dict(request.query), body))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.method == "GET":
+            return web.Response(body=JPEG, content_type="image/jpeg")
+        if self.max_batch and len(body) > self.max_batch:
+            raise web.HTTPInternalServerError()
+        responses = []
+        for command in body:
+            value = {"rspCode": 200}
+            if command["cmd"] == "Login":
+                value = {"Token": {"name": self.tokens[0], "leaseTime": 3600}}
+            elif command["cmd"] == "GetRtspUrl":
+                channel = command.get("param", {}).get("channel", 0)
+                if self.rtsp_path is None:
+                    responses.append(
+                        {
+                            "cmd": command["cmd"],
+                            "code": 1,
+                            "error": {"rspCode": -9, "detail": "not support"},
+                        }
+                    )
+                    continue
+                value = {
+                    "rtspUrl": {
+                        "channel": channel,
+                        **{
+                            f"{_s}Stream": "rtsp://192.168.1.10:554"
+                            + self.rtsp_path.format(channel + 1, _s)
+                            for _s in ("main", "sub")
+                        },
+                    }
+                }
+            elif command["cmd"] == "GetNetPort":
+                value = {
+                    "NetPort": {"rtspPort": self.rtsp_port, "rtmpPort": self.rtmp_port}
+                }
+            responses.append({"cmd": command["cmd"], "code": 0, "value": value})
+        if self.truncate or self.error:
+            responses = responses[: self.truncate]
+            if self.error and len(body) > self.truncate:
+                responses.append(
+                    {"cmd": body[self.truncate]["cmd"], "code": 1, "error": self.error}
+                )
+        return web.json_response(responses)
+
+
+_SDP = """v=0
+o=- 0 0 IN IP4 127.0.0.1
+s=Session
+t=0 0
+a=control:*
+m=video 0 RTP/AVP 96
+a=control:track1
+a=rtpmap:96 {codec}/90000
+a=fmtp:96 packetization-mode=1;{sprop}
+m=audio 0 RTP/AVP 97
+a=control:track2
+a=rtpmap:97 MPEG4-GENERIC/16000
+"""
+
+
+def _md5(value: str):
+    return md5(value.encode()).hexdigest()
+
+
+class MockRtspServer:
+    """Minimal fake camera rtsp service, digest authentication and tcp
+    interleaved rtp"""
+
+    def __init__(
+        self,
+        packets: list[bytes],
+        sprop: str = "",
+        codec: str = "H264",
+        username: str = "admin",
+        password: str = "",
+        hangup: bool = True,
+        session_timeout: int = 60,
+    ) -> None:
+        self.packets = packets
+        self.session_timeout = session_timeout
+        self.sdp = _SDP.format(codec=codec, sprop=sprop)
+        self.username = username
+        self.password = password
+        self.hangup = hangup
+        self.requests: list[tuple[str, str]] = []
+        self.closed = asyncio.Event()
+        self.port = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _authorized(self, method: str, headers: dict[str, str]):
+        params = dict(re.findall(r'(\w+)="([^"]*)"', headers.get("authorization", "")))
+        if params.get("username") != self.username:
+            return False
+        ha1 = _md5(f"{self.username}:Reolink:{self.password}")
+        ha2 = _md5(f"{method}:{params['uri']}")
+        return params.get("response") == _md5(f"{ha1}:nonce:{ha2}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                method, url, _ = line.decode().split(" ", 2)
+                headers = {}
+                while header := (await reader.readline()).decode().strip():
+                    name, _, value = header.partition(":")
+                    headers[name.lower()] = value.strip()
+                self.requests.append((method, url))
+                response = [f"CSeq: {headers['cseq']}"]
+                body = b""
+                if not self._authorized(method, headers):
+                    status = "401 Unauthorized"
+                    response.append(
+                        'WWW-Authenticate: Digest realm="Reolink", nonce="nonce"'
+                    )
+                else:
+                    status = "200 OK"
+                if status != "200 OK" or method in ("OPTIONS", "GET_PARAMETER"):
+                    pass
+                elif method == "DESCRIBE":
+                    body = self.sdp.replace("\n", "\r\n").encode()
+                    response.append(f"Content-Base: {url}/")
+                    response.append("Content-Type: application/sdp")
+                elif method == "SETUP":
+                    response.append(f"Session: 12345678;timeout={self.session_timeout}")
+                    response.append(f"Transport: {headers['transport']};ssrc=1")
+                elif method == "TEARDOWN":
+                    break
+                response.append(f"Content-Length: {len(body)}")
+                writer.write(
+                    (
+                        f"RTSP/1.0 {status}\r\n" + "\r\n".join(response) + "\r\n\r\n"
+                    ).encode()
+                    + body
+                )
+                if method == "PLAY" and status == "200 OK":
+                    for packet in self.packets:
+                        writer.write(b"$\x00" + len(packet).to_bytes(2, "big") + packet)
+                        # rtcp is ignored
+                        writer.write(b"$\x01\x00\x04\x80\xc8\x00\x00")
+                    await writer.drain()
+                    if self.hangup:
+                        break
+        finally:
+            writer.close()
+            self.closed.set()
@@ -1,9 +1,133 @@
 """Client object test"""
 
-from async_reolink.rest import Client
+import importlib
+import inspect
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+from async_reolink.rest import Client, build_client, client_type, commands
+from async_reolink.rest.ai import AI
+from async_reolink.rest.alarm import Alarm
+from async_reolink.rest.commands import _COMMAND_MODULES
+from async_reolink.rest.network import Network
+from async_reolink.rest.record import Record
+from async_reolink.rest.security import Security
+
+_ENV = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
 
 
 def test_object():
     """Test can client be created"""
 
     assert Client()
+
+
+async def test_callbacks():
+    """Test callbacks are classified and called in order"""
+
+    client = Client()
+    calls = []
+
+    async def _async():
+        calls.append("async")
+
+    client._connect_callbacks.append(lambda: calls.append("sync"))
+    client._connect_callbacks.append(_async)
+    client._connect_callbacks.insert(0, lambda: calls.append("first"))
+    await client._connect_callbacks.invoke()
+    assert calls == ["first", "sync", "async"]
+
+
+def test_lazy_import():
+    """Test the package imports mixins on first use"""
+
+    code = """
+import sys
+import async_reolink.rest as rest
+from async_reolink.rest.commands import CommandResponse
+
+assert "async_reolink.rest.system" not in sys.modules
+response = CommandResponse.create_from(
+    {"cmd": "GetPtzPreset", "code": 0, "value": {"PtzPreset": []}}
+)
+assert type(response).__name__ == "GetPresetResponse"
+# only the module of the decoded command is imported
+assert "async_reolink.rest.commands.system" not in sys.modules
+assert rest.Client.__name__ == "Client" and rest.ptz.PTZ
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, env=_ENV)
+
+
+def test_submodule_imports():
+    """Test every public submodule imports first on a fresh module cache"""
+
+    code = """
+import importlib
+import pkgutil
+import sys
+import async_reolink.rest as rest
+
+names = [
+    _i.name
+    for _i in pkgutil.walk_packages(rest.__path__, rest.__name__ + ".")
+    if not any(_p.startswith("_") for _p in _i.name.split("."))
+]
+assert "async_reolink.rest.commands.ai" in names
+for name in names:
+    for loaded in [_m for _m in sys.modules if _m.startswith("async_reolink")]:
+        del sys.modules[loaded]
+    importlib.import_module(name)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, env=_ENV)
+
+
+def test_command_modules():
+    """Test every command maps to the module defining it"""
+
+    found = {}
+    for info in pkgutil.iter_modules(commands.__path__):
+        module = importlib.import_module(f"{commands.__name__}.{info.name}")
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and cls.__module__ == module.__name__:
+                if (command := cls.__dict__.get("COMMAND", None)) is not None:
+                    found[command] = info.name
+    assert found == dict(_COMMAND_MODULES)
+
+
+def test_builder():
+    """Test clients are built with only the requested mixins"""
+
+    client = build_client("alarm", "ai")
+    assert isinstance(client, (Alarm, AI, Security)) and not isinstance(client, Record)
+    assert type(client) is client_type("ai", "alarm", "security")
+    assert type(client).__name__ == "AlarmAIClient"
+    assert isinstance(build_client("video"), Network)
+    with pytest.raises(ValueError):
+        client_type("cloud")
+
+
+async def test_idle_client():
+    """Test per client state is only created when used"""
+
+    client = Client()
+    assert not {
+        "_route_values",
+        "_Connection__batch_limits",
+        "_Network__liveness",
+        "_Network__streams",
+        "_PTZ__move_estimator",
+        "_PTZ__trackers",
+        "_Record__snapshot_seed",
+    }.intersection(vars(client))
+    assert client.batch_limit == client.batch_limits.default
+
+    liveness = client.channel_liveness
+    assert client.channel_liveness is liveness
+    liveness.single()
+    await client._disconnect_callbacks.invoke()
+    assert liveness.stale
+    assert client.ptz_tracker(0).estimator is client.ptz_move_estimator
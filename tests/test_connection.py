@@ -0,0 +1,297 @@
+"""Connection Test"""
+
+from aiohttp import ClientResponseError
+from aiohttp.test_utils import TestServer
+import pytest
+
+from async_reolink.rest import Client
+from async_reolink.rest.commands import RequestTemplate, request_template
+from async_reolink.rest.commands.alarm import GetMotionStateRequest
+from async_reolink.rest.batching import BatchLimits
+from async_reolink.api.ptz.typings import Operation
+from async_reolink.api.typings import StreamTypes
+from .models import JPEG, MockCamera
+
+
+async def test_routes():
+    """Test login, snapshot and batch requests are routed"""
+
+    camera = MockCamera()
+    async with TestServer(camera.app) as server:
+        client = Client()
+        await client.connect(server.host, server.port)
+        try:
+            assert await client.login("admin", "")
+            assert camera.requests[-1][0] == "POST"
+            assert camera.requests[-1][1] == {"cmd": "Login"}
+
+            assert await client.get_snap(1) == JPEG
+            method, query, _ = camera.requests[-1]
+            assert method == "GET"
+            assert query["cmd"] == "Snap"
+            assert query["channel"] == "1"
+            assert query["token"] == "abc123"
+            assert len(query["rs"]) == 16
+
+            async for _ in client.batch(
+                [
+                    client._create_get_md_state(0),
+                    client._create_get_ai_state_request(0),
+                ]
+            ):
+                pass
+            method, query, body = camera.requests[-1]
+            assert method == "POST"
+            assert query == {"token": "abc123"}
+            assert [_c["cmd"] for _c in body] == ["GetMdState", "GetAiState"]
+        finally:
+            await client.disconnect()
+
+
+async def test_batch_split(tmp_path):
+    """Test oversized batches are split and the limit is learned"""
+
+    camera = MockCamera(max_batch=3)
+    limits = BatchLimits(default=8)
+    async with TestServer(camera.app) as server:
+        client = Client(batch_limits=limits)
+        await client.connect(server.host, server.port)
+        client.batch_key = ("RLC-811A", "v3.1.0")
+        try:
+            commands = [client._create_get_md_state(_i) for _i in range(10)]
+            responses = [_r async for _r in client.batch(commands)]
+            assert len(responses) == 10
+            # lowered after the second failure in a row
+            assert limits.limit(("RLC-811A", "v3.1.0")) == 2
+            assert limits.limit(("E1", "v3.0.0")) == 8
+
+            camera.requests.clear()
+            responses = [_r async for _r in client.batch(commands)]
+            assert len(responses) == 10
+            assert [len(_r[2]) for _r in camera.requests] == [2] * 5
+            # responses keep request order
+            assert [
+                _c["param"]["channel"] for _r in camera.requests for _c in _r[2]
+            ] == list(range(10))
+        finally:
+            await client.disconnect()
+
+    path = tmp_path / "limits.json"
+    limits.save(path)
+    assert dict(BatchLimits.load(path)) == {("RLC-811A", "v3.1.0"): 2}
+    assert not BatchLimits.load(tmp_path / "missing.json")
+
+
+async def test_batch_timeout():
+    """Test timeouts are raised without splitting or learning a limit"""
+
+    camera = MockCamera()
+    camera.delay = 1
+    limits = BatchLimits(default=8)
+    async with TestServer(camera.app) as server:
+        client = Client(batch_limits=limits)
+        await client.connect(server.host, server.port, 0.3)
+        client.batch_key = ("M", "F")
+        try:
+            with pytest.raises(TimeoutError):
+                async for _ in client.batch(
+                    [client._create_get_md_state(_i) for _i in range(8)]
+                ):
+                    pass
+            assert len(camera.requests) == 1
+            assert not limits.to_json()
+        finally:
+            await client.disconnect()
+
+
+async def test_batch_short_reply():
+    """Test error replies and batches with changes are not split"""
+
+    camera = MockCamera()
+    limits = BatchLimits(default=16)
+    async with TestServer(camera.app) as server:
+        client = Client(batch_limits=limits)
+        await client.connect(server.host, server.port)
+        client.batch_key = ("M", "F")
+        try:
+            camera.error = {"rspCode": -6, "detail": "please login first"}
+            reads = [client._create_get_md_state(_i) for _i in range(16)]
+            responses = [_r async for _r in client.batch(reads)]
+            assert len(responses) == 1 and len(camera.requests) == 1
+            assert not limits.to_json()
+
+            camera.error = None
+            camera.truncate = 2
+            camera.requests.clear()
+            changes = [
+                client._create_set_ptz_control_request(0, _o, 5, None)
+                for _o in (Operation.LEFT, Operation.STOP)
+            ]
+            responses = [_r async for _r in client.batch(reads[:2] + changes)]
+            assert len(responses) == 2 and len(camera.requests) == 1
+
+            camera.truncate = 0
+            camera.max_batch = 2
+            camera.requests.clear()
+            with pytest.raises(ClientResponseError):
+                async for _ in client.batch(reads[:2] + changes):
+                    pass
+            assert len(camera.requests) == 1
+        finally:
+            await client.disconnect()
+
+
+def test_batch_limits():
+    """Test limits are lowered on repeated failures and probed back up"""
+
+    key = ("RLC-811A", "v3.1.0")
+    limits = BatchLimits(default=8, probe_interval=0)
+    assert limits.record_failure(key, 8) == 8
+    assert limits.record_success(key, 8) == 8
+    # a success in between starts over
+    assert limits.record_failure(key, 8) == 8
+    assert limits.record_failure(key, 6) == 3
+    assert limits.record_success(key, 2) == 3
+    assert limits.record_success(key, 3) == 6
+    assert limits.record_success(key, 6) == 8
+    assert not limits
+
+    limits = BatchLimits({key: 2}, default=8)
+    assert limits.record_success(key, 2) == 2
+
+
+async def test_stream_urls():
+    """Test stream urls are cached per token and ports, rtsp paths come from
+    the device"""
+
+    camera = MockCamera()
+    camera.rtmp_port = 1936
+    async with TestServer(camera.app) as server:
+        client = Client()
+        await client.connect(server.host, server.port)
+        try:
+            await client.login("admin", "")
+            host = server.host
+            # the device address is replaced, its path is kept
+            assert (
+                await client.get_stream_url(1, StreamTypes.SUB)
+                == f"rtsp://{host}/Preview_02_sub"
+            )
+            assert (
+                await client.get_rtmp_url(0)
+                == f"rtmp://{host}:1936/bcs/channel0_main.bcs"
+                "?channel=0&stream=main&token=abc123"
+            )
+            assert await client.get_flv_url(0) == (
+                f"http://{host}:{server.port}/flv?port=1936&app=bcs"
+                "&stream=channel0_main.bcs&token=abc123"
+            )
+            assert await client.get_stream_url(1) == f"rtsp://{host}/Preview_02_main"
+            assert [_r[2][0]["cmd"] for _r in camera.requests] == [
+                "Login",
+                "GetNetPort",
+                "GetRtspUrl",
+            ]
+
+            # devices without GetRtspUrl use the h264 preview path
+            camera.rtsp_path = None
+            assert (
+                await client.get_stream_url(0, StreamTypes.SUB)
+                == f"rtsp://{host}/h264Preview_01_sub"
+            )
+
+            # token renewal
+            camera.tokens[0] = "def456"
+            await client.logout()
+            await client.login("admin", "")
+            assert (await client.get_flv_url(0)).endswith("&token=def456")
+
+            # port change
+            camera.rtmp_port = 1935
+            await client.get_ports()
+            assert (await client.get_rtmp_url(0)).startswith(
+                f"rtmp://{host}/bcs/channel0_main.bcs"
+            )
+        finally:
+            await client.disconnect()
+
+
+async def test_request_templates():
+    """Test templates are shared, read only and sent like their source"""
+
+    template = request_template(GetMotionStateRequest, 1)
+    assert request_template(GetMotionStateRequest, 1) is template
+    assert (
+        template.json == '{"cmd": "GetMdState", "action": 0, "param": {"channel": 1}}'
+    )
+    with pytest.raises(AttributeError):
+        template.channel_id = 2
+    control = RequestTemplate(
+        Client()._create_set_ptz_control_request(0, Operation.LEFT, 5, None)
+    )
+    with pytest.raises(AttributeError):
+        control.speed = 10
+    assert control.speed == 5 and '"speed": 5' in control.json
+
+    camera = MockCamera()
+    async with TestServer(camera.app) as server:
+        client = Client()
+        await client.connect(server.host, server.port)
+        try:
+            await client.login("admin", "")
+            requests = [template, client._create_get_ptz_zoom_focus_request(0)]
+            assert len([_r async for _r in client.batch(requests)]) == 2
+            assert camera.requests[-1][2] == [
+                {"cmd": "GetMdState", "action": 0, "param": {"channel": 1}},
+                {"cmd": "GetZoomFocus", "action": 0, "param": {"channel": 0}},
+            ]
+
+            snapshot = RequestTemplate(client._create_get_snapshot_request(0))
+            async for _ in client._execute(snapshot):
+                pass
+            assert camera.requests[-1][0] == "GET"
+        finally:
+            await client.disconnect()
+
+
+async def test_prepared_batch():
+    """Test prepared batches are sent as encoded and split when too large"""
+
+    camera = MockCamera(max_batch=2)
+    limits = BatchLimits(default=8)
+    async with TestServer(camera.app) as server:
+        client = Client(batch_limits=limits)
+        await client.connect(server.host, server.port)
+        try:
+            await client.login("admin", "")
+            batch = client.prepare_batch(
+                [
+                    client._create_get_md_state(0),
+                    client._create_get_ai_state_request(0),
+                ]
+            )
+            for _ in range(2):
+                responses = [_r async for _r in client.execute_prepared(batch)]
+                assert [_r.command for _r in responses] == ["GetMdState", "GetAiState"]
+            assert camera.requests[-1][1] == {"token": "abc123"}
+            assert batch._types == [type(responses[0]), type(responses[1])]
+
+            batch = client.prepare_batch(
+                [client._create_get_md_state(_i) for _i in range(3)]
+            )
+            for _ in range(2):
+                camera.requests.clear()
+                assert len([_r async for _r in client.execute_prepared(batch)]) == 3
+                # the failed batch is sent in smaller parts
+                sizes = [len(_r[2]) for _r in camera.requests]
+                assert sizes[0] == 3 and sum(sizes[1:]) == 3
+            # and the limit lowered after failing twice
+            assert client.batch_limit == 1
+            camera.requests.clear()
+            assert len([_r async for _r in client.execute_prepared(batch)]) == 3
+            assert [len(_r[2]) for _r in camera.requests] == [1, 1, 1]
+        finally:
+            await client.disconnect()
+
+    with pytest.raises(ValueError):
+        Client().prepare_batch([Client()._create_get_snapshot_request(0)])
@@ -0,0 +1,96 @@
+"""Fleet Executor Test"""
+
+import asyncio
+
+from async_reolink.api.commands import CommandRequest
+from async_reolink.rest.commands import CommandResponse
+from async_reolink.rest.commands.system import GetTimeRequest, GetTimeResponse
+from async_reolink.rest.fleet import FleetExecutor, subnet_of
+from .models import MockConnection_SingleExecute
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = 0
+        self.total_peak = 0
+
+
+class TestRig(MockConnection_SingleExecute):
+    """Test Rig"""
+
+    def __init__(self, hostname: str, counter: _Counter, fail=False, delay=0.01):
+        super().__init__()
+        self._mocked["hostname"] = hostname
+        self.counter = counter
+        self.fail = fail
+        self.delay = delay
+
+    async def _mocked_execute(self, request: CommandRequest):
+        counter = self.counter
+        subnet = subnet_of(self.hostname)
+        counter.active[subnet] = counter.active.get(subnet, 0) + 1
+        counter.peak[subnet] = max(counter.peak.get(subnet, 0), counter.active[subnet])
+        counter.total += 1
+        counter.total_peak = max(counter.total_peak, counter.total)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError(self.hostname)
+            return CommandResponse.create_from(
+                {"cmd": GetTimeRequest.COMMAND, "code": 0, "value": {}}
+            )
+        finally:
+            counter.active[subnet] -= 1
+            counter.total -= 1
+
+
+def test_subnet_of():
+    """Test subnet grouping"""
+
+    assert subnet_of("192.168.1.20") == "192.168.1.0/24"
+    assert subnet_of("192.168.1.20", 16) == "192.168.0.0/16"
+    assert subnet_of("[fe80::1]") == "fe80::/64"
+    assert subnet_of("camera.local") == "camera.local"
+
+
+async def test_fleet_limits():
+    """Test fleet concurrency is capped globally and per subnet"""
+
+    counter = _Counter()
+    rigs = [TestRig(f"10.0.{_i % 3}.{_i}", counter) for _i in range(12)]
+    executor = FleetExecutor(limit=4, subnet_limit=2)
+    run = executor.execute(rigs, [GetTimeRequest()])
+    results = [_r async for _r in run]
+    assert len(results) == len(rigs)
+    assert {_r[0] for _r in results} == set(rigs)
+    assert all(isinstance(_r[1], GetTimeResponse) for _r in results)
+    assert not run.failures
+    assert counter.total_peak <= 4
+    assert max(counter.peak.values()) <= 2
+
+    # a generator is shared by every client
+    run = executor.execute(rigs, (GetTimeRequest() for _ in range(2)))
+    assert len([_r async for _r in run]) == 2 * len(rigs)
+
+
+async def test_fleet_failures():
+    """Test a failing device does not stop the others"""
+
+    counter = _Counter()
+    rigs = [TestRig(f"10.0.0.{_i}", counter, fail=_i == 1) for _i in range(4)]
+    rigs[2].delay = 0.05
+
+    def _plan(client: TestRig):
+        # slow device gets two commands
+        return [GetTimeRequest()] * (2 if client is rigs[2] else 1)
+
+    run = FleetExecutor().execute(rigs, _plan)
+    devices = [_d async for _d, _ in run]
+    assert len(devices) == 4
+    assert rigs[1] not in devices
+    # completion order, slowest device last
+    assert devices[-2:] == [rigs[2], rigs[2]]
+    assert list(run.failures) == [rigs[1]]
+    assert isinstance(run.failures[rigs[1]], ConnectionError)
@@ -0,0 +1,179 @@
+"""FLV Demuxer Test"""
+
+from aiohttp.test_utils import TestServer
+
+from async_reolink.rest import Client
+from async_reolink.rest.video.flv import FlvDemuxer
+from async_reolink.rest.video.typings import (
+    AudioCodecs,
+    AudioFrame,
+    VideoCodecs,
+    VideoFrame,
+)
+from .models import MockCamera
+
+_SPS = b"\x67\x64\x00\x1f\xac"
+_PPS = b"\x68\xee\x3c\x80"
+_IDR = b"\x65" + bytes(range(200))
+_SLICE = b"\x41" + bytes(50)
+_SEI = b"\x06\x05\x01\x00"
+_AAC_CONFIG = b"\x12\x10"
+_AAC = bytes(range(40))
+
+
+def _tag(tag_type: int, timestamp: int, body: bytes):
+    return (
+        bytes([tag_type])
+        + len(body).to_bytes(3, "big")
+        + (timestamp & 0xFFFFFF).to_bytes(3, "big")
+        + bytes([timestamp >> 24])
+        + bytes(3)
+        + body
+        + (11 + len(body)).to_bytes(4, "big")
+    )
+
+
+def _nal_units(*units: bytes):
+    return b"".join(len(_u).to_bytes(4, "big") + _u for _u in units)
+
+
+def _video(timestamp: int, keyframe: bool, packet_type: int, payload: bytes, codec=7):
+    flags = (0x10 if keyframe else 0x20) | codec
+    return _tag(9, timestamp, bytes([flags, packet_type, 0, 0, 40]) + payload)
+
+
+def _audio(timestamp: int, packet_type: int, payload: bytes):
+    return _tag(8, timestamp, bytes([0xAF, packet_type]) + payload)
+
+
+def _avc_config():
+    return (
+        b"\x01\x64\x00\x1f\xff\xe1"
+        + len(_SPS).to_bytes(2, "big")
+        + _SPS
+        + b"\x01"
+        + len(_PPS).to_bytes(2, "big")
+        + _PPS
+    )
+
+
+def _stream():
+    return b"".join(
+        (
+            b"FLV\x01\x05" + (9).to_bytes(4, "big") + bytes(4),
+            _tag(18, 0, b"\x02\x00\x0aonMetaData"),
+            _video(0, True, 0, _avc_config()),
+            _audio(0, 0, _AAC_CONFIG),
+            _video(0, True, 1, _nal_units(_SEI, _IDR)),
+            _audio(23, 1, _AAC),
+            _video(40, False, 1, _nal_units(_SLICE)),
+            _video(0x1000000 + 80, False, 1, _nal_units(_SLICE)),
+        )
+    )
+
+
+def _check(frames: list):
+    assert [type(_f) for _f in frames] == [
+        VideoFrame,
+        AudioFrame,
+        VideoFrame,
+        AudioFrame,
+        VideoFrame,
+        VideoFrame,
+    ]
+    config, audio_config, key, audio, inter, late = frames
+    assert config.config and config.codec == VideoCodecs.H264
+    assert [bytes(_u) for _u in config.nal_units] == [_SPS, _PPS]
+    assert audio_config.config and bytes(audio_config.data) == _AAC_CONFIG
+    assert key.keyframe and not key.config
+    assert key.composition_time == 40
+    assert [bytes(_u) for _u in key.nal_units] == [_SEI, _IDR]
+    assert audio.codec == AudioCodecs.AAC and audio.timestamp == 23
+    assert bytes(audio.data) == _AAC
+    assert not inter.keyframe and inter.timestamp == 40
+    assert [bytes(_u) for _u in inter.nal_units] == [_SLICE]
+    assert late.timestamp == 0x1000000 + 80
+
+
+def test_demux():
+    """Test demuxing whole and split streams"""
+
+    data = _stream()
+    _check(list(FlvDemuxer().feed(data)))
+    for size in (1, 5, 13, 64):
+        demuxer = FlvDemuxer()
+        frames = []
+        for i in range(0, len(data), size):
+            frames.extend(demuxer.feed(data[i : i + size]))
+        _check(frames)
+
+
+def test_demux_hevc():
+    """Test H.265 parameter sets"""
+
+    vps, sps, pps = b"\x40\x01\x0c", b"\x42\x01\x01", b"\x44\x01\xc1"
+    config = bytes(21) + b"\x03\x03"
+    for unit_type, unit in ((32, vps), (33, sps), (34, pps)):
+        config += bytes([unit_type]) + b"\x00\x01" + len(unit).to_bytes(2, "big") + unit
+    data = (
+        b"FLV\x01\x01" + (9).to_bytes(4, "big") + bytes(4)
+        + _video(0, True, 0, config, 12)
+        + _video(0, True, 1, _nal_units(b"\x26\x01" + bytes(10)), 12)
+    )  # fmt: skip
+    config, key = FlvDemuxer().feed(data)
+    assert config.codec == VideoCodecs.H265
+    assert [bytes(_u) for _u in config.nal_units] == [vps, sps, pps]
+    assert key.keyframe and bytes(key.nal_units[0]) == b"\x26\x01" + bytes(10)
+
+
+def _keyframe_stream():
+    header = b"FLV\x01\x05" + (9).to_bytes(4, "big") + bytes(4)
+    tags = [_video(0, True, 0, _avc_config())]
+    for i in range(30):
+        timestamp = i * 100
+        if not i % 5:
+            tags.append(_video(timestamp, True, 1, _nal_units(_IDR)))
+        else:
+            tags.append(_video(timestamp, False, 1, _nal_units(_SLICE * 40)))
+        tags.append(_audio(timestamp, 1, _AAC))
+    return header + b"".join(tags)
+
+
+def test_demux_keyframes():
+    """Test keyframe only mode skips other tags and limits the rate"""
+
+    data = _keyframe_stream()
+    for size in (len(data), 1, 12, 100, 1000):
+        demuxer = FlvDemuxer(True, 1000)
+        frames = []
+        for i in range(0, len(data), size):
+            frames.extend(demuxer.feed(data[i : i + size]))
+        config, *keys = frames
+        assert config.config
+        assert all(_f.keyframe and not _f.config for _f in keys)
+        assert [_f.timestamp for _f in keys] == [0, 1000, 2000]
+        assert [bytes(_u) for _u in keys[0].nal_units] == [_IDR]
+        # skipped tags never wait for their payload
+        assert not demuxer._pending_size
+
+    frames = list(FlvDemuxer(True).feed(data))
+    assert [_f.timestamp for _f in frames[1:]] == [0, 500, 1000, 1500, 2000, 2500]
+
+
+async def test_flv_stream():
+    """Test live stream from the flv endpoint"""
+
+    camera = MockCamera()
+    data = _stream()
+    camera.flv = [data[_i : _i + 100] for _i in range(0, len(data), 100)]
+    async with TestServer(camera.app) as server:
+        client = Client()
+        await client.connect(server.host, server.port)
+        try:
+            await client.login("admin", "")
+            _check([_f async for _f in client.open_flv_stream(0)])
+            _, query, _ = camera.requests[-1]
+            assert query["stream"] == "channel0_main.bcs"
+            assert query["token"] == "abc123"
+        finally:
+            await client.disconnect()
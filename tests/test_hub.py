@@ -0,0 +1,95 @@
+"""Stream Hub Test"""
+
+import asyncio
+
+from async_reolink.rest.video.hub import StreamHub, Subscription
+from async_reolink.rest.video.typings import VideoCodecs, VideoFrame
+
+
+class MockDevice:
+    """Device with a live stream of count frames"""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.opened = 0
+        self.closed = 0
+        self.release = asyncio.Event()
+
+    async def open_flv_stream(self, channel: int, stream):
+        self.opened += 1
+        try:
+            await self.release.wait()
+            for i in range(self.count):
+                yield VideoFrame(
+                    VideoCodecs.H264, i * 40, 0, False, False, [memoryview(b"x")]
+                )
+                await asyncio.sleep(0)
+            raise ConnectionResetError()
+        finally:
+            self.closed += 1
+
+
+async def test_fan_out():
+    """Test subscribers share one upstream with their own buffers"""
+
+    device = MockDevice(10)
+    hub = StreamHub()
+    fast = hub.subscribe(device, 0, maxlen=16)
+    slow = hub.subscribe(device, 0, maxlen=3)
+    await asyncio.sleep(0)
+    assert len(hub) == 1 and hub.subscribers(device, 0) == [fast, slow]
+    device.release.set()
+
+    timestamps = []
+    try:
+        async for frame in fast:
+            timestamps.append(frame.timestamp)
+    except ConnectionResetError:
+        pass
+    assert timestamps == [_i * 40 for _i in range(10)]
+    assert device.opened == 1 and device.closed == 1
+    assert len(hub) == 0
+
+    assert slow.received == 10 and slow.dropped == 7
+    assert slow.lag == 3 and slow.lag_time == 80
+    assert [(await anext(slow)).timestamp for _ in range(3)] == [280, 320, 360]
+
+
+async def test_unsubscribe():
+    """Test upstream closes with the last subscriber"""
+
+    device = MockDevice(1000)
+    hub = StreamHub()
+    first = hub.subscribe(device, 1)
+    second = hub.subscribe(device, 1)
+    device.release.set()
+    await anext(first)
+    first.close()
+    await anext(second)
+    assert device.closed == 0
+
+    second.close()
+    await asyncio.sleep(0)
+    assert device.closed == 1 and len(hub) == 0
+
+    third = hub.subscribe(device, 1)
+    await hub.close()
+    assert device.opened == 1 and third.closed
+    assert [_f async for _f in third] == []
+
+
+async def test_upstream_closed(monkeypatch):
+    """Test the upstream is closed as soon as the pump ends"""
+
+    def _push(_, frame):
+        raise ValueError(frame)
+
+    monkeypatch.setattr(Subscription, "_push", _push)
+    device = MockDevice(1000)
+    hub = StreamHub()
+    hub.subscribe(device, 2)
+    (upstream,) = hub._upstreams.values()
+    device.release.set()
+    await asyncio.wait([upstream.task])
+    # not left to the event loop's async generator finalizer
+    assert device.closed == 1 and len(hub) == 0
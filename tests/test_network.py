@@ -0,0 +1,173 @@
+"""Network Mixin Test"""
+
+import pytest
+
+from async_reolink.api.commands import CommandRequest
+from async_reolink.api.errors import ErrorCodes, ReolinkResponseError
+from async_reolink.api.typings import StreamTypes
+from async_reolink.rest import Client
+from async_reolink.rest._utilities.channels import online_channels
+from async_reolink.rest.alarm import Alarm
+from async_reolink.rest.commands import CommandResponse
+from async_reolink.rest.network import Network
+from async_reolink.rest.network.liveness import ChannelLiveness
+from .models import MockConnection_SingleExecute
+
+_STATUS = {
+    "count": 4,
+    "status": [
+        {"channel": 0, "online": 1},
+        {"channel": 1, "online": 0},
+        {"channel": 2, "online": 1},
+        {"channel": 3, "online": 1},
+    ],
+}
+
+
+class TestRig(MockConnection_SingleExecute, Network, Alarm):
+    """Test Rig"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.status = _STATUS
+        self.batches: list[list[str]] = []
+        self.commands: list[str] = []
+        # answer only the first requests of a batch
+        self.answered: int | None = None
+
+    def _execute(self, *args: CommandRequest):
+        self.batches.append([_r.command for _r in args])
+        return super()._execute(*args[: self.answered])
+
+    async def _mocked_execute(self, request: CommandRequest):
+        self.commands.append(request.command)
+        if request.command == "GetChannelstatus" and isinstance(self.status, int):
+            return CommandResponse.create_from(
+                {
+                    "cmd": request.command,
+                    "code": 1,
+                    "error": {"detail": "failed", "rspCode": self.status},
+                }
+            )
+        if request.command == "GetChannelstatus":
+            value = self.status
+        elif request.channel_id == 3:
+            return CommandResponse.create_from(
+                {
+                    "cmd": request.command,
+                    "code": 1,
+                    "error": {"detail": "not online", "rspCode": -16},
+                }
+            )
+        else:
+            value = {"state": request.channel_id % 2}
+        return CommandResponse.create_from(
+            {"cmd": request.command, "code": 0, "value": value}
+        )
+
+
+async def test_channel_gather():
+    """Test per channel requests are sent in one batch"""
+
+    rig = TestRig()
+    assert await rig.get_online_channels() == [0, 2, 3]
+
+    rig.batches.clear()
+    assert await rig.get_md_states() == {0: 0, 2: 0}
+    assert rig.batches == [["GetMdState"] * 3]
+
+    rig.batches.clear()
+    assert await rig.get_md_states(range(2)) == {0: 0, 1: 1}
+    assert rig.batches == [["GetMdState"] * 2]
+
+
+async def test_channel_gather_short():
+    """Test responses of short replies are not matched by position"""
+
+    rig = TestRig()
+    assert await rig.get_online_channels() == [0, 2, 3]
+    rig.answered = 1
+    assert await rig.get_md_states([1, 2]) == {}
+    assert not rig.channel_liveness.is_online(1)
+
+    rig.answered = None
+    rig.status = int(ErrorCodes.AUTH_REQUIRED)
+    with pytest.raises(ReolinkResponseError):
+        await online_channels(rig)
+    rig.status = int(ErrorCodes.NOT_SUPPORTED)
+    assert await online_channels(rig) == [0]
+
+
+async def test_channel_liveness():
+    """Test offline channels are skipped and re-probed with backoff"""
+
+    now = 0.0
+    rig = TestRig()
+    rig.channel_liveness = ChannelLiveness(60, 5, 20, lambda: now)
+    assert await rig.get_online_channels() == [0, 2, 3]
+    assert not rig.channel_liveness.is_online(1)
+
+    now = 5
+    assert await rig.get_online_channels() == [0, 1, 2, 3]
+    rig.status = {"count": 1, "status": [{"channel": 1, "online": 0}]}
+    assert await rig.get_md_states([1]) == {1: 1}
+    assert rig.channel_liveness.is_online(1)
+
+    # statuses refresh after the interval
+    now = 60
+    rig.batches.clear()
+    assert await rig.get_online_channels() == []
+    assert rig.batches == [["GetChannelstatus"]]
+
+    # failed probes double the backoff up to the maximum
+    liveness = rig.channel_liveness
+    for now, backoff in ((65, 10), (75, 20), (95, 20)):
+        assert liveness.channels() == [1]
+        liveness.report(1, False)
+        assert liveness.channels() == []
+        now += backoff - 1
+        assert liveness.channels() == []
+
+
+async def test_channel_liveness_errors():
+    """Test only unsupported channel statuses fall back to channel 0"""
+
+    now = 0.0
+    rig = TestRig()
+    rig.channel_liveness = ChannelLiveness(60, 5, 20, lambda: now)
+    rig.status = int(ErrorCodes.AUTH_REQUIRED)
+    with pytest.raises(ReolinkResponseError):
+        await rig.get_online_channels()
+    assert rig.channel_liveness.stale
+
+    rig.status = int(ErrorCodes.NOT_SUPPORTED)
+    assert await rig.get_online_channels() == [0]
+
+    # the current tracker is cleared on disconnect
+    client = Client()
+    client.channel_liveness = liveness = ChannelLiveness()
+    liveness.single()
+    await client._disconnect_callbacks.invoke()
+    assert liveness.stale and not liveness.channels()
+
+
+def test_rtsp_urls():
+    """Test rtsp url mapping"""
+
+    response = CommandResponse.create_from(
+        {
+            "cmd": "GetRtspUrl",
+            "code": 0,
+            "value": {
+                "rtspUrl": {
+                    "channel": 0,
+                    "mainStream": "rtsp://host/Preview_01_main",
+                    "subStream": "rtsp://host/Preview_01_sub",
+                }
+            },
+        }
+    )
+    urls = response.urls
+    assert len(urls) == 2
+    assert list(urls) == [StreamTypes.MAIN, StreamTypes.SUB]
+    assert urls[StreamTypes.SUB] == "rtsp://host/Preview_01_sub"
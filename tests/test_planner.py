@@ -0,0 +1,87 @@
+"""Batch Planner Test"""
+
+from async_reolink.api.commands import alarm
+from async_reolink.rest import Client
+from async_reolink.rest.batching import BatchLimits
+from async_reolink.rest.commands.ai import GetAiStateRequest
+from async_reolink.rest.commands.alarm import GetMotionStateRequest
+from async_reolink.rest.commands.ptz import GetPresetRequest
+from async_reolink.rest.commands.system import GetTimeRequest
+from async_reolink.rest.planner import BatchPlanner
+from async_reolink.rest.system.capabilities import Capabilities
+
+_SUPPORTED = {"permit": 6, "ver": 1}
+_UNSUPPORTED = {"permit": 0, "ver": 0}
+
+_CAPABILITIES = Capabilities(
+    {
+        "abilityChn": [
+            {
+                "supportAi": _SUPPORTED,
+                "alarmMd": _SUPPORTED,
+                "ptzPreset": _UNSUPPORTED,
+            },
+            {
+                "supportAi": _UNSUPPORTED,
+                "alarmMd": _SUPPORTED,
+                "ptzPreset": {"permit": 6, "ver": 0},
+            },
+        ]
+    }
+)
+
+
+def test_plan_filter():
+    """Test unsupported and duplicate requests are dropped"""
+
+    planner = BatchPlanner()
+    requests = [
+        GetTimeRequest(),
+        GetAiStateRequest(0),
+        GetAiStateRequest(1),
+        GetAiStateRequest(0),
+        GetMotionStateRequest(0),
+        GetMotionStateRequest(1),
+        GetMotionStateRequest(2),
+        GetPresetRequest(0),
+        GetPresetRequest(1),
+        GetTimeRequest(),
+    ]
+    (batch,) = planner.plan(requests, _CAPABILITIES)
+    assert batch == [requests[0], requests[1], requests[4], requests[5]]
+
+
+def test_plan_batch_size():
+    """Test batches are split by the learned limit of the connection"""
+
+    planner = BatchPlanner()
+    client = Client(batch_limits=BatchLimits({("RLC-811A", "v3.1.0"): 2}, default=3))
+    requests = [GetMotionStateRequest(_i % 2) for _i in range(2)] + [
+        GetAiStateRequest(0),
+        GetTimeRequest(),
+    ]
+    assert [len(_b) for _b in planner.plan(requests, _CAPABILITIES, client)] == [3, 1]
+    client.batch_key = ("RLC-811A", "v3.1.0")
+    assert [len(_b) for _b in planner.plan(requests, _CAPABILITIES, client)] == [
+        2,
+        2,
+    ]
+    assert len(planner.plan(requests * 10)) == 1
+
+
+def test_plan_templates():
+    """Test factory templates are filtered like the requests they are made from"""
+
+    planner = BatchPlanner()
+    client = Client()
+    requests = [
+        client._create_get_ai_state_request(0),
+        client._create_get_ai_state_request(1),
+        client._create_get_md_state(1),
+        client._create_get_md_state(2),
+        client._create_get_white_led_request(0),
+        GetMotionStateRequest(1),
+    ]
+    assert isinstance(requests[2], alarm.GetMotionStateRequest)
+    (batch,) = planner.plan(requests, _CAPABILITIES)
+    assert batch == [requests[0], requests[2]]
@@ -0,0 +1,295 @@
+"""PTZ Mixin Test"""
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from async_reolink.api.commands import CommandRequest
+from async_reolink.api.ptz.typings import Operation
+from async_reolink.rest.commands import CommandResponse
+from async_reolink.rest.fleet import FleetExecutor
+from async_reolink.rest.ptz import PTZ
+from async_reolink.rest.ptz.models import (
+    MutablePatrol,
+    MutablePatrolPreset,
+    MutablePreset,
+    MutableTrack,
+)
+from async_reolink.rest.ptz.sync import PTZSpec, PTZSync
+from async_reolink.rest.ptz.tracker import (
+    MoveEstimator,
+    run_tours,
+    tour_duration,
+)
+from .models import MockConnection_SingleExecute
+
+
+class TestRig(MockConnection_SingleExecute, PTZ):
+    """Test Rig"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.delay = 0.01
+        self.controls: list[tuple] = []
+        self.zoom_time = 0.05
+        self.pan_only = False
+        self.presets: list[int] = []
+        self.__moved = 0.0
+        self.__zoom = (0, 0)
+
+    def _zoom(self):
+        start, end = self.__zoom
+        progress = min((monotonic() - self.__moved) / self.zoom_time, 1)
+        return int(start + (end - start) * progress)
+
+    async def _mocked_execute(self, request: CommandRequest):
+        if request.command == "PtzCtrl":
+            self.controls.append((request.operation, request.speed))
+            if request.operation == Operation.TO_PRESET:
+                self.presets.append(request.preset_id)
+                zoom = self._zoom()
+                self.__zoom = (zoom, zoom if self.pan_only else request.preset_id * 10)
+                self.__moved = monotonic()
+            else:
+                await asyncio.sleep(self.delay)
+            value = {"rspCode": 200}
+        else:
+            value = {"ZoomFocus": {"channel": 0, "zoom": {"pos": self._zoom()}}}
+        return CommandResponse.create_from(
+            {"cmd": request.command, "code": 0, "value": value}
+        )
+
+
+class SyncRig(MockConnection_SingleExecute, PTZ):
+    """Sync Test Rig"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batches: list[list[str]] = []
+        self.written: list[dict] = []
+        self.presets = [
+            {"channel": 0, "id": 0, "enable": 1, "name": "gate"},
+            {"channel": 0, "id": 1, "enable": 1, "name": "door"},
+            {"channel": 0, "id": 2, "enable": 0, "name": "pos3"},
+        ]
+        self.patrols = [
+            {
+                "channel": 0,
+                "id": 0,
+                "enable": 1,
+                "name": "round",
+                "preset": [{"id": 0, "dwellTime": 10, "speed": 20}],
+            }
+        ]
+        self.tracks = [{"id": 1, "enable": 0, "name": "track1"}]
+
+    def _execute(self, *args: CommandRequest):
+        self.batches.append([_r.command for _r in args])
+        return super()._execute(*args)
+
+    async def _mocked_execute(self, request: CommandRequest):
+        value = {"rspCode": 200}
+        if request.command == "GetPtzPreset":
+            value = {"PtzPreset": self.presets}
+        elif request.command == "GetPtzPatrol":
+            value = {"PtzPatrol": self.patrols}
+        elif request.command == "GetPtzTattern":
+            value = {"PtzTattern": {"channel": 0, "track": self.tracks}}
+        else:
+            self.written.append(request._get_request()["param"])
+        return CommandResponse.create_from(
+            {"cmd": request.command, "code": 0, "value": value}
+        )
+
+
+def _spec():
+    gate, door = MutablePreset(), MutablePreset()
+    gate.id, gate.enabled, gate.name = 0, True, "gate"
+    door.id, door.enabled, door.name = 1, True, "front door"
+    unused = MutablePreset()
+    unused.id = 2
+    patrol = MutablePatrol()
+    patrol.id, patrol.enabled, patrol.name = 0, True, "round"
+    patrol.presets.append(MutablePatrolPreset({"id": 0, "dwellTime": 15, "speed": 20}))
+    track = MutableTrack()
+    track.id, track.enabled, track.name = 1, False, "track1"
+    return PTZSpec([gate, door, unused], [patrol], [track])
+
+
+async def _until_sent(rig: TestRig, count: int):
+    while len(rig.controls) < count:
+        await asyncio.sleep(0)
+
+
+def test_control_request():
+    """Test control request parameters"""
+
+    request = PTZ._create_set_ptz_control_request(None, 1, Operation.LEFT, 10, None)
+    assert request._get_request()["param"] == {"channel": 1, "op": "Left", "speed": 10}
+    request = PTZ._create_set_ptz_control_request(None, 0, Operation.STOP, None, None)
+    assert request._get_request()["param"] == {"channel": 0, "op": "Stop"}
+
+
+async def test_control_session():
+    """Test moves are coalesced and stops are sent ahead of them"""
+
+    rig = TestRig()
+    async with rig.ptz_control_session(1) as joystick:
+        joystick.move(Operation.LEFT, 10)
+        await _until_sent(rig, 1)
+        for speed in range(20, 60, 10):
+            joystick.move(Operation.RIGHT, speed)
+        await asyncio.sleep(0.05)
+        assert rig.controls == [(Operation.LEFT, 10), (Operation.RIGHT, 50)]
+        assert joystick.coalesced == 3
+
+        # repeating the current move is not resent
+        joystick.move(Operation.RIGHT, 50)
+        await asyncio.sleep(0.02)
+        assert len(rig.controls) == 2
+
+        # stop overtakes the move in flight and is repeated after it
+        rig.controls.clear()
+        joystick.move(Operation.UP, 5)
+        await _until_sent(rig, 1)
+        joystick.move(Operation.LEFT_DOWN, 5)
+        await joystick.stop()
+        await asyncio.sleep(0.05)
+        assert rig.controls == [
+            (Operation.UP, 5),
+            (Operation.STOP, None),
+            (Operation.STOP, None),
+        ]
+        assert joystick.moving is None
+
+        joystick.move(Operation.LEFT, 1)
+        await asyncio.sleep(0.02)
+    # closing stops the camera
+    assert rig.controls[-1] == (Operation.STOP, None)
+
+
+def test_move_estimator():
+    """Test durations are averaged per model, speed and route"""
+
+    estimator = MoveEstimator(0.5, 4)
+    assert estimator.estimate("RLC-823A", 10, (1, 2)) == 4
+    estimator.observe("RLC-823A", 10, 2, (1, 2))
+    estimator.observe("RLC-823A", 10, 6, (2, 3))
+    assert estimator.estimate("RLC-823A", 10, (2, 1)) == 2
+    assert estimator.estimate("RLC-823A", 10, (3, 2)) == 6
+    assert estimator.estimate("RLC-823A", 10, (1, 3)) == 4
+    assert estimator.estimate("RLC-823A", 20) == 4
+
+
+async def test_tracker():
+    """Test preset moves are timed and tours run concurrently"""
+
+    rig = TestRig()
+    rig.ptz_move_estimator = MoveEstimator(default=0.01)
+    tracker = rig.ptz_tracker(0)
+    assert rig.ptz_tracker(0) is tracker
+    tracker.poll_interval = 0.005
+    await tracker.refresh()
+
+    assert await tracker.to_preset(2) == 0.01
+    assert tracker.moving and tracker.preset_id is None
+    duration = await tracker.wait()
+    assert tracker.preset_id == 2 and tracker.zoom == 20
+    # arrival is only seen once zoom stops changing
+    assert 0.05 <= duration < 0.2
+    assert rig.ptz_move_estimator.estimate("", None) == duration
+
+    # learned routes drive tour estimates
+    await tracker.to_preset(4)
+    tracker.arrived()
+    estimate = tour_duration(tracker, [2, 4], 0.01)
+    assert estimate == pytest.approx(
+        rig.ptz_move_estimator.estimate("", None, (2, 4)) * 2 + 0.02
+    )
+
+    rig.presets.clear()
+    other_rig = TestRig()
+    # estimates are shared between devices of a model
+    other_rig.ptz_move_estimator = rig.ptz_move_estimator
+    other = other_rig.ptz_tracker(0)
+    await run_tours({tracker: [4, 1], other: [3]}, 0, settle=False)
+    assert rig.presets == [1] and tracker.preset_id == 1
+    assert other.preset_id == 3
+
+
+async def test_tracker_faster():
+    """Test estimates that are too large come down"""
+
+    rig = TestRig()
+    rig.zoom_time = 0.02
+    rig.ptz_move_estimator = MoveEstimator(default=0.2)
+    tracker = rig.ptz_tracker(0)
+    tracker.poll_interval = 0.005
+    await tracker.refresh()
+
+    estimates = [0.2]
+    for preset_id in range(1, 9):
+        await tracker.to_preset(preset_id)
+        await tracker.wait()
+        estimates.append(rig.ptz_move_estimator.estimate("", None))
+    assert all(_b < _a for _a, _b in zip(estimates, estimates[1:]))
+    assert estimates[-1] < 0.1
+
+    # moves finishing before polling starts and pan/tilt only moves are
+    # learned from the reading taken right after the move started
+    rig.pan_only = True
+    rig.ptz_move_estimator.clear()
+    estimates = []
+    for preset_id in range(1, 5):
+        await tracker.to_preset(preset_id)
+        assert await tracker.wait() < 0.05
+        estimates.append(rig.ptz_move_estimator.estimate("", None))
+    assert max(estimates) < 0.05
+
+
+async def test_sync():
+    """Test only changed entries are written, in one batch"""
+
+    spec = _spec()
+    rig = SyncRig()
+    plan = await PTZSync(spec).plan(rig)
+    assert rig.batches == [["GetPtzPreset", "GetPtzPatrol", "GetPtzTattern"]]
+    assert [_p.id for _p in plan.presets] == [1]
+    assert [_p.id for _p in plan.patrols] == [0]
+    assert len(plan) == 2 and not plan.tracks
+
+    await rig.sync_ptz(spec)
+    assert rig.batches[-1] == ["SetPtzPreset", "SetPtzPatrol"]
+    assert rig.written[0] == {
+        "PtzPreset": {"channel": 0, "id": 1, "enable": 1, "name": "front door"}
+    }
+
+    assert rig.written[1]["PtzPatrol"]["preset"] == [
+        {"id": 0, "dwellTime": 15, "speed": 20}
+    ]
+
+    rig.presets[1]["name"] = "front door"
+    rig.patrols[0]["preset"][0]["dwellTime"] = 15
+    assert not await PTZSync(spec).plan(rig)
+
+    rigs = [SyncRig(), SyncRig()]
+    run = PTZSync(spec).fleet(rigs, FleetExecutor(1))
+    assert len([_r async for _r in run]) == 4 and not run.failures
+    for _rig in rigs:
+        assert _rig.batches[-1] == ["SetPtzPreset", "SetPtzPatrol"]
+
+
+def test_preset_index():
+    """Test presets are indexed once with an enabled view"""
+
+    response = CommandResponse.create_from(
+        {"cmd": "GetPtzPreset", "code": 0, "value": {"PtzPreset": SyncRig().presets}}
+    )
+    presets = response.presets
+    assert response.presets is presets and response.channel_id == 0
+    assert presets[1] is presets[1] and presets[1].name == "door"
+    assert list(response.enabled_presets) == [0, 1]
+    assert response.enabled_presets[1] is presets[1]
+    assert 2 in presets and 2 not in response.enabled_presets
+    assert not response.enabled_presets[2].enabled
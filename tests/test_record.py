@@ -0,0 +1,99 @@
+"""Record Mixin Test"""
+
+import asyncio
+from urllib.parse import quote
+
+from async_reolink.api.commands import CommandRequest
+from async_reolink.rest.record import Record
+from async_reolink.rest.record.cache import SnapshotCache
+from async_reolink.rest.record.seed import CounterSeed, Seed
+from .models import MockConnection_SingleExecute
+
+_JPEG = b"\xff\xd8\xff\xe0mock\xff\xd9"
+
+
+class TestRig(MockConnection_SingleExecute, Record):
+    """Test Rig"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.snaps = 0
+        self.data = _JPEG
+
+    async def _mocked_execute(self, request: CommandRequest):
+        self.snaps += 1
+        await asyncio.sleep(0.01)
+        return self.data
+
+
+async def test_snapshot_uncached():
+    """Test get_snap always requests without a cache"""
+
+    rig = TestRig()
+    assert await rig.get_snap() == _JPEG
+    assert await rig.get_snap() == _JPEG
+    assert rig.snaps == 2
+
+
+async def test_snapshot_collapsing():
+    """Test concurrent get_snap calls share one request"""
+
+    rig = TestRig()
+    rig.snapshot_cache = SnapshotCache(max_age=60)
+    snaps = await asyncio.gather(*(rig.get_snap() for _ in range(5)))
+    assert all(snap == _JPEG for snap in snaps)
+    assert await rig.get_snap() == _JPEG
+    assert rig.snaps == 1
+
+    await rig.get_snap(1)
+    assert rig.snaps == 2
+
+    assert await rig.get_snap(max_age=0) == _JPEG
+    assert rig.snaps == 3
+
+
+async def test_snapshot_eviction():
+    """Test snapshot cache is bounded by size"""
+
+    cache = SnapshotCache(max_age=60, max_size=len(_JPEG) * 2)
+    rig = TestRig()
+    rig.snapshot_cache = cache
+    for channel in range(3):
+        await rig.get_snap(channel)
+    assert len(cache) == 2
+    assert cache.size == len(_JPEG) * 2
+    assert (rig.connection_id, 0) not in cache
+    assert (rig.connection_id, 2) in cache
+
+
+async def test_snapshot_not_cached():
+    """Test empty snapshots and disconnected clients bypass the cache"""
+
+    cache = SnapshotCache(max_age=60)
+    rig = TestRig()
+    rig.snapshot_cache = cache
+    rig.data = b""
+    assert await rig.get_snap() == b""
+    assert not cache
+
+    rig.data = _JPEG
+    rig._mocked["is_connected"] = False
+    assert await rig.get_snap() == _JPEG
+    assert not cache and rig.snaps == 2
+
+    rig._mocked["is_connected"] = True
+    assert await rig.get_snap() == _JPEG
+    assert len(cache) == 1 and rig.snaps == 3
+
+
+def test_seed():
+    """Test seeds are url safe and unique"""
+
+    seed = Seed()
+    values = {str(seed) for _ in range(100)}
+    assert len(values) == 100
+    assert all(len(value) == 16 and quote(value) == value for value in values)
+    assert 8 <= len(Seed(8, 12).value) <= 12
+
+    counter = CounterSeed(0)
+    assert [str(counter) for _ in range(3)] == ["0", "1", "2"]
@@ -11,8 +11,10 @@ from pytest import mark
 
 
 from async_reolink.api.commands import CommandRequest
+from async_reolink.api.system.capabilities import CloudStorage, Permissions
 from async_reolink.rest.commands import CommandResponse
 from async_reolink.rest.system import System
+from async_reolink.rest.system.capabilities import _INT_CLOUDSTORAGE, Capability
 from .models import MockConnection_SingleExecute
 
 _JSON: Final = MappingProxyType(
@@ -46,3 +48,18 @@ async def test_get_ability():
     assert len(ability.channels) > 0
     assert ability.channels[0].live.value == 1
     assert ability.schedule_version.permissions == 4
+
+
+def test_capability_flags():
+    """Test flag capabilities are decoded by bit"""
+
+    cloud_storage = Capability(lambda: {"ver": 0b1011, "permit": 6}, _INT_CLOUDSTORAGE)
+    assert cloud_storage.value == (
+        CloudStorage.UPLOAD | CloudStorage.CONFIG | CloudStorage.DEPLOY
+    )
+    assert cloud_storage.permissions == Permissions.WRITE | Permissions.READ
+    # unknown bits are ignored
+    assert Capability(lambda: {"ver": 4}, _INT_CLOUDSTORAGE).value is None
+    assert Capability(lambda: {"ver": 12}, _INT_CLOUDSTORAGE).value == (
+        CloudStorage.DEPLOY
+    )
@@ -0,0 +1,57 @@
+"""Callback Dispatch Benchmark"""
+
+import argparse
+import asyncio
+import inspect
+from time import perf_counter
+
+from async_reolink.rest._utilities.callbacks import CallbackList
+
+
+def _sync():
+    pass
+
+
+async def _async():
+    pass
+
+
+async def _inspect_dispatch(callbacks: list):
+    """previous per dispatch reflection"""
+    for callback in callbacks:
+        if inspect.iscoroutinefunction(callback):
+            await callback()
+        else:
+            callback()
+
+
+async def _bench(name: str, dispatch, number: int, baseline: float = None):
+    best = None
+    for _ in range(5):
+        start = perf_counter()
+        for _ in range(number):
+            await dispatch()
+        elapsed = (perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    line = f"{name:<20}{best * 1e6:>10.3f} us/dispatch"
+    if baseline:
+        line += f"{baseline / best:>10.2f}x"
+    print(line)
+    return best
+
+
+async def _async_main(args: argparse.Namespace):
+    plain = [_sync] * args.sync + [_async] * args.async_
+    classified = CallbackList(plain)
+
+    print(f"{args.sync} sync + {args.async_} async callbacks")
+    base = await _bench("inspect", lambda: _inspect_dispatch(plain), args.number)
+    await _bench("CallbackList", classified.invoke, args.number, base)
+
+
+parser = argparse.ArgumentParser(description="Benchmark callback dispatch")
+parser.add_argument("-n", "--number", type=int, default=20000, dest="number")
+parser.add_argument("--sync", type=int, default=4, dest="sync")
+parser.add_argument("--async", type=int, default=2, dest="async_")
+
+asyncio.run(_async_main(parser.parse_args()))
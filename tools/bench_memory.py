@@ -0,0 +1,73 @@
+"""Memory Footprint Benchmark"""
+
+import argparse
+import gc
+import tracemalloc
+
+from async_reolink.api.ptz.typings import Operation
+from async_reolink.rest import Client, build_client
+from async_reolink.rest.commands import ai, alarm, led, ptz, system
+
+
+def _measure(factory, number: int):
+    """bytes allocated per object, objects are kept alive while measured"""
+
+    factory()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(number)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(_s.size_diff for _s in after.compare_to(before, "filename"))
+    # the list holding the objects is not counted
+    size -= objects.__sizeof__()
+    del objects
+    return size / number
+
+
+def _report(name: str, factory, number: int):
+    # api base classes have no __slots__, the size of an instance is driven
+    # by how many attributes it sets
+    obj = factory()
+    attributes = len(getattr(obj, "__dict__", ()))
+    print(f"{name:<32}{_measure(factory, number):>10.0f} B  {attributes:>3} attributes")
+
+
+def _polling_client():
+    client = Client()
+    _ = client.channel_liveness, client.ptz_tracker(0), client.snapshot_seed
+    return client
+
+
+_CLIENTS = {
+    "Client": Client,
+    "Client (liveness, ptz, seed)": _polling_client,
+    "client(alarm, ai)": lambda: build_client("alarm", "ai"),
+    "client(led)": lambda: build_client("led"),
+}
+
+_REQUESTS = {
+    "GetMotionStateRequest": lambda: alarm.GetMotionStateRequest(0),
+    "GetAiStateRequest": lambda: ai.GetAiStateRequest(0),
+    "GetWhiteLedRequest": lambda: led.GetWhiteLedRequest(0),
+    "GetDeviceInfoRequest": system.GetDeviceInfoRequest,
+    "GetTimeRequest": system.GetTimeRequest,
+    "SetControlRequest": lambda: ptz.SetControlRequest(Operation.LEFT, speed=10),
+}
+
+
+def main(args: argparse.Namespace):
+    print("per client")
+    for name, factory in _CLIENTS.items():
+        _report(name, factory, args.clients)
+    print("per request")
+    for name, factory in _REQUESTS.items():
+        _report(name, factory, args.requests)
+
+
+parser = argparse.ArgumentParser(description="Benchmark per object memory")
+parser.add_argument("--clients", type=int, default=1000, dest="clients")
+parser.add_argument("--requests", type=int, default=20000, dest="requests")
+
+main(parser.parse_args())
@@ -0,0 +1,45 @@
+"""Snapshot Seed Benchmark"""
+
+import argparse
+import random
+import string
+from timeit import repeat
+
+from async_reolink.rest.record.seed import CounterSeed, Seed
+
+_rnd = random.SystemRandom()
+
+
+class _LegacySeed:
+    """previous per character SystemRandom implementation"""
+
+    def __init__(self, _min: int = 16, _max: int = 16) -> None:
+        self._min = _min
+        self._max = _max
+
+    def __str__(self) -> str:
+        rng = _rnd.randint(self._min, self._max)
+        return "".join(_rnd.choice(string.printable) for _ in range(rng))
+
+
+def _bench(name: str, stmt, number: int, baseline: float = None):
+    best = min(repeat(stmt, number=number, repeat=5)) / number
+    line = f"{name:<24}{best * 1e6:>10.3f} us/seed"
+    if baseline:
+        line += f"{baseline / best:>10.1f}x"
+    print(line)
+    return best
+
+
+parser = argparse.ArgumentParser(description="Benchmark snapshot seed generation")
+parser.add_argument("-n", "--number", type=int, default=20000, dest="number")
+pargs = parser.parse_args()
+
+legacy = _LegacySeed()
+seed = Seed()
+counter = CounterSeed()
+
+base = _bench("legacy (per new Seed)", lambda: str(_LegacySeed()), pargs.number)
+_bench("legacy (reused)", lambda: str(legacy), pargs.number, base)
+_bench("Seed", lambda: str(seed), pargs.number, base)
+_bench("CounterSeed", lambda: str(counter), pargs.number, base)
@@ -0,0 +1,228 @@
+"""REST Client Benchmark against mock cameras"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from statistics import fmean, quantiles
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from async_reolink.rest import Client, __version__
+
+from mock_server import MockFleet, add_arguments, create_camera
+
+_SCENARIOS: dict[str, Callable[["_Context"], Awaitable[dict]]] = {}
+
+
+def _scenario(name: str):
+    def _register(func):
+        _SCENARIOS[name] = func
+        return func
+
+    return _register
+
+
+class _Context:
+    def __init__(self, args: argparse.Namespace, fleet: MockFleet) -> None:
+        self.args = args
+        self.fleet = fleet
+
+    async def client(self, index: int = 0):
+        """connected and logged in client for camera index"""
+
+        client = Client()
+        await client.connect(self.fleet.host, self.fleet.ports[index])
+        await client.login("admin", "password")
+        return client
+
+
+async def _measure(
+    operation: Callable[[], Awaitable], count: int, concurrency: int
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = count
+
+    async def _worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = perf_counter()
+            try:
+                await operation()
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+                continue
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(max(concurrency, 1))))
+    elapsed = perf_counter() - start
+    result = {
+        "count": count,
+        "errors": errors,
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+    }
+    if latencies:
+        cuts = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        result["latency"] = {
+            "mean": fmean(latencies),
+            "p50": cuts[49],
+            "p95": cuts[94],
+            "p99": cuts[98],
+            "max": max(latencies),
+        }
+    return result
+
+
+def _poll_commands(client: Client):
+    return [
+        client._create_get_md_state(0),
+        client._create_get_ai_state_request(0),
+        client._create_get_ptz_zoom_focus_request(0),
+        client._create_get_time_request(),
+        client._create_get_device_info_request(),
+    ]
+
+
+async def _drain(responses):
+    async for _ in responses:
+        pass
+
+
+@_scenario("single")
+async def _single(context: _Context):
+    client = await context.client()
+    try:
+        return await _measure(
+            lambda: client.get_md_state(0),
+            context.args.count,
+            context.args.concurrency,
+        )
+    finally:
+        await client.disconnect()
+
+
+@_scenario("batch")
+async def _batch(context: _Context):
+    client = await context.client()
+    try:
+        return await _measure(
+            lambda: _drain(client.batch(_poll_commands(client))),
+            context.args.count,
+            context.args.concurrency,
+        )
+    finally:
+        await client.disconnect()
+
+
+@_scenario("snapshot")
+async def _snapshot(context: _Context):
+    client = await context.client()
+    try:
+        return await _measure(
+            lambda: client.get_snap(0),
+            context.args.count,
+            context.args.concurrency,
+        )
+    finally:
+        await client.disconnect()
+
+
+@_scenario("login")
+async def _login(context: _Context):
+    client = await context.client()
+
+    async def _churn():
+        await client.logout()
+        await client.login("admin", "password")
+
+    try:
+        return await _measure(_churn, context.args.count, 1)
+    finally:
+        await client.disconnect()
+
+
+@_scenario("fleet")
+async def _fleet(context: _Context):
+    clients = await asyncio.gather(
+        *(context.client(_i) for _i in range(len(context.fleet.ports)))
+    )
+
+    async def _poll():
+        await asyncio.gather(*(_drain(_c.batch(_poll_commands(_c))) for _c in clients))
+
+    try:
+        result = await _measure(_poll, max(context.args.count // len(clients), 1), 1)
+        result["devices"] = len(clients)
+        return result
+    finally:
+        await asyncio.gather(*(_c.disconnect() for _c in clients))
+
+
+async def _async_main(args: argparse.Namespace):
+    cameras = [create_camera(args) for _ in range(max(args.fleet_size, 1))]
+    results = {}
+    if not args.scenarios:
+        args.scenarios = list(_SCENARIOS)
+    async with MockFleet(cameras) as fleet:
+        context = _Context(args, fleet)
+        for name in args.scenarios:
+            results[name] = await _SCENARIOS[name](context)
+            print(
+                f"{name:<10}{results[name]['throughput']:>12.1f} ops/s",
+                file=sys.stderr,
+            )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {
+                _k: (
+                    str(_v)
+                    if not isinstance(_v, (int, float, list, type(None)))
+                    else _v
+                )
+                for _k, _v in vars(args).items()
+                if _k not in ("output", "payloads")
+            },
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+parser = argparse.ArgumentParser(description="Benchmark the REST client")
+parser.add_argument(
+    "scenarios",
+    nargs="*",
+    metavar="scenario",
+    help=f"Scenarios to run: {', '.join(_SCENARIOS)} (default all)",
+)
+parser.add_argument("-n", "--count", type=int, default=500, help="Operations")
+parser.add_argument("-c", "--concurrency", type=int, default=1, help="Workers")
+parser.add_argument(
+    "--fleet-size", type=int, default=20, help="Mock cameras for fleet scenario"
+)
+parser.add_argument("-o", "--output", help="Write json results to file")
+add_arguments(parser)
+
+if __name__ == "__main__":
+    pargs = parser.parse_args()
+    if unknown := set(pargs.scenarios).difference(_SCENARIOS):
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+    asyncio.run(_async_main(pargs))
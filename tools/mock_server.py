@@ -0,0 +1,205 @@
+"""Mock ReoLink CGI Server"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DEFAULT_FIXTURE = FIXTURES / "int9.json"
+
+_JPEG_HEADER = b"\xff\xd8\xff\xe0"
+_JPEG_FOOTER = b"\xff\xd9"
+
+
+def load_payloads(*paths: Path) -> dict[str, dict]:
+    """load recorded command responses keyed by command"""
+
+    payloads = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for response in json.load(file):
+                payloads[response["cmd"]] = response
+    return payloads
+
+
+class MockCamera:
+    """Fake /cgi-bin/api.cgi replaying recorded payloads"""
+
+    def __init__(
+        self,
+        payloads: Mapping[str, dict] | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        http_error_rate: float = 0.0,
+        snapshot_size: int = 64 * 1024,
+        lease_time: int = 3600,
+        seed: int | None = None,
+    ) -> None:
+        if payloads is None:
+            payloads = load_payloads(DEFAULT_FIXTURE)
+        self.payloads = payloads
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.http_error_rate = http_error_rate
+        self.lease_time = lease_time
+        self.snapshot = (
+            _JPEG_HEADER
+            + bytes(max(snapshot_size - len(_JPEG_HEADER) - len(_JPEG_FOOTER), 0))
+            + _JPEG_FOOTER
+        )
+        self.requests = 0
+        self.commands = 0
+        self._random = random.Random(seed)
+        self._tokens = 0
+        self.app = web.Application()
+        self.app.router.add_route("*", "/cgi-bin/api.cgi", self._handle)
+
+    async def _delay(self):
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _error(self, command: str):
+        return {
+            "cmd": command,
+            "code": 1,
+            "error": {"detail": "mock error", "rspCode": -1},
+        }
+
+    def _respond(self, request: dict):
+        command = request.get("cmd", "")
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._error(command)
+        if command == "Login":
+            self._tokens += 1
+            return {
+                "cmd": command,
+                "code": 0,
+                "value": {
+                    "Token": {
+                        "leaseTime": self.lease_time,
+                        "name": f"{self._tokens:032x}",
+                    }
+                },
+            }
+        if (response := self.payloads.get(command, None)) is None:
+            return {"cmd": command, "code": 0, "value": {"rspCode": 200}}
+        channel = (request.get("param", None) or {}).get("channel", None)
+        value = response.get("value", None)
+        if channel is not None and isinstance(value, dict) and "channel" in value:
+            response = {**response, "value": {**value, "channel": channel}}
+        return response
+
+    async def _handle(self, request: web.Request):
+        self.requests += 1
+        await self._delay()
+        if self.http_error_rate and self._random.random() < self.http_error_rate:
+            raise web.HTTPInternalServerError()
+
+        if request.method == "GET":
+            if request.query.get("cmd", None) != "Snap":
+                raise web.HTTPBadRequest()
+            self.commands += 1
+            return web.Response(body=self.snapshot, content_type="image/jpeg")
+
+        body = await request.json()
+        if not isinstance(body, list):
+            body = [body]
+        self.commands += len(body)
+        return web.json_response([self._respond(_r) for _r in body])
+
+
+class MockFleet:
+    """Several mock cameras served on local ports"""
+
+    def __init__(self, cameras: Iterable[MockCamera], host: str = "127.0.0.1"):
+        self.cameras = list(cameras)
+        self.host = host
+        self.ports: list[int] = []
+        self._runners: list[web.AppRunner] = []
+
+    async def start(self):
+        """start serving every camera"""
+
+        for camera in self.cameras:
+            runner = web.AppRunner(camera.app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, self.host, 0)
+            await site.start()
+            self._runners.append(runner)
+            # pylint: disable=protected-access
+            self.ports.append(site._server.sockets[0].getsockname()[1])
+        return self
+
+    async def stop(self):
+        """stop serving"""
+
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners.clear()
+        self.ports.clear()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *_):
+        await self.stop()
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """add mock camera options to parser"""
+
+    parser.add_argument(
+        "--payloads",
+        type=Path,
+        action="append",
+        help="Recorded responses (json list), defaults to fixtures/int9.json",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Seconds")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Command error ratio"
+    )
+    parser.add_argument(
+        "--http-error-rate", type=float, default=0.0, help="HTTP 500 ratio"
+    )
+    parser.add_argument(
+        "--snapshot-size", type=int, default=64 * 1024, help="Snapshot bytes"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+
+
+def create_camera(args: argparse.Namespace):
+    """create a mock camera from parsed options"""
+
+    return MockCamera(
+        load_payloads(*args.payloads) if args.payloads else None,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        http_error_rate=args.http_error_rate,
+        snapshot_size=args.snapshot_size,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    _parser = argparse.ArgumentParser(description="Serve a mock ReoLink camera")
+    _parser.add_argument("--host", default="127.0.0.1")
+    _parser.add_argument("-p", "--port", type=int, default=8080, dest="port")
+    add_arguments(_parser)
+    _args = _parser.parse_args()
+
+    web.run_app(create_camera(_args).app, host=_args.host, port=_args.port)